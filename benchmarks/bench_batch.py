@@ -0,0 +1,38 @@
+"""Throughput of the vectorized working-day batch functions.
+
+Usage: python benchmarks/bench_batch.py [rows]   (default 10,000,000)
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from workdays import UK_CALENDAR, add_working_days_batch, working_days_between_batch
+
+
+def _timed(label, rows, fn, *args):
+    t0 = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - t0
+    print(f"{label:<40} {elapsed:8.3f} s  {rows / elapsed / 1e6:8.2f} M rows/s")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    rng = np.random.default_rng(0)
+    starts = np.datetime64("1990-01-01") + rng.integers(0, 40_000, rows).astype("timedelta64[D]")
+    ends = starts + rng.integers(-5_000, 5_000, rows).astype("timedelta64[D]")
+    offsets = rng.integers(-5_000, 5_000, rows)
+
+    print(f"{rows:,} rows")
+    _timed("add_working_days_batch (Mon-Fri)", rows, add_working_days_batch, starts, offsets)
+    _timed("add_working_days_batch (UK holidays)", rows, add_working_days_batch, starts, offsets, UK_CALENDAR)
+    _timed("working_days_between_batch (Mon-Fri)", rows, working_days_between_batch, starts, ends)
+    _timed("working_days_between_batch (UK holidays)", rows, working_days_between_batch, starts, ends, UK_CALENDAR)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Scaling of workdays_cli's sharded --workers mode from 1 to N processes.
+
+Generates a CSV of (start, days) and (a, b) rows, times the single-process
+streaming mode and then --workers 2..N, and checks every run's output is
+byte-identical to the streaming one.
+
+Usage: python benchmarks/bench_cli_scaling.py [rows] [max_workers]
+       (defaults: 2,000,000 rows, os.cpu_count() workers)
+"""
+import hashlib
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI = os.path.join(ROOT, "workdays_cli.py")
+CHUNK_MIB = 4
+
+
+def _write_input(path, rows, seed=0):
+    rng = random.Random(seed)
+
+    def d():
+        return f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(1990, 2060)}"
+
+    with open(path, "w") as f:
+        f.write("start,days\n")
+        for i in range(rows):
+            f.write(f"{d()},{rng.randint(-500, 500)}\n" if i % 2 else f"{d()},{d()}\n")
+
+
+def _timed_run(path, workers):
+    args = [sys.executable, CLI, "--bank-holidays", path]
+    if workers > 1:
+        args[2:2] = ["--workers", str(workers), "--chunk-size", str(CHUNK_MIB)]
+    t0 = time.perf_counter()
+    out = subprocess.run(args, capture_output=True, check=True).stdout
+    return time.perf_counter() - t0, hashlib.sha256(out).hexdigest()
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "rows.csv")
+        _write_input(path, rows)
+        print(f"{rows:,} rows, {os.path.getsize(path) / 1e6:.0f} MB, {os.cpu_count()} CPUs")
+        base, digest = _timed_run(path, 1)
+        print(f"workers  1 (streaming) {base:7.2f} s  {rows / base / 1e6:6.2f} M rows/s  speedup 1.00")
+        ok = True
+        for workers in range(2, max_workers + 1):
+            elapsed, d = _timed_run(path, workers)
+            same = d == digest
+            ok &= same
+            print(f"workers {workers:2d}             {elapsed:7.2f} s  {rows / elapsed / 1e6:6.2f} M rows/s"
+                  f"  speedup {base / elapsed:4.2f}{'' if same else '  OUTPUT DIFFERS'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Free-slot search across many calendars (1,000 people x a year of meetings).
+
+Generates a synthetic organisation: every person has MEETINGS_PER_DAY
+half-hour-aligned meetings (30-90 min) between 09:00 and 17:00 on each working
+day of a year, except that on roughly one working day a week a random hour is
+kept meeting-free for everyone, so common slots are rare but exist. Reports:
+
+  build    BusySchedule per person (sort + merge), and one BusyUnion
+  first    what the Find Free Slot dialog costs the first time a set of
+           calendars is searched: schedules + union + one query
+  lazy     find_free_slots over the schedules (heap sweep from the start date)
+  union    find_free_slots over the prebuilt BusyUnion (bisect + walk), as the
+           dialog's repeat searches over the same calendars
+  no slot  a 4-hour request nobody can meet: the lazy sweep has to cover the
+           whole year, the worst case
+
+Exits non-zero if the first search takes longer than FIRST_BUDGET_MS, or a
+repeat (union) query is slower than QUERY_BUDGET_MS (median).
+
+Usage: python benchmarks/bench_free_slots.py [people]   (default 1000)
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from free_slots import BusySchedule, BusyUnion, find_free_slots
+from workdays import UK_CALENDAR
+
+FIRST_DAY = date(2025, 1, 1)
+DAYS = 365
+MEETINGS_PER_DAY = 3
+PROTECTED_DAY_RATE = 0.2   # share of working days with an org-wide free hour
+QUERIES = 50
+SLOTS = 5
+QUERY_BUDGET_MS = 5.0
+FIRST_BUDGET_MS = 2500.0
+
+
+def _workdays():
+    d = FIRST_DAY
+    for _ in range(DAYS):
+        if UK_CALENDAR.is_working_day(d):
+            yield d
+        d += timedelta(days=1)
+
+
+def make_schedules(people, rng):
+    # Protected hour per day, as a half-hour index 0..14 (09:00..16:00 start)
+    protected = {d: rng.randrange(15) for d in _workdays() if rng.random() < PROTECTED_DAY_RATE}
+    per_person = [[] for _ in range(people)]
+    for d in _workdays():
+        nine = datetime.combine(d, datetime.min.time()) + timedelta(hours=9)
+        keep = protected.get(d)
+        for intervals in per_person:
+            for _ in range(MEETINGS_PER_DAY):
+                slot, length = rng.randrange(16), rng.choice((1, 2, 3))
+                length = min(length, 16 - slot)
+                if keep is not None and slot < keep + 2 and keep < slot + length:
+                    continue  # would overlap the protected hour
+                start = nine + timedelta(minutes=30 * slot)
+                intervals.append((start, start + timedelta(minutes=30 * length)))
+    return per_person
+
+
+def _time_queries(busy, starts, duration, count, horizon_days=60):
+    times = []
+    for start in starts:
+        t0 = time.perf_counter()
+        found = find_free_slots(busy, start, duration, count, business_calendar=UK_CALENDAR,
+                                horizon_days=horizon_days)
+        times.append((time.perf_counter() - t0) * 1000)
+    return times, found
+
+
+def main():
+    people = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rng = random.Random(2025)
+    raw = make_schedules(people, rng)
+    n = sum(map(len, raw))
+    print(f"{people} people, {n} meetings over {DAYS} days")
+
+    starts = [datetime.combine(FIRST_DAY + timedelta(days=rng.randrange(DAYS - 60)), datetime.min.time())
+              + timedelta(hours=9) for _ in range(QUERIES)]
+    hour = timedelta(hours=1)
+
+    t0 = time.perf_counter()
+    schedules = [BusySchedule(intervals) for intervals in raw]
+    t1 = time.perf_counter()
+    union = BusyUnion(schedules)
+    t2 = time.perf_counter()
+    find_free_slots(union, starts[0], hour, SLOTS, business_calendar=UK_CALENDAR, horizon_days=60)
+    first = (time.perf_counter() - t0) * 1000
+    print(f"build    schedules {(t1 - t0) * 1000:8.1f} ms   union {(t2 - t1) * 1000:8.1f} ms "
+          f"({len(union.intervals)} merged blocks)")
+    print(f"first    load + union + query {first:8.1f} ms")
+    lazy, found = _time_queries(schedules, starts, hour, SLOTS)
+    quick, found_u = _time_queries(union, starts, hour, SLOTS)
+    assert found == found_u
+    for label, times in (("lazy", lazy), ("union", quick)):
+        print(f"{label:<8} first {SLOTS} one-hour slots: median {statistics.median(times):7.2f} ms  "
+              f"max {max(times):7.2f} ms  ({QUERIES} queries)")
+    print("         e.g. " + ", ".join(f"{s:%d/%m %H:%M}-{e:%H:%M}" for s, e in found))
+
+    # Past the generated year everyone is free, so stop the horizon at its end
+    year_start = [datetime.combine(FIRST_DAY, datetime.min.time())]
+    long = timedelta(hours=4)
+    (full,), none = _time_queries(schedules, year_start, long, 1, DAYS - 1)
+    (full_u,), _ = _time_queries(union, year_start, long, 1, DAYS - 1)
+    print(f"no slot  4-hour search over the year: lazy {full:8.1f} ms   union {full_u:7.2f} ms "
+          f"(found {len(none)})")
+
+    median = statistics.median(quick)
+    print(f"first search {first:.0f} ms (budget {FIRST_BUDGET_MS:.0f} ms), "
+          f"repeat query median {median:.2f} ms (budget {QUERY_BUDGET_MS} ms)")
+    return 0 if first <= FIRST_BUDGET_MS and median <= QUERY_BUDGET_MS else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
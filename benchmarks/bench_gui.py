@@ -0,0 +1,141 @@
+"""Scripted GUI frame-time benchmark, headless under Xvfb.
+
+Drives a real UKCalendarApp through four scenarios and times each step from
+the user action to the end of the repaint it triggers (update_idletasks; the
+repaint rate cap is lifted so the wait for the next 60 Hz slot isn't counted):
+
+  navigate  next/previous month
+  hover     <Enter>/<Leave> swept across every day cell
+  range     <Button-1> clicks on pairs of cells (start, then end of a range)
+  3-month   paging a 3-month window forwards and back
+  3m hover  <Enter>/<Leave> swept across the 3-month window's cells
+
+Profiling is switched on for the run, so per-function timings and Tk call
+counts are printed (and written with --profile FILE). Exits non-zero if any
+scenario's p95 frame exceeds FRAME_BUDGET_MS.
+
+If $DISPLAY is unset, an Xvfb server is started for the run (Xvfb must be
+installed; under CI, `xvfb-run python benchmarks/bench_gui.py` also works).
+
+Usage: python benchmarks/bench_gui.py [--steps N] [--profile FILE]   (default 200)
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FRAME_BUDGET_MS = 16.0
+UNTHROTTLED_HZ = 1e9
+XVFB_DISPLAY = ":99"
+
+
+def _start_xvfb():
+    if os.environ.get("DISPLAY"):
+        return None
+    if shutil.which("Xvfb") is None:
+        sys.exit("no $DISPLAY and Xvfb is not installed; install it or run under xvfb-run")
+    proc = subprocess.Popen(["Xvfb", XVFB_DISPLAY, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ["DISPLAY"] = XVFB_DISPLAY
+    time.sleep(0.5)  # let the server accept connections
+    return proc
+
+
+def _frames(root, actions):
+    samples = []
+    for action in actions:
+        t0 = time.perf_counter()
+        action()
+        root.update_idletasks()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return samples
+
+
+def _summary(name, samples):
+    samples = sorted(samples)
+    n = len(samples)
+    p95 = samples[min(n - 1, int(n * 0.95))]
+    print(f"{name:<9} {n:5d} frames  mean {sum(samples) / n:6.2f} ms  p50 {samples[n // 2]:6.2f} ms  "
+          f"p95 {p95:6.2f} ms  max {samples[-1]:6.2f} ms")
+    return p95
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=200, help="actions per scenario (default 200)")
+    parser.add_argument("--profile", metavar="FILE", help="write per-function histograms as JSON")
+    args = parser.parse_args(argv)
+
+    xvfb = _start_xvfb()
+    try:
+        import tkinter as tk
+
+        import profiling
+        from calendar_gui import ThreeMonthWindow, UKCalendarApp
+        from events import EventStore
+
+        root = tk.Tk()
+        root.geometry("440x460")
+        app = UKCalendarApp(root)
+        # Keep the user's database out of the run
+        app.event_store = EventStore(path=None, calendar=app.model.business_calendar)
+        prof = profiling.enable(app._swap_tk_counter(True))
+        # Lift the 60 Hz repaint cap so every repaint runs at idle and is timed as work
+        app._repaint.max_hz = UNTHROTTLED_HZ
+        root.update()
+
+        steps = args.steps
+        cells = [lbl for row in app.day_labels for lbl in row]
+        results = {}
+
+        results["navigate"] = _frames(root, [app.next_month if i % 2 == 0 else app.prev_month
+                                             for i in range(steps)])
+
+        def hover(lbl, sequence):
+            return lambda: lbl.event_generate(sequence)
+
+        def sweep(labels):
+            actions = []
+            for i in range(steps):
+                lbl = labels[i % len(labels)]
+                actions += [hover(lbl, "<Enter>"), hover(lbl, "<Leave>")]
+            return actions
+        results["hover"] = _frames(root, sweep(cells))
+
+        def click(lbl):
+            return lambda: lbl.event_generate("<Button-1>", x=2, y=2)
+        # Cells in the first and last in-month rows, so clicks stay in the shown month
+        results["range"] = _frames(root, [click(cells[7 + i % 7] if i % 2 == 0 else cells[21 + i % 7])
+                                          for i in range(steps)])
+
+        win = ThreeMonthWindow(root, style_helper=app)
+        win._repaint.max_hz = UNTHROTTLED_HZ
+        root.update()
+        results["3-month"] = _frames(root, [win.next_three if i % 2 == 0 else win.prev_three
+                                            for i in range(steps)])
+        results["3m hover"] = _frames(root, sweep([lbl for grid in win.month_day_labels
+                                                   for row in grid for lbl in row]))
+        root.destroy()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+    worst = max(_summary(name, samples) for name, samples in results.items())
+    print()
+    print(f"{'function':<36} {'calls':>6} {'mean us':>9} {'p95 us':>8} {'tk calls/call':>14}")
+    for name, entry in prof.snapshot().items():
+        t, k = entry["time_us"], entry["tk_calls"]
+        print(f"{name:<36} {t['count']:6d} {t['mean']:9.1f} {t['p95']:8.0f} {k['mean']:14.1f}")
+    if args.profile:
+        prof.dump(args.profile)
+        print(f"histograms written to {args.profile}")
+    print(f"worst p95 {worst:.2f} ms (budget {FRAME_BUDGET_MS:.0f} ms)")
+    return 0 if worst <= FRAME_BUDGET_MS else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
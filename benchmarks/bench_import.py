@@ -0,0 +1,58 @@
+"""Import-time budget for the engine entry points (python -X importtime).
+
+Exits non-zero if importing any of MODULES pulls in a GUI/heavy dependency or
+takes longer than the budget (best of several runs, cumulative microseconds).
+
+tests/test_import_budget.py enforces the same budget.
+
+Usage: python benchmarks/bench_import.py [budget_ms]   (default BUDGET_MS)
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ("workdays", "smart_calendar", "workdays_cli")
+FORBIDDEN = ("tkinter", "PIL", "numpy")
+RUNS = 5
+BUDGET_MS = 30
+
+
+def import_profile(module):
+    """Return {imported module: cumulative us} for a fresh `import module`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure(module, runs=RUNS):
+    """(best cumulative us, sorted forbidden modules imported) over several runs."""
+    profiles = [import_profile(module) for _ in range(runs)]
+    best = min(p[module] for p in profiles)
+    heavy = sorted({m for p in profiles for m in p if m.split(".")[0] in FORBIDDEN})
+    return best, heavy
+
+
+def main():
+    budget_us = float(sys.argv[1] if len(sys.argv) > 1 else BUDGET_MS) * 1000
+    failed = False
+    for module in MODULES:
+        best, heavy = measure(module)
+        ok = best <= budget_us and not heavy
+        failed |= not ok
+        extra = f"  imports {', '.join(heavy)}" if heavy else ""
+        print(f"{module:<16} {best / 1000:7.1f} ms  {'ok' if ok else 'OVER BUDGET'}{extra}")
+    print(f"budget: {budget_us / 1000:.0f} ms, forbidden: {', '.join(FORBIDDEN)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
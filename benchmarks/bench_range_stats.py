@@ -0,0 +1,63 @@
+"""Cost of range_stats across span lengths (should be flat).
+
+Times range_stats, and separately the first rows of the per-month / per-ISO-week
+breakdowns the details panel lists, for spans from a day to ~180 years
+(contract terms up to 2200), with plain Mon-Fri and with UK bank holidays.
+Exits non-zero if range_stats on the longest span costs more than FLAT_RATIO
+times the shortest.
+
+Usage: python benchmarks/bench_range_stats.py [calls]   (default 20000)
+"""
+import os
+import sys
+import time
+from datetime import date, timedelta
+from itertools import islice
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from range_stats import iter_iso_weeks, iter_months, range_stats
+from workdays import UK_CALENDAR
+
+SPANS = (("1 day", 0), ("1 month", 30), ("1 year", 365), ("10 years", 3652),
+         ("100 years", 36524), ("to 2200", (date(2200, 12, 31) - date(2024, 1, 1)).days))
+PANEL_ROWS = 6
+FLAT_RATIO = 3.0
+
+
+def _panel_rows(st, calendar):
+    list(islice(iter_months(st, calendar), PANEL_ROWS))
+    list(islice(iter_iso_weeks(st, calendar), PANEL_ROWS))
+
+
+def _per_call_us(fn, calls):
+    best = float("inf")
+    for _ in range(3):
+        t0 = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, time.perf_counter() - t0)
+    return best / calls * 1e6
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    start = date(2024, 1, 1)
+    worst = 0.0
+    for cal_name, calendar in (("Mon-Fri", None), ("UK holidays", UK_CALENDAR)):
+        costs = []
+        for label, span in SPANS:
+            end = start + timedelta(days=span)
+            us = _per_call_us(lambda: range_stats(start, end, calendar), calls)
+            st = range_stats(start, end, calendar)
+            panel_us = _per_call_us(lambda: _panel_rows(st, calendar), calls)
+            costs.append(us)
+            print(f"{cal_name:<12} {label:<10} {span + 1:>7} days  "
+                  f"stats {us:7.2f} us  panel rows {panel_us:7.2f} us")
+        worst = max(worst, costs[-1] / costs[0])
+    print(f"longest/shortest span cost ratio: {worst:.2f} (limit {FLAT_RATIO})")
+    return 0 if worst <= FLAT_RATIO else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""Headless calendar export: streamed PDF memory and parallel batch throughput.
+
+  stream   month-view PDFs of 1 and YEARS years (12 and 12 * YEARS pages);
+           the peak traced memory should not grow with page count (a warm-up
+           run first fills the layout cache)
+  batch    year-view SVG + PDF files for YEARS years through export_batch,
+           with 1 worker and with one per CPU
+
+Exits non-zero if the long PDF's peak memory is more than MEMORY_RATIO times
+the one-year PDF's.
+
+Usage: python benchmarks/bench_render.py [years]   (default 100)
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calendar_render import export, export_batch
+
+FIRST_YEAR = 2000
+MEMORY_RATIO = 2.0
+
+
+def _streamed(path, years):
+    span = range(FIRST_YEAR, FIRST_YEAR + years)
+    t0 = time.perf_counter()
+    export(path, "month", span, week_numbers=True)
+    elapsed = time.perf_counter() - t0
+    # Again under tracemalloc (which slows the run), for the peak only
+    tracemalloc.start()
+    export(path, "month", span, week_numbers=True)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    pages = 12 * years
+    print(f"stream   {pages:5d} pages  {elapsed * 1000:8.1f} ms  ({pages / elapsed:6.0f} pages/s)  "
+          f"{os.path.getsize(path) / 1024:8.0f} KiB  peak {peak / 1024:7.0f} KiB")
+    return peak
+
+
+def main():
+    years = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    with tempfile.TemporaryDirectory(prefix="render-") as tmp:
+        export(os.path.join(tmp, "warm.pdf"), "month", range(FIRST_YEAR, FIRST_YEAR + 6))
+        small = _streamed(os.path.join(tmp, "one.pdf"), 1)
+        large = _streamed(os.path.join(tmp, "many.pdf"), years)
+
+        cpus = os.cpu_count() or 1
+        for workers in sorted({1, cpus}):
+            for fmt in ("svg", "pdf"):
+                t0 = time.perf_counter()
+                files = export_batch(os.path.join(tmp, f"{fmt}-{workers}"), "year",
+                                     range(FIRST_YEAR, FIRST_YEAR + years), fmt, workers)
+                elapsed = time.perf_counter() - t0
+                print(f"batch    {fmt} x{len(files)} files  {workers:2d} worker(s)  {elapsed * 1000:8.1f} ms  "
+                      f"({len(files) / elapsed:6.0f} files/s)")
+    print(f"peak memory {large / small:.2f}x for {years}x the pages (budget {MEMORY_RATIO}x)")
+    return 0 if large <= MEMORY_RATIO * small else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""Load test for the working-day HTTP API (workdays_server).
+
+Starts a server on a free loopback port (or targets --address), then keeps
+--connections keep-alive connections busy until --requests have completed.
+Each connection sends --pipeline requests back to back before reading the
+answers. Inputs are drawn from a pool of --distinct keys, so the LRU cache
+hit rate can be dialled. Reports p50/p99 latency and requests per second.
+
+Usage: python benchmarks/bench_server.py [--requests 50000] [--connections 32]
+                                         [--pipeline 1] [--distinct 5000]
+                                         [--address host:port]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _request_pool(distinct, seed=0):
+    rng = random.Random(seed)
+    pool = []
+    for i in range(distinct):
+        d = f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(1990, 2060)}"
+        if i % 2:
+            body = {"start": d, "days": rng.randint(-500, 500), "region": "england-wales"}
+            path = "/add"
+        else:
+            e = f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(1990, 2060)}"
+            body = {"a": d, "b": e}
+            path = "/between"
+        payload = json.dumps(body).encode()
+        pool.append(f"POST {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload)
+    return pool
+
+
+async def _read_response(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line[:15].lower() == b"content-length:":
+            length = int(line[15:])
+    body = await reader.readexactly(length)
+    return status, body
+
+
+async def _client(host, port, pool, quota, pipeline, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    rng = random.Random(id(latencies) ^ quota[0])
+    try:
+        while quota[0] > 0:
+            n = min(pipeline, quota[0])
+            quota[0] -= n
+            t0 = time.perf_counter()
+            writer.write(b"".join(rng.choice(pool) for _ in range(n)))
+            for _ in range(n):
+                status, _ = await _read_response(reader)
+                latencies.append(time.perf_counter() - t0)
+                if status != 200:
+                    errors.append(status)
+    finally:
+        writer.close()
+
+
+async def _get_json(host, port, path):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n".encode())
+    _, body = await _read_response(reader)
+    writer.close()
+    return json.loads(body)
+
+
+async def _wait_ready(host, port, timeout=10):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            return await _get_json(host, port, "/health")
+        except OSError:
+            if time.perf_counter() > deadline:
+                raise
+            await asyncio.sleep(0.05)
+
+
+async def run(host, port, requests, connections, pipeline, distinct):
+    pool = _request_pool(distinct)
+    await _wait_ready(host, port)
+    quota = [requests]  # shared countdown; the event loop is single-threaded
+    latencies, errors = [], []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_client(host, port, pool, quota, pipeline, latencies, errors)
+                           for _ in range(connections)))
+    elapsed = time.perf_counter() - t0
+    health = await _get_json(host, port, "/health")
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    lookups = health["cache_hits"] + health["cache_misses"]
+    print(f"{len(latencies):,} requests over {connections} connections, pipeline depth {pipeline}")
+    print(f"  throughput  {len(latencies) / elapsed:10.0f} req/s")
+    print(f"  latency p50 {p50:10.3f} ms")
+    print(f"  latency p99 {p99:10.3f} ms")
+    print(f"  cache hits  {health['cache_hits'] / max(lookups, 1):10.1%}")
+    if errors:
+        print(f"  {len(errors)} non-200 responses")
+    return 1 if errors else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--pipeline", type=int, default=1)
+    parser.add_argument("--distinct", type=int, default=5_000, help="distinct request bodies")
+    parser.add_argument("--address", help="host:port of a running server (default: start one)")
+    args = parser.parse_args()
+
+    server = None
+    if args.address:
+        host, port = args.address.rsplit(":", 1)
+        port = int(port)
+    else:
+        host, port = "127.0.0.1", _free_port()
+        server = subprocess.Popen([sys.executable, os.path.join(ROOT, "workdays_server.py"),
+                                   "--port", str(port)], stderr=subprocess.DEVNULL)
+    try:
+        return asyncio.run(run(host, port, args.requests, args.connections, args.pipeline, args.distinct))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
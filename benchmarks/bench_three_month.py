@@ -0,0 +1,67 @@
+"""Paint time and Tk round trips per navigation in the 3-month view.
+
+Usage: python benchmarks/bench_three_month.py [navigations] [--headless]   (default 200)
+
+Needs a display (e.g. Xvfb) unless --headless is given. Headless runs use a
+plain Tcl interpreter in which every Tk command is a no-op returning "", so
+the Tk call counts are exact but the times cover only the Python side and
+Tcl dispatch, not Tk's own widget and layout work.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tkinter as tk
+
+from calendar_gui import ThreeMonthWindow, UKCalendarApp
+
+UNTHROTTLED_HZ = 1e9
+
+
+class HeadlessRoot(tk.Tk):
+    """A Tk root over a plain Tcl interpreter, for counting calls without a display."""
+
+    def __init__(self):
+        self.master = None
+        self.children = {}
+        self._tkloaded = True
+        self._w = "."
+        self._last_child_ids = None
+        self.tk = tk._tkinter.create(None, "bench", "Tk", 0, 1, 0)
+        self.tk.eval('proc unknown args {return ""}')
+        tk._default_root = self  # ttk.Style() and friends look the root up
+
+
+def main():
+    args = [a for a in sys.argv[1:] if a != "--headless"]
+    steps = int(args[0]) if args else 200
+    root = HeadlessRoot() if "--headless" in sys.argv else tk.Tk()
+    app = UKCalendarApp(root)
+    app.model.update(show_week_numbers=True)
+    # Installed before the window is built, so its widgets inherit the counter
+    counter = app._swap_tk_counter(True)
+    win = ThreeMonthWindow(root, style_helper=app)
+    # Lift the 60 Hz repaint cap so each repaint runs at idle, inside the timed update_idletasks()
+    app._repaint.max_hz = win._repaint.max_hz = UNTHROTTLED_HZ
+    root.update()
+
+    samples = []
+    calls0 = counter.calls
+    for i in range(steps):
+        t0 = time.perf_counter()
+        (win.next_three if i % 2 == 0 else win.prev_three)()
+        root.update_idletasks()
+        samples.append((time.perf_counter() - t0) * 1000)
+    calls = (counter.calls - calls0) / steps
+    root.destroy()
+
+    samples.sort()
+    print(f"{steps} navigations: mean {sum(samples) / steps:.2f} ms, "
+          f"p50 {samples[steps // 2]:.2f} ms, p95 {samples[int(steps * 0.95)]:.2f} ms, "
+          f"{calls:.0f} Tk calls each")
+
+
+if __name__ == "__main__":
+    main()
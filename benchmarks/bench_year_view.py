@@ -0,0 +1,47 @@
+"""Frame times for opening and paging the canvas year view (needs a display, e.g. Xvfb).
+
+Exits non-zero if the p95 paging frame exceeds YearViewWindow.FRAME_BUDGET_MS.
+
+Usage: python benchmarks/bench_year_view.py [pages]   (default 100)
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tkinter as tk
+
+from calendar_gui import UKCalendarApp, YearViewWindow
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    root = tk.Tk()
+    app = UKCalendarApp(root)
+    root.update()
+
+    t0 = time.perf_counter()
+    view = YearViewWindow(root, app)
+    root.update_idletasks()
+    open_ms = (time.perf_counter() - t0) * 1000
+
+    samples = []
+    for i in range(pages):
+        t0 = time.perf_counter()
+        view.year += 1 if i % 2 == 0 else -1
+        view.render_year()
+        root.update_idletasks()
+        samples.append((time.perf_counter() - t0) * 1000)
+    root.destroy()
+
+    samples.sort()
+    p95 = samples[int(pages * 0.95)]
+    print(f"open: {open_ms:.2f} ms")
+    print(f"{pages} pages: p50 {samples[pages // 2]:.2f} ms, p95 {p95:.2f} ms "
+          f"(budget {YearViewWindow.FRAME_BUDGET_MS:.0f} ms)")
+    return 0 if p95 <= YearViewWindow.FRAME_BUDGET_MS else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1741 @@
+"""Tk user interface for Smart Calendar.
+
+Imported lazily by smart_calendar.main(), so tkinter (and Pillow, for the
+window icon) are only loaded when the GUI actually starts.
+"""
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from datetime import date, datetime, timedelta
+import os
+import queue
+import time
+from functools import partial
+from itertools import islice
+
+import calendar_render
+import ics
+import profiling
+from calendar_layout import (PALETTE, WEEKDAYS, days_off_columns, grid_span, month_layout, prefetch_months,
+                             shift_month)
+from calendar_model import CALENDAR, EVENTS, SELECTION, VIEW, CalendarModel, touches
+from events import EventStore
+from free_slots import DAY_END, DAY_START, HORIZON_DAYS, BusySchedule, BusyUnion, find_free_slots
+from holiday_rules import REGIONS, region_calendar
+from profiling import profiled
+from range_stats import iter_iso_weeks, iter_months, range_stats
+from recurrence import RecurrenceRule
+from workdays import DATE_FMT, UK_CALENDAR, WORK_PATTERNS
+
+# --- Blank icon support (uses Pillow if available) ---
+ICON_PATH = r'C:\Users\Frank\Desktop\blank.ico'
+
+def _create_blank_icon_if_needed(path: str):
+    try:
+        from PIL import Image  # Pillow
+    except Exception:
+        return  # Pillow not available; skip silently
+
+    parent = os.path.dirname(path)
+    if parent and not os.path.isdir(parent):
+        try:
+            os.makedirs(parent, exist_ok=True)
+        except Exception:
+            return
+
+    if not os.path.isfile(path):
+        try:
+            size = (16, 16)
+            image = Image.new("RGBA", size, (255, 255, 255, 0))  # fully transparent
+            image.save(path, format="ICO")
+        except Exception:
+            pass
+
+APP_TITLE = "Smart Calendar"
+def _day_text(d: date, events: int) -> str:
+    # Day number, plus a compact event count when the day has any
+    return f"{d.day} \u2022{events}" if events else str(d.day)
+
+def _more(total: int, shown: int) -> str:
+    return f" … and {total - shown} more" if total > shown else ""
+
+def _cell_bindtag(owner, handlers) -> str:
+    """Bind handlers once under a bindtag unique to owner; cells join with _join_bindtag.
+
+    One Tcl command per event serves a whole grid, instead of one per cell.
+    """
+    tag = f"DayCell{id(owner)}"
+    for sequence, handler in handlers.items():
+        owner.bind_class(tag, sequence, handler)
+    return tag
+
+def _join_bindtag(widget, tag):
+    widget.bindtags((tag,) + widget.bindtags())
+
+def _configure_changed(applied: dict, key, configure, **options) -> bool:
+    """Call configure(**changed) with only the options that differ from last time.
+
+    Every configure is a Tk round trip, so the last applied value of each
+    option is kept in applied[key] and unchanged options are skipped. Returns
+    whether configure was called.
+    """
+    last = applied.setdefault(key, {})
+    changed = {k: v for k, v in options.items() if last.get(k) != v}
+    if changed:
+        configure(**changed)
+        last.update(changed)
+    return bool(changed)
+
+MAX_REPAINT_HZ = 60  # upper bound on coalesced repaints per second
+STATS_ROWS = 6  # months / ISO weeks listed in the range details panel
+IMPORT_POLL_MS = 50  # how often the Tk thread drains .ics import batches
+IMPORT_SLICE_MS = 15  # per-drain time budget so the window keeps painting
+
+class RepaintScheduler:
+    """Coalesces repaint requests so a view redraws at most max_hz times a second.
+
+    Navigation updates the target state immediately and calls request(); any
+    number of requests before the next frame collapse into one call of render,
+    which then draws whatever the latest state is. Model listeners pass the
+    changed aspects and dirty date spans, accumulated in `dirty` / `spans`
+    until the next render so the view can choose a partial repaint (None in
+    either means everything).
+    """
+
+    def __init__(self, widget, render, max_hz=MAX_REPAINT_HZ):
+        self.widget = widget
+        self.render = render
+        self.max_hz = max_hz
+        self._job = None
+        self._last = 0.0
+        self.dirty = set()
+        self.spans = []
+
+    def request(self, aspects=None, spans=None):
+        self.dirty = None if aspects is None or self.dirty is None else self.dirty | aspects
+        self.spans = None if spans is None or self.spans is None else self.spans + list(spans)
+        if self._job is not None:
+            return
+        wait = self._last + 1.0 / self.max_hz - time.perf_counter()
+        if wait > 0:
+            self._job = self.widget.after(int(wait * 1000) + 1, self._flush)
+        else:
+            self._job = self.widget.after_idle(self._flush)
+
+    def rendered(self):
+        """Called by the view on every render, queued or direct."""
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+        self._last = time.perf_counter()
+        self.dirty = set()
+        self.spans = []
+
+    def only(self, *aspects):
+        """True if everything pending since the last render is within aspects."""
+        return self.dirty is not None and self.dirty <= set(aspects)
+
+    def _flush(self):
+        self._job = None
+        self.render()
+
+
+class WorkingDaysDialog(tk.Toplevel):
+    def __init__(self, master, on_result, business_calendar=UK_CALENDAR):
+        super().__init__(master)
+        self.title("Add Working Days")
+        self.resizable(False, False)
+        self.on_result = on_result
+        self.business_calendar = business_calendar
+        self.configure(bg="#ffffff")
+
+        self.transient(master)
+        self.grab_set()
+
+        frm = ttk.Frame(self, padding=12)
+        frm.grid(row=0, column=0, sticky="nsew")
+
+        ttk.Label(frm, text="Start date (DD/MM/YYYY):").grid(row=0, column=0, sticky="w")
+        self.ent_start = ttk.Entry(frm, width=18)
+        self.ent_start.grid(row=0, column=1, sticky="w", padx=(8,0))
+        self.ent_start.insert(0, date.today().strftime(DATE_FMT))
+
+        ttk.Label(frm, text="Number of working days:").grid(row=1, column=0, sticky="w", pady=(8,0))
+        self.ent_days = ttk.Entry(frm, width=18)
+        self.ent_days.grid(row=1, column=1, sticky="w", padx=(8,0), pady=(8,0))
+        self.ent_days.insert(0, "0")
+
+        btns = ttk.Frame(frm)
+        btns.grid(row=2, column=0, columnspan=2, sticky="e", pady=(12,0))
+        ttk.Button(btns, text="Calculate", command=self._ok).grid(row=0, column=0, padx=(0,8))
+        ttk.Button(btns, text="Cancel", command=self.destroy).grid(row=0, column=1)
+
+        self.bind("<Return>", lambda e: self._ok())
+        self.bind("<Escape>", lambda e: self.destroy())
+        self.ent_start.focus_set()
+
+    def _ok(self):
+        try:
+            start_s = self.ent_start.get().strip()
+            days_s = self.ent_days.get().strip()
+            start = datetime.strptime(start_s, DATE_FMT).date()
+            days = int(days_s)
+        except Exception:
+            messagebox.showerror("Invalid input", "Please provide a valid date (DD/MM/YYYY) and an integer for days.")
+            return
+
+        try:
+            result = self.business_calendar.add_working_days(start, days)
+        except (OverflowError, ValueError):
+            messagebox.showerror("Out of range", f"{days:+,} working days from {start_s} is outside the supported dates (years 1-9999).")
+            return
+        self.on_result(start, days, result)
+        self.destroy()
+
+
+# Repeat options offered by AddEventDialog -> RecurrenceRule frequency
+REPEAT_CHOICES = {
+    "Never": None,
+    "Daily": "DAILY",
+    "Weekly": "WEEKLY",
+    "Monthly": "MONTHLY",
+    "Yearly": "YEARLY",
+    "Working days": "WORKDAYS",
+}
+
+class AddEventDialog(tk.Toplevel):
+    def __init__(self, master, on_result, start=None, business_calendar=UK_CALENDAR):
+        super().__init__(master)
+        self.title("Add Event")
+        self.resizable(False, False)
+        self.on_result = on_result
+        self.business_calendar = business_calendar  # what "Working days" repeats step over
+        self.configure(bg="#ffffff")
+
+        self.transient(master)
+        self.grab_set()
+
+        frm = ttk.Frame(self, padding=12)
+        frm.grid(row=0, column=0, sticky="nsew")
+
+        ttk.Label(frm, text="Title:").grid(row=0, column=0, sticky="w")
+        self.ent_title = ttk.Entry(frm, width=24)
+        self.ent_title.grid(row=0, column=1, sticky="w", padx=(8,0))
+
+        start_s = (start or date.today()).strftime(DATE_FMT)
+        ttk.Label(frm, text="Start date (DD/MM/YYYY):").grid(row=1, column=0, sticky="w", pady=(8,0))
+        self.ent_start = ttk.Entry(frm, width=24)
+        self.ent_start.grid(row=1, column=1, sticky="w", padx=(8,0), pady=(8,0))
+        self.ent_start.insert(0, start_s)
+
+        ttk.Label(frm, text="End date (DD/MM/YYYY):").grid(row=2, column=0, sticky="w", pady=(8,0))
+        self.ent_end = ttk.Entry(frm, width=24)
+        self.ent_end.grid(row=2, column=1, sticky="w", padx=(8,0), pady=(8,0))
+        self.ent_end.insert(0, start_s)
+
+        ttk.Label(frm, text="Repeat:").grid(row=3, column=0, sticky="w", pady=(8,0))
+        self.cmb_repeat = ttk.Combobox(frm, width=21, state="readonly", values=list(REPEAT_CHOICES))
+        self.cmb_repeat.grid(row=3, column=1, sticky="w", padx=(8,0), pady=(8,0))
+        self.cmb_repeat.set("Never")
+
+        ttk.Label(frm, text="Every (interval):").grid(row=4, column=0, sticky="w", pady=(8,0))
+        self.ent_interval = ttk.Entry(frm, width=24)
+        self.ent_interval.grid(row=4, column=1, sticky="w", padx=(8,0), pady=(8,0))
+        self.ent_interval.insert(0, "1")
+
+        ttk.Label(frm, text="Repeat until (optional):").grid(row=5, column=0, sticky="w", pady=(8,0))
+        self.ent_until = ttk.Entry(frm, width=24)
+        self.ent_until.grid(row=5, column=1, sticky="w", padx=(8,0), pady=(8,0))
+
+        btns = ttk.Frame(frm)
+        btns.grid(row=6, column=0, columnspan=2, sticky="e", pady=(12,0))
+        ttk.Button(btns, text="Add", command=self._ok).grid(row=0, column=0, padx=(0,8))
+        ttk.Button(btns, text="Cancel", command=self.destroy).grid(row=0, column=1)
+
+        self.bind("<Return>", lambda e: self._ok())
+        self.bind("<Escape>", lambda e: self.destroy())
+        self.ent_title.focus_set()
+
+    def _ok(self):
+        try:
+            title = self.ent_title.get().strip()
+            start = datetime.strptime(self.ent_start.get().strip(), DATE_FMT).date()
+            end = datetime.strptime(self.ent_end.get().strip(), DATE_FMT).date()
+            if not title:
+                raise ValueError("empty title")
+            rule = None
+            freq = REPEAT_CHOICES[self.cmb_repeat.get()]
+            if freq:
+                until_s = self.ent_until.get().strip()
+                until = datetime.strptime(until_s, DATE_FMT).date() if until_s else None
+                rule = RecurrenceRule(freq, start, int(self.ent_interval.get().strip()), until=until,
+                                      calendar=self.business_calendar)
+        except Exception:
+            messagebox.showerror("Invalid input", "Please provide a title, valid dates (DD/MM/YYYY) and a whole-number interval.")
+            return
+
+        self.on_result(title, start, end, rule)
+        self.destroy()
+
+
+class FreeSlotDialog(tk.Toplevel):
+    def __init__(self, master, on_result, start=None):
+        super().__init__(master)
+        self.title("Find Free Slot")
+        self.resizable(False, False)
+        self.on_result = on_result
+        self.paths = ()
+        self.configure(bg="#ffffff")
+
+        self.transient(master)
+        self.grab_set()
+
+        frm = ttk.Frame(self, padding=12)
+        frm.grid(row=0, column=0, sticky="nsew")
+
+        ttk.Label(frm, text="Calendars (.ics, one per person):").grid(row=0, column=0, sticky="w")
+        pick = ttk.Frame(frm)
+        pick.grid(row=0, column=1, sticky="w", padx=(8,0))
+        ttk.Button(pick, text="Choose…", command=self._choose).grid(row=0, column=0)
+        self.lbl_paths = ttk.Label(pick, text="none chosen")
+        self.lbl_paths.grid(row=0, column=1, padx=(8,0))
+
+        ttk.Label(frm, text="From date (DD/MM/YYYY):").grid(row=1, column=0, sticky="w", pady=(8,0))
+        self.ent_start = ttk.Entry(frm, width=24)
+        self.ent_start.grid(row=1, column=1, sticky="w", padx=(8,0), pady=(8,0))
+        self.ent_start.insert(0, (start or date.today()).strftime(DATE_FMT))
+
+        ttk.Label(frm, text="Duration (minutes):").grid(row=2, column=0, sticky="w", pady=(8,0))
+        self.ent_duration = ttk.Entry(frm, width=24)
+        self.ent_duration.grid(row=2, column=1, sticky="w", padx=(8,0), pady=(8,0))
+        self.ent_duration.insert(0, "60")
+
+        ttk.Label(frm, text="Working hours (HH:MM-HH:MM):").grid(row=3, column=0, sticky="w", pady=(8,0))
+        self.ent_hours = ttk.Entry(frm, width=24)
+        self.ent_hours.grid(row=3, column=1, sticky="w", padx=(8,0), pady=(8,0))
+        self.ent_hours.insert(0, f"{DAY_START:%H:%M}-{DAY_END:%H:%M}")
+
+        ttk.Label(frm, text="Number of slots:").grid(row=4, column=0, sticky="w", pady=(8,0))
+        self.ent_count = ttk.Entry(frm, width=24)
+        self.ent_count.grid(row=4, column=1, sticky="w", padx=(8,0), pady=(8,0))
+        self.ent_count.insert(0, "5")
+
+        btns = ttk.Frame(frm)
+        btns.grid(row=5, column=0, columnspan=2, sticky="e", pady=(12,0))
+        ttk.Button(btns, text="Find", command=self._ok).grid(row=0, column=0, padx=(0,8))
+        ttk.Button(btns, text="Cancel", command=self.destroy).grid(row=0, column=1)
+
+        self.bind("<Return>", lambda e: self._ok())
+        self.bind("<Escape>", lambda e: self.destroy())
+        self.ent_duration.focus_set()
+
+    def _choose(self):
+        paths = filedialog.askopenfilenames(
+            parent=self, title="Busy calendars",
+            filetypes=[("iCalendar", "*.ics"), ("All files", "*.*")])
+        if paths:
+            self.paths = tuple(paths)
+            self.lbl_paths.configure(text=f"{len(paths)} calendar{'s' if len(paths) != 1 else ''}")
+
+    def _ok(self):
+        try:
+            start = datetime.strptime(self.ent_start.get().strip(), DATE_FMT).date()
+            minutes = int(self.ent_duration.get().strip())
+            count = int(self.ent_count.get().strip())
+            open_s, close_s = self.ent_hours.get().split("-")
+            day_start = datetime.strptime(open_s.strip(), "%H:%M").time()
+            day_end = datetime.strptime(close_s.strip(), "%H:%M").time()
+            if minutes <= 0 or count <= 0 or day_end <= day_start:
+                raise ValueError("out of range")
+        except Exception:
+            messagebox.showerror("Invalid input", "Please provide a valid date (DD/MM/YYYY), whole numbers for duration "
+                                 "and slots, and working hours such as 09:00-17:00.")
+            return
+        day_minutes = (day_end.hour * 60 + day_end.minute) - (day_start.hour * 60 + day_start.minute)
+        if minutes > day_minutes:
+            messagebox.showerror("Invalid input", f"A {minutes}-minute slot does not fit in the working hours "
+                                 f"({day_minutes} minutes a day).")
+            return
+        if not self.paths:
+            messagebox.showerror("Invalid input", "Please choose at least one calendar.")
+            return
+
+        self.on_result(self.paths, start, timedelta(minutes=minutes), count, day_start, day_end)
+        self.destroy()
+
+
+class ThreeMonthWindow(tk.Toplevel):
+    def __init__(self, master, style_helper):
+        super().__init__(master)
+        self.title("3-Month View")
+        self.resizable(True, True)
+        self.configure(bg="#ffffff")
+        # Shared state (selection, options, work pattern) lives in the app's model;
+        # only the page shown is this window's own
+        self.style_helper = style_helper
+        self.model = style_helper.model
+        self.base_year = style_helper.current_year
+        self.base_month = style_helper.current_month
+        self._span = (None, None)  # first and last in-month dates shown
+        self._weeknums_shown = None
+        self._prefetch_job = None
+        self._options = {}  # widget -> last applied options
+        self._repaint = RepaintScheduler(self, self._refresh)
+
+        self._build_ui()
+        self.render_all()
+        self.model.subscribe(self._on_model_change)
+        self.bind("<Destroy>", self._on_destroy)
+
+    def _build_ui(self):
+        hdr = ttk.Frame(self, padding=(8,8,8,0))
+        hdr.pack(fill="x")
+
+        ttk.Button(hdr, text="◀", command=self.prev_three, width=3).pack(side="left")
+        self.lbl_range = ttk.Label(hdr, text="", style="Header.TLabel", anchor="center")
+        self.lbl_range.pack(side="left", expand=True)
+        ttk.Button(hdr, text="▶", command=self.next_three, width=3).pack(side="right")
+
+        self.body = ttk.Frame(self, padding=8)
+        self.body.pack(fill="both", expand=True)
+
+        self.month_cards = []
+        for i in range(5):
+            self.body.grid_columnconfigure(i, weight=(1 if i in (0,2,4) else 0))
+        self.body.grid_rowconfigure(0, weight=1)
+
+        # Each card owns a fixed pool of labels (header, Wk column, 6x7 days)
+        # built once here; navigation only reconfigures them.
+        self.month_headers = []
+        self.month_weeknum_headers = []
+        self.month_weeknum_labels = []
+        self.month_day_labels = []
+        self.month_dow_labels = []
+        self._dow_pattern = None  # pattern the weekday headers are styled for
+        # One bindtag serves the day cells of all three cards
+        self._cell_tag = _cell_bindtag(self, {"<Button-1>": self._on_click, "<Enter>": self._on_cell_enter,
+                                              "<Leave>": self._on_cell_leave})
+
+        def make_card(col):
+            card = tk.Frame(self.body, bg=PALETTE["background"],
+                            highlightthickness=1, highlightbackground="#E6E6E6",
+                            highlightcolor="#E6E6E6", bd=0)
+            card.grid(row=0, column=col, sticky="nsew", padx=2, pady=2)
+            inner = ttk.Frame(card, padding=8)
+            inner.pack(fill="both", expand=True)
+            self.month_cards.append(inner)
+            self._build_month_pool(inner)
+
+        make_card(0)
+        ttk.Separator(self.body, orient="vertical").grid(row=0, column=1, sticky="ns", padx=(8,8))
+        make_card(2)
+        ttk.Separator(self.body, orient="vertical").grid(row=0, column=3, sticky="ns", padx=(8,8))
+        make_card(4)
+
+    def _build_month_pool(self, parent):
+        header = ttk.Label(parent, text="", style="Header.TLabel", anchor="center")
+        header.pack(fill="x", pady=(0,6))
+
+        container = ttk.Frame(parent)
+        container.pack(fill="both", expand=True)
+
+        # Column 0 holds week numbers and is only gridded when they are shown
+        dow = ttk.Frame(container)
+        dow.grid(row=0, column=0, sticky="ew")
+        wk_header = ttk.Label(dow, text="Wk", style="WeekNumHeader.TLabel", anchor="center")
+        wk_header.grid(row=0, column=0, sticky="nsew", padx=(0,4))
+        dow_labels = []
+        for i, w in enumerate(WEEKDAYS):
+            style_name = "DowWeekend.TLabel" if i >= 5 else "Dow.TLabel"
+            lbl = ttk.Label(dow, text=w, style=style_name, anchor="center")
+            lbl.grid(row=0, column=i+1, sticky="nsew", padx=2, pady=(0,4))
+            dow.grid_columnconfigure(i+1, weight=1)
+            dow_labels.append(lbl)
+        self.month_dow_labels.append(dow_labels)
+
+        grid = ttk.Frame(container)
+        grid.grid(row=1, column=0, sticky="nsew")
+        container.grid_rowconfigure(1, weight=1)
+        container.grid_columnconfigure(0, weight=1)
+
+        weeknums = [wk_header]
+        days = []
+        for r in range(6):
+            wk_label = ttk.Label(grid, text="", style="WeekNum.TLabel", anchor="center")
+            wk_label.configure(background=PALETTE["weeknum_bg"])
+            wk_label.grid(row=r, column=0, sticky="nsew", padx=(0,4), pady=2, ipadx=3)
+            weeknums.append(wk_label)
+            row_labels = []
+            for c in range(7):
+                lbl = ttk.Label(grid, text="", style="Day.TLabel", anchor="center")
+                lbl.grid(row=r, column=c+1, sticky="nsew", padx=2, pady=2, ipadx=4, ipady=4)
+                _join_bindtag(lbl, self._cell_tag)
+                lbl.date_value = None
+                lbl.rest_style = "Day.TLabel"
+                row_labels.append(lbl)
+                grid.grid_columnconfigure(c+1, weight=1)
+            days.append(row_labels)
+            grid.grid_rowconfigure(r, weight=1)
+
+        self.month_headers.append(header)
+        self.month_weeknum_headers.append(wk_header)
+        self.month_weeknum_labels.append(weeknums[1:])
+        self.month_day_labels.append(days)
+
+    def prev_three(self):
+        self.base_year, self.base_month = shift_month(self.base_year, self.base_month, -3)
+        self._repaint.request()
+
+    def next_three(self):
+        self.base_year, self.base_month = shift_month(self.base_year, self.base_month, 3)
+        self._repaint.request()
+
+    def _config(self, widget, **options):
+        _configure_changed(self._options, widget, widget.config, **options)
+
+    def _on_model_change(self, aspects, spans):
+        # Selection changes elsewhere in the calendar don't concern this page
+        if aspects == {SELECTION} and not touches(spans, *self._span):
+            return
+        self._repaint.request(aspects, spans)
+
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self.model.unsubscribe(self._on_model_change)
+
+    def _refresh(self):
+        if self._repaint.only(SELECTION):
+            self.restyle()
+        else:
+            self.render_all()
+
+    def _set_week_number_column(self, show):
+        """grid()/grid_remove() the Wk column; the labels themselves are kept."""
+        for header, labels in zip(self.month_weeknum_headers, self.month_weeknum_labels):
+            for lbl in (header, *labels):
+                if show:
+                    lbl.grid()
+                else:
+                    lbl.grid_remove()
+        self._weeknums_shown = show
+
+    @profiled
+    def render_all(self):
+        self._repaint.rendered()
+        show_week_numbers = self.model.show_week_numbers
+        if show_week_numbers != self._weeknums_shown:
+            self._set_week_number_column(show_week_numbers)
+        left = date(self.base_year, self.base_month, 1)
+        y2, m2 = shift_month(self.base_year, self.base_month, 2)
+        right = date(y2, m2, 1)
+        self._config(self.lbl_range, text=f"{left.strftime('%B %Y')} \u2192 {right.strftime('%B %Y')}")
+
+        pattern = self.model.work_pattern
+        if pattern != self._dow_pattern:
+            self._dow_pattern = pattern
+            off = days_off_columns(pattern)
+            for labels in self.month_dow_labels:
+                for c, lbl in enumerate(labels):
+                    self._config(lbl, style="DowWeekend.TLabel" if off[c] else "Dow.TLabel")
+
+        # One event range query covers all three grids
+        first = grid_span(month_layout(self.base_year, self.base_month, pattern))[0]
+        last = grid_span(month_layout(y2, m2, pattern))[1]
+        counts = self.style_helper.event_store.counts_by_day(first, last)
+
+        self._span = (left, date(*shift_month(y2, m2, 1), 1) - timedelta(days=1))
+        lo, hi = self.model.selection_range()
+        for idx in range(len(self.month_cards)):
+            y, m = shift_month(self.base_year, self.base_month, idx)
+            self._render_one_month(idx, y, m, show_week_numbers, counts, first.toordinal(), pattern, lo, hi)
+
+        # Warm the previous and next pages while the window is idle
+        if self._prefetch_job is not None:
+            self.after_cancel(self._prefetch_job)
+        self._prefetch_job = self.after_idle(self._prefetch_pages)
+
+    def _prefetch_pages(self):
+        self._prefetch_job = None
+        prefetch_months(self.base_year, self.base_month, (-3, -2, -1, 3, 4, 5), self.model.work_pattern)
+
+    @profiled
+    def _render_one_month(self, idx, year, month, show_week_numbers, counts, counts_origin, pattern=None,
+                          lo=None, hi=None):
+        self._config(self.month_headers[idx], text=date(year, month, 1).strftime("%B %Y"))
+        weeknum_labels = self.month_weeknum_labels[idx]
+        day_labels = self.month_day_labels[idx]
+        # Days off come from the layout, which follows the active work pattern
+        layout = month_layout(year, month, pattern)
+
+        for r, week in enumerate(layout.weeks):
+            if show_week_numbers:
+                self._config(weeknum_labels[r], text=str(layout.week_numbers[r]) if week else "")
+            for c in range(7):
+                lbl = day_labels[r][c]
+                if week is None:
+                    self._config(lbl, text="", style="Day.TLabel", foreground=PALETTE["day_fg"])
+                    lbl.date_value = None
+                    lbl.rest_style = "Day.TLabel"
+                    continue
+                d = week[c]
+                # Highlights go on in-month cells only, so each date shows once
+                if layout.outside[r][c]:
+                    style, fg = "Day.TLabel", PALETTE["outside_fg"]
+                else:
+                    weekend = layout.weekend[r][c]
+                    style = self.style_helper._resolve_style(d, weekend, lo, hi)
+                    fg = PALETTE["weekend_fg"] if weekend else PALETTE["day_fg"]
+                self._config(lbl, text=_day_text(d, counts[d.toordinal() - counts_origin]), style=style, foreground=fg)
+                lbl.date_value = d
+                lbl.in_month = not layout.outside[r][c]
+                lbl.rest_style = style
+
+    @profiled
+    def restyle(self):
+        """Re-resolve highlight styles after a selection change; configures only cells that differ."""
+        self._repaint.rendered()
+        lo, hi = self.model.selection_range()
+        is_day_off = self.style_helper._is_day_off
+        for day_labels in self.month_day_labels:
+            for row in day_labels:
+                for lbl in row:
+                    d = lbl.date_value
+                    if d is None or not lbl.in_month:
+                        continue
+                    wanted = self.style_helper._resolve_style(d, is_day_off(d), lo, hi)
+                    if wanted != lbl.rest_style:
+                        self._config(lbl, style=wanted)
+                        lbl.rest_style = wanted
+
+    def _on_click(self, event):
+        if event.widget.date_value is not None:
+            self.style_helper.select_day(event.widget.date_value)
+
+    # Shared by every cell of the three grids; hover only swaps the style and
+    # the foreground set by render is left alone
+    @profiled
+    def _on_cell_enter(self, event):
+        if event.widget.date_value is not None:
+            self._config(event.widget, style="Hover.TLabel")
+
+    @profiled
+    def _on_cell_leave(self, event):
+        lbl = event.widget
+        if lbl.date_value is not None:
+            self._config(lbl, style=lbl.rest_style)
+
+
+class YearViewWindow(tk.Toplevel):
+    """All 12 months of a year drawn onto a single Canvas.
+
+    Day cells are canvas items created once and reconfigured when paging.
+    Clicks map to dates arithmetically from the month block geometry, so there
+    are no per-cell widgets or bindings, and range changes only touch the cells
+    whose highlight actually changes.
+    """
+    CELL_W, CELL_H = 28, 20
+    WK_W = 26
+    TITLE_H, DOW_H = 24, 18
+    GAP_X, GAP_Y, MARGIN = 18, 14, 12
+    COLUMNS = 3
+    FRAME_BUDGET_MS = 16.0
+
+    def __init__(self, master, app):
+        super().__init__(master)
+        self.title("Year View")
+        self.resizable(True, True)
+        self.configure(bg="#ffffff")
+        self.app = app
+        self.model = app.model
+        self.year = app.current_year
+        self.last_frame_ms = 0.0
+        self._prefetch_job = None
+        self._repaint = RepaintScheduler(self, self._refresh)
+
+        self._item_options = {}   # canvas item -> last applied options
+        self._rect_by_ordinal = {}
+        self._highlighted = {}    # rect item -> highlight fill currently shown
+        self._weeknums_shown = None
+
+        self._build_ui()
+        self.render_year()
+        self.model.subscribe(self._on_model_change)
+        self.bind("<Destroy>", self._on_destroy)
+
+    def _build_ui(self):
+        hdr = ttk.Frame(self, padding=(8,8,8,0))
+        hdr.pack(fill="x")
+        ttk.Button(hdr, text="◀", command=self.prev_year, width=3).pack(side="left")
+        self.lbl_year = ttk.Label(hdr, text="", style="Header.TLabel", anchor="center")
+        self.lbl_year.pack(side="left", expand=True)
+        ttk.Button(hdr, text="▶", command=self.next_year, width=3).pack(side="right")
+
+        self.canvas = tk.Canvas(self, bg=PALETTE["background"], highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.bind("<Left>", lambda e: self.prev_year())
+        self.bind("<Right>", lambda e: self.next_year())
+
+        # Items are created once; _layout() positions them, with or without the Wk column
+        font = ("Segoe UI", 9)
+        c = self.canvas
+        self._title_items = []
+        self._weeknum_column_items = []
+        self._weeknum_items = []
+        self._dow_items = []
+        self._cell_items = []
+        for i in range(12):
+            self._title_items.append(c.create_text(0, 0, text="", font=("Segoe UI", 11, "bold")))
+            self._weeknum_column_items.append((
+                c.create_rectangle(0, 0, 0, 0, fill=PALETTE["weeknum_bg"], outline=""),
+                c.create_text(0, 0, text="Wk", font=font, fill=PALETTE["weeknum_fg"])))
+            self._dow_items.append([
+                c.create_text(0, 0, text=name[:2], font=font,
+                              fill=PALETTE["dow_weekend_fg"] if col >= 5 else PALETTE["dow_fg"])
+                for col, name in enumerate(WEEKDAYS)])
+            self._weeknum_items.append([c.create_text(0, 0, text="", font=font, fill=PALETTE["weeknum_fg"])
+                                        for _ in range(6)])
+            self._cell_items.append([
+                [(c.create_rectangle(0, 0, 0, 0, fill=PALETTE["background"], outline=""),
+                  c.create_text(0, 0, text="", font=font)) for _ in range(7)]
+                for _ in range(6)])
+
+    def _layout(self, show_week_numbers):
+        """Position every item for the Wk column shown or hidden (no items are recreated)."""
+        wk_w = self.WK_W if show_week_numbers else 0
+        self._wk_w = wk_w
+        self._block_w = wk_w + 7 * self.CELL_W
+        self._block_h = self.TITLE_H + self.DOW_H + 6 * self.CELL_H
+        rows = 12 // self.COLUMNS
+        c = self.canvas
+        c.config(width=2 * self.MARGIN + self.COLUMNS * self._block_w + (self.COLUMNS - 1) * self.GAP_X,
+                 height=2 * self.MARGIN + rows * self._block_h + (rows - 1) * self.GAP_Y)
+        wk_state = "normal" if wk_w else "hidden"
+        for i in range(12):
+            x0, y0 = self._month_origin(i)
+            c.coords(self._title_items[i], x0 + self._block_w / 2, y0 + self.TITLE_H / 2)
+            ty = y0 + self.TITLE_H + self.DOW_H / 2
+            wk_bg, wk_text = self._weeknum_column_items[i]
+            c.coords(wk_bg, x0, y0 + self.TITLE_H, x0 + self.WK_W - 2, y0 + self._block_h)
+            c.coords(wk_text, x0 + self.WK_W / 2, ty)
+            for col, item in enumerate(self._dow_items[i]):
+                c.coords(item, x0 + wk_w + (col + 0.5) * self.CELL_W, ty)
+            for r in range(6):
+                cy = y0 + self.TITLE_H + self.DOW_H + r * self.CELL_H
+                c.coords(self._weeknum_items[i][r], x0 + self.WK_W / 2, cy + self.CELL_H / 2)
+                for col, (rect, text) in enumerate(self._cell_items[i][r]):
+                    cx = x0 + wk_w + col * self.CELL_W
+                    c.coords(rect, cx + 1, cy + 1, cx + self.CELL_W - 1, cy + self.CELL_H - 1)
+                    c.coords(text, cx + self.CELL_W / 2, cy + self.CELL_H / 2)
+            for item in (wk_bg, wk_text, *self._weeknum_items[i]):
+                c.itemconfigure(item, state=wk_state)
+        self._weeknums_shown = show_week_numbers
+
+    def _month_origin(self, index):
+        row, col = divmod(index, self.COLUMNS)
+        return (self.MARGIN + col * (self._block_w + self.GAP_X),
+                self.MARGIN + row * (self._block_h + self.GAP_Y))
+
+    def _itemconfig(self, item, **options):
+        _configure_changed(self._item_options, item, partial(self.canvas.itemconfigure, item), **options)
+
+    def prev_year(self):
+        self.year -= 1
+        self._repaint.request()
+
+    def next_year(self):
+        self.year += 1
+        self._repaint.request()
+
+    def _on_model_change(self, aspects, spans):
+        if aspects == {SELECTION} and not touches(spans, date(self.year, 1, 1), date(self.year, 12, 31)):
+            return
+        self._repaint.request(aspects, spans)
+
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self.model.unsubscribe(self._on_model_change)
+
+    def _refresh(self):
+        if self._repaint.only(SELECTION):
+            self._repaint.rendered()
+            self.update_highlights()
+        else:
+            self.render_year()
+
+    @profiled
+    def render_year(self):
+        self._repaint.rendered()
+        t0 = time.perf_counter()
+        if self.model.show_week_numbers != self._weeknums_shown:
+            self._layout(self.model.show_week_numbers)
+        self.lbl_year.config(text=str(self.year))
+
+        # Paging changes every cell's date, so highlights are recomputed from scratch
+        for rect in self._highlighted:
+            self._itemconfig(rect, fill=PALETTE["background"])
+        self._highlighted = {}
+        self._rect_by_ordinal = {}
+
+        pattern = self.model.work_pattern
+        off = days_off_columns(pattern)
+        for i in range(12):
+            layout = month_layout(self.year, i + 1, pattern)
+            self._itemconfig(self._title_items[i], text=date(self.year, i + 1, 1).strftime("%B"))
+            for col, item in enumerate(self._dow_items[i]):
+                self._itemconfig(item, fill=PALETTE["dow_weekend_fg"] if off[col] else PALETTE["dow_fg"])
+            for r, week in enumerate(layout.weeks):
+                if self._wk_w:
+                    self._itemconfig(self._weeknum_items[i][r],
+                                     text=str(layout.week_numbers[r]) if week else "")
+                for c in range(7):
+                    rect, text = self._cell_items[i][r][c]
+                    # Only in-month days are drawn, so every date has exactly one cell
+                    if week is None or layout.outside[r][c]:
+                        self._itemconfig(text, text="")
+                        continue
+                    d = week[c]
+                    self._itemconfig(text, text=str(d.day),
+                                     fill=PALETTE["weekend_fg"] if layout.weekend[r][c] else PALETTE["day_fg"])
+                    self._rect_by_ordinal[d.toordinal()] = rect
+
+        self.update_highlights()
+        self.last_frame_ms = (time.perf_counter() - t0) * 1000
+
+        if self._prefetch_job is not None:
+            self.after_cancel(self._prefetch_job)
+        self._prefetch_job = self.after_idle(self._prefetch_years)
+
+    def _prefetch_years(self):
+        self._prefetch_job = None
+        prefetch_months(self.year, 1, list(range(-12, 0)) + list(range(12, 24)), self.model.work_pattern)
+
+    @profiled
+    def update_highlights(self):
+        """Recolour only the cells whose range/today/result/selection fill changed."""
+        model = self.model
+        wanted = {}
+        first = date(self.year, 1, 1).toordinal()
+        last = date(self.year, 12, 31).toordinal()
+        lo, hi = model.selection_range()
+        # Lowest priority first, so later assignments win (as in _resolve_style)
+        for d, key in ((model.selected_date, "selected"), (model.highlighted_result, "result"),
+                       (model.today, "today")):
+            if d is not None and first <= d.toordinal() <= last:
+                wanted[self._rect_by_ordinal[d.toordinal()]] = PALETTE[key]
+        if lo is not None:
+            lo_o, hi_o = lo.toordinal(), hi.toordinal()
+            for o in range(max(lo_o, first), min(hi_o, last) + 1):
+                edge = o == lo_o or o == hi_o
+                wanted[self._rect_by_ordinal[o]] = PALETTE["range_edge" if edge else "range"]
+
+        for rect in self._highlighted.keys() - wanted.keys():
+            self._itemconfig(rect, fill=PALETTE["background"])
+        for rect, fill in wanted.items():
+            if self._highlighted.get(rect) != fill:
+                self._itemconfig(rect, fill=fill)
+        self._highlighted = wanted
+
+    def _date_at(self, x, y):
+        """Date under canvas point (x, y), from the month block geometry."""
+        col, dx = divmod(self.canvas.canvasx(x) - self.MARGIN, self._block_w + self.GAP_X)
+        row, dy = divmod(self.canvas.canvasy(y) - self.MARGIN, self._block_h + self.GAP_Y)
+        if not (0 <= col < self.COLUMNS and 0 <= row < 12 // self.COLUMNS):
+            return None
+        dx -= self._wk_w
+        dy -= self.TITLE_H + self.DOW_H
+        if not (0 <= dx < 7 * self.CELL_W and 0 <= dy < 6 * self.CELL_H):
+            return None
+        layout = month_layout(self.year, int(row) * self.COLUMNS + int(col) + 1, self.model.work_pattern)
+        r, c = int(dy // self.CELL_H), int(dx // self.CELL_W)
+        if layout.weeks[r] is None or layout.outside[r][c]:
+            return None
+        return layout.weeks[r][c]
+
+    def _on_click(self, event):
+        d = self._date_at(event.x, event.y)
+        if d is None:
+            return
+        self.app.select_day(d)
+
+
+class _WeekRow:
+    """One recyclable week row: a frame of labels rebound to whichever week it shows."""
+    __slots__ = ("frame", "month_lbl", "wk_lbl", "cells", "week", "y")
+
+    def __init__(self, frame, month_lbl, wk_lbl, cells):
+        self.frame = frame
+        self.month_lbl = month_lbl
+        self.wk_lbl = wk_lbl
+        self.cells = cells
+        self.week = None  # index of the bound week, or None while pooled
+        self.y = None     # last place() offset
+
+
+class WeekScrollWindow(tk.Toplevel):
+    """Continuously scrolling week rows from FIRST_MONDAY for N_WEEKS weeks.
+
+    Only the rows that fit the viewport plus BUFFER_ROWS above and below exist
+    as widgets. Rows are placed at pixel offsets; one that scrolls out of
+    range goes back to a pool and is rebound to the week coming into view, so
+    widget count and per-step work depend on the window height, never on how
+    far the view has scrolled.
+    """
+    ROW_H = 34
+    BUFFER_ROWS = 2
+    FIRST_MONDAY = date(1900, 1, 1)
+    N_WEEKS = (date(2200, 12, 31) - FIRST_MONDAY).days // 7 + 1
+
+    def __init__(self, master, app):
+        super().__init__(master)
+        self.title("Scrolling Weeks")
+        self.geometry("520x440")
+        self.resizable(True, True)
+        self.configure(bg="#ffffff")
+        self.app = app
+        self.model = app.model
+        self._rows = {}        # week index -> bound _WeekRow
+        self._pool = []        # unbound rows ready for reuse
+        self._options = {}     # widget -> last applied options
+        first = date(app.current_year, app.current_month, 1)
+        self._top_px = self._week_index(first) * self.ROW_H
+        self._repaint = RepaintScheduler(self, self._refresh)
+
+        self._build_ui()
+        self.render()
+        self.model.subscribe(self._on_model_change)
+        self.bind("<Destroy>", self._on_destroy)
+
+    def _week_index(self, d):
+        return (d - self.FIRST_MONDAY).days // 7
+
+    def _monday(self, week):
+        return self.FIRST_MONDAY + timedelta(weeks=week)
+
+    def _build_ui(self):
+        hdr = ttk.Frame(self, padding=(8,8,8,0))
+        hdr.pack(fill="x")
+        ttk.Button(hdr, text="Today", command=self.go_today).pack(side="right")
+        self.lbl_span = ttk.Label(hdr, text="", style="Header.TLabel", anchor="w")
+        self.lbl_span.pack(side="left", fill="x", expand=True)
+
+        body = ttk.Frame(self, padding=8)
+        body.pack(fill="both", expand=True)
+        self.scrollbar = ttk.Scrollbar(body, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        dow = ttk.Frame(body)
+        dow.pack(fill="x")
+        self._grid_columns(dow)
+        ttk.Label(dow, text="", width=9).grid(row=0, column=0)
+        ttk.Label(dow, text="Wk", style="WeekNumHeader.TLabel", width=4, anchor="center").grid(row=0, column=1, sticky="nsew")
+        self.dow_labels = []
+        for i, w in enumerate(WEEKDAYS):
+            lbl = ttk.Label(dow, text=w, style="Dow.TLabel", anchor="center")
+            lbl.grid(row=0, column=i+2, sticky="nsew", padx=2, pady=(0,4))
+            self.dow_labels.append(lbl)
+
+        self.viewport = tk.Frame(body, bg=PALETTE["background"])
+        self.viewport.pack(fill="both", expand=True)
+        # Scrolling and resizing request with no model aspects: bound rows stay valid
+        self.viewport.bind("<Configure>", lambda e: self._repaint.request(set()))
+
+        self.bind("<MouseWheel>", self._on_wheel)
+        self.bind("<Button-4>", lambda e: self.scroll_by(-self.ROW_H))
+        self.bind("<Button-5>", lambda e: self.scroll_by(self.ROW_H))
+        self.bind("<Up>", lambda e: self.scroll_by(-self.ROW_H))
+        self.bind("<Down>", lambda e: self.scroll_by(self.ROW_H))
+        self.bind("<Prior>", lambda e: self.scroll_by(-self._viewport_height()))
+        self.bind("<Next>", lambda e: self.scroll_by(self._viewport_height()))
+        self.bind("<Escape>", lambda e: self.destroy())
+
+    def _grid_columns(self, frame):
+        for c in range(2, 9):
+            frame.grid_columnconfigure(c, weight=1, uniform="day")
+
+    def _new_row(self):
+        frame = ttk.Frame(self.viewport)
+        self._grid_columns(frame)
+        month_lbl = ttk.Label(frame, text="", style="Status.TLabel", width=9, anchor="w")
+        month_lbl.grid(row=0, column=0, sticky="nsew")
+        wk_lbl = ttk.Label(frame, text="", style="WeekNum.TLabel", width=4, anchor="center")
+        wk_lbl.grid(row=0, column=1, sticky="nsew")
+        cells = []
+        for c in range(7):
+            lbl = ttk.Label(frame, text="", style="Day.TLabel", anchor="center")
+            lbl.grid(row=0, column=c+2, sticky="nsew", padx=2, pady=1)
+            lbl.bind("<Button-1>", self._on_click)
+            lbl.date_value = None
+            cells.append(lbl)
+        return _WeekRow(frame, month_lbl, wk_lbl, cells)
+
+    def _config(self, widget, **options):
+        _configure_changed(self._options, widget, widget.config, **options)
+
+    def _viewport_height(self):
+        return max(self.viewport.winfo_height(), self.ROW_H)
+
+    # --- scrolling ---
+
+    def scroll_to(self, top_px):
+        max_top = max(0, self.N_WEEKS * self.ROW_H - self._viewport_height())
+        top_px = max(0, min(int(top_px), max_top))
+        if top_px != self._top_px:
+            self._top_px = top_px
+            self._repaint.request(set())
+
+    def scroll_by(self, dy):
+        self.scroll_to(self._top_px + dy)
+
+    def go_today(self):
+        self.scroll_to(self._week_index(self.model.today) * self.ROW_H)
+
+    def _on_wheel(self, event):
+        # Windows reports multiples of 120 per notch, macOS small deltas
+        rows = max(1, abs(event.delta) // 120)
+        self.scroll_by(-rows * self.ROW_H if event.delta > 0 else rows * self.ROW_H)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(float(amount) * self.N_WEEKS * self.ROW_H)
+        elif unit == "pages":
+            self.scroll_by(int(amount) * self._viewport_height())
+        else:
+            self.scroll_by(int(amount) * self.ROW_H)
+
+    # --- rendering ---
+
+    def _on_model_change(self, aspects, spans):
+        # Rows always show ISO week numbers, so the view option doesn't apply here
+        aspects = aspects - {VIEW}
+        if not aspects or (aspects == {SELECTION} and not touches(spans, *self._bound_span())):
+            return
+        self._repaint.request(aspects, spans)
+
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self.model.unsubscribe(self._on_model_change)
+
+    def _bound_span(self):
+        if not self._rows:
+            return self.FIRST_MONDAY, self.FIRST_MONDAY
+        return self._monday(min(self._rows)), self._monday(max(self._rows)) + timedelta(days=6)
+
+    def _refresh(self):
+        dirty = self._repaint.dirty
+        if dirty is None or dirty & {EVENTS, CALENDAR}:
+            # Events or working days changed: rebind the rows already showing
+            for week, row in self._rows.items():
+                self._bind_row(row, week)
+        elif SELECTION in dirty:
+            self.restyle()
+        self.render()
+
+    @profiled
+    def render(self):
+        self._repaint.rendered()
+        height = self._viewport_height()
+        first = self._top_px // self.ROW_H
+        last = min(self.N_WEEKS - 1, (self._top_px + height - 1) // self.ROW_H)
+        lo = max(0, first - self.BUFFER_ROWS)
+        hi = min(self.N_WEEKS - 1, last + self.BUFFER_ROWS)
+
+        # Recycle rows that left the buffered range
+        for week in [w for w in self._rows if w < lo or w > hi]:
+            row = self._rows.pop(week)
+            row.week = None
+            self._pool.append(row)
+        for week in range(lo, hi + 1):
+            row = self._rows.get(week)
+            if row is None:
+                row = self._pool.pop() if self._pool else self._new_row()
+                self._bind_row(row, week)
+                self._rows[week] = row
+            y = week * self.ROW_H - self._top_px
+            if row.y != y:
+                row.frame.place(x=0, y=y, relwidth=1, height=self.ROW_H)
+                row.y = y
+        # Pooled rows left over after a shrink are hidden until needed again
+        for row in self._pool:
+            if row.y is not None:
+                row.frame.place_forget()
+                row.y = None
+
+        total = self.N_WEEKS * self.ROW_H
+        self.scrollbar.set(self._top_px / total, min(1.0, (self._top_px + height) / total))
+        top, bottom = self._monday(first), self._monday(last) + timedelta(days=6)
+        self._config(self.lbl_span, text=f"{top:%b %Y} – {bottom:%b %Y}")
+        for lbl, off in zip(self.dow_labels, days_off_columns(self.model.work_pattern)):
+            self._config(lbl, style="DowWeekend.TLabel" if off else "Dow.TLabel")
+
+    def _bind_row(self, row, week):
+        row.week = week
+        monday = self._monday(week)
+        sunday = monday + timedelta(days=6)
+        # Label the row holding the 1st of a month
+        starts_month = monday.day == 1 or sunday.day < monday.day
+        first_of_month = sunday.replace(day=1) if starts_month else None
+        self._config(row.month_lbl, text=f"{first_of_month:%b %Y}" if first_of_month else "")
+        self._config(row.wk_lbl, text=str(monday.isocalendar()[1]))
+        counts = self.app.event_store.counts_by_day(monday, sunday)
+        lo, hi = self.model.selection_range()
+        for c, lbl in enumerate(row.cells):
+            d = monday + timedelta(days=c)
+            lbl.date_value = d
+            self._config(lbl, text=_day_text(d, counts[c]), **self._cell_style(d, lo, hi))
+
+    def _cell_style(self, d, lo, hi):
+        off = self.app._is_day_off(d)
+        return {"style": self.app._resolve_style(d, off, lo, hi),
+                "foreground": PALETTE["weekend_fg"] if off else PALETTE["day_fg"]}
+
+    def restyle(self):
+        """Re-resolve highlight styles of the bound rows (after a selection change)."""
+        lo, hi = self.model.selection_range()
+        for row in self._rows.values():
+            for lbl in row.cells:
+                self._config(lbl, **self._cell_style(lbl.date_value, lo, hi))
+
+    def _on_click(self, event):
+        self.app._on_day_click(event)
+
+
+class UKCalendarApp(ttk.Frame):
+    def __init__(self, master):
+        super().__init__(master)
+        self.master = master
+        self.pack(fill="both", expand=True)
+
+        # Selection, range, highlighted result, week numbers and working-day settings
+        # are shared with every open view through the model; the month shown is ours
+        self.model = CalendarModel(UK_CALENDAR, "england-wales")
+        self._business_calendars = {(self.model.region, None): UK_CALENDAR}
+        self.current_year = self.model.today.year
+        self.current_month = self.model.today.month
+        self.show_range_stats = False  # range details panel expanded
+        self._weeknums_shown = None
+
+        # Last-applied widget options (see _apply) and Tk config() counters
+        self._applied = {}
+        self.tk_calls = 0
+        self.last_render_tk_calls = 0
+        self._prefetch_job = None
+        self._repaint = RepaintScheduler(self, self.render_month)
+        self.model.subscribe(self._repaint.request)
+
+        # Appointments; fall back to an in-memory store if the database can't be opened
+        try:
+            self.event_store = EventStore(calendar=self.model.business_calendar)
+        except Exception:
+            self.event_store = EventStore(path=None, calendar=self.model.business_calendar)
+        self._import = None  # (queue, file size, [rows imported]) while an .ics import runs
+        self._busy_cache = None  # (files, first, last, BusyUnion) of the last free-slot search
+
+        # Opt-in hot-path timings (SMART_CALENDAR_PROFILE, or View → Record Timings)
+        if profiling.enable_from_env() is not None:
+            profiling.enable(self._swap_tk_counter(True))
+
+        self._build_style()
+        self._build_menu()
+        self._build_header()
+        self._build_calendar_area()
+
+        self.master.bind("<Left>", lambda e: self.prev_month())
+        self.master.bind("<Right>", lambda e: self.next_month())
+        self.master.bind("t", lambda e: self.go_today())
+        self.master.bind("<Escape>", lambda e: self.reset_to_default())
+
+        self.render_month()
+
+    def _build_style(self):
+        style = ttk.Style()
+        if "vista" in style.theme_names():
+            style.theme_use("vista")
+
+        base_font = ("Segoe UI", 10)
+        italic_font = ("Segoe UI", 10, "italic")
+
+        style.configure("Day.TLabel", padding=4, anchor="center", font=base_font)
+        style.configure("Dow.TLabel", foreground=PALETTE["dow_fg"], padding=4, font=base_font)
+        style.configure("DowWeekend.TLabel", foreground=PALETTE["dow_weekend_fg"], padding=4, font=italic_font)
+        style.configure("WeekNum.TLabel", foreground=PALETTE["weeknum_fg"], background=PALETTE["weeknum_bg"], font=base_font, padding=(2,1))
+        style.configure("WeekNumHeader.TLabel", foreground=PALETTE["weeknum_fg"], background=PALETTE["weeknum_bg"], font=base_font)
+
+        style.configure("Header.TLabel", font=("Segoe UI", 14, "bold"))
+        style.configure("Today.TLabel", background=PALETTE["today"], font=base_font)
+        style.configure("Selected.TLabel", background=PALETTE["selected"], font=base_font)
+        style.configure("Result.TLabel", background=PALETTE["result"], font=base_font)
+
+        style.configure("Weekend.TLabel", foreground="#B3B3B3", font=italic_font)
+        style.configure("Hover.TLabel", background=PALETTE["hover"], font=base_font, anchor="center")
+
+        # --- New: styles for range highlighting ---
+        style.configure("Range.TLabel", background=PALETTE["range"], font=base_font)           # general in-range
+        style.configure("RangeEdge.TLabel", background=PALETTE["range_edge"], font=base_font)  # start/end
+
+        style.configure("Nav.TButton", padding=(8,4))
+        style.configure("Status.TLabel", foreground="#666666")
+        style.configure("Stats.TLabel", foreground="#444444", font=("Consolas", 9), padding=(8, 0, 8, 6))
+
+    def _build_menu(self):
+        menubar = tk.Menu(self.master)
+        self.master.config(menu=menubar)
+
+        m_file = tk.Menu(menubar, tearoff=False)
+        m_file.add_command(label="Go to Today\tT", command=self.go_today)
+        m_file.add_separator()
+        m_file.add_command(label="Exit", command=self.master.destroy)
+        menubar.add_cascade(label="File", menu=m_file)
+
+        m_tools = tk.Menu(menubar, tearoff=False)
+        m_tools.add_command(label="Add Working Days…", command=self.open_working_days_dialog)
+        m_tools.add_command(label="Add Event…", command=self.open_add_event_dialog)
+        m_tools.add_command(label="Show 3-Month View…", command=self.open_three_month_view)
+        m_tools.add_command(label="Show Year View…", command=self.open_year_view)
+        m_tools.add_command(label="Show Scrolling Weeks…", command=self.open_week_scroll)
+        m_tools.add_command(label="Find Free Slot…", command=self.open_free_slot_dialog)
+        m_tools.add_separator()
+        m_tools.add_command(label="Import .ics…", command=self.import_ics)
+        m_tools.add_command(label="Export Range to .ics…", command=self.export_ics)
+        m_tools.add_command(label="Export Year Planner…", command=self.export_planner)
+        menubar.add_cascade(label="Tools", menu=m_tools)
+
+        m_view = tk.Menu(menubar, tearoff=False)
+        self._weeknum_var = tk.BooleanVar(value=self.model.show_week_numbers)
+        m_view.add_checkbutton(label="Show Week Numbers", onvalue=True, offvalue=False,
+                               variable=self._weeknum_var, command=self._toggle_week_numbers)
+        # Regions load from the memory-mapped holiday cache, so switching is instant
+        m_region = tk.Menu(m_view, tearoff=False)
+        self._region_var = tk.StringVar(value=self.model.region)
+        for key, (label, _) in REGIONS.items():
+            m_region.add_radiobutton(label=label, value=key, variable=self._region_var,
+                                     command=self._select_region)
+        m_view.add_cascade(label="Bank Holidays", menu=m_region)
+        m_pattern = tk.Menu(m_view, tearoff=False)
+        self._pattern_var = tk.StringVar(value=self.model.work_pattern_key)
+        for key, (label, _) in WORK_PATTERNS.items():
+            m_pattern.add_radiobutton(label=label, value=key, variable=self._pattern_var,
+                                      command=self._select_work_pattern)
+        m_view.add_cascade(label="Working Pattern", menu=m_pattern)
+        # Optional helper to clear range quickly
+        m_view.add_separator()
+        m_view.add_command(label="Clear Range Selection", command=self._clear_range_selection)
+        m_view.add_separator()
+        self._profiling_var = tk.BooleanVar(value=profiling.is_enabled())
+        m_view.add_checkbutton(label="Record Timings", onvalue=True, offvalue=False,
+                               variable=self._profiling_var, command=self._toggle_profiling)
+        m_view.add_command(label="Save Timings…", command=self.save_profile)
+        menubar.add_cascade(label="View", menu=m_view)
+
+    def _select_region(self):
+        self._update_business_calendar(self._region_var.get(), self.model.work_pattern_key)
+
+    def _select_work_pattern(self):
+        self._update_business_calendar(self.model.region, self._pattern_var.get())
+
+    def _update_business_calendar(self, region, pattern_key):
+        pattern = WORK_PATTERNS[pattern_key][1]
+        cal = self._business_calendars.get((region, pattern))
+        if cal is None:
+            cal = self._business_calendars[region, pattern] = region_calendar(region).with_pattern(pattern)
+        self.event_store.set_calendar(cal)
+        self.model.update(region=region, work_pattern_key=pattern_key, work_pattern=pattern,
+                          business_calendar=cal)
+
+    def _swap_tk_counter(self, counting):
+        """Point every widget's .tk at a TkCallCounter (or back at the real interpreter)."""
+        root = self._root()
+        tkapp = root.tk
+        if isinstance(tkapp, profiling.TkCallCounter):
+            tkapp = tkapp._tkapp
+        target = profiling.TkCallCounter(tkapp) if counting else tkapp
+        # New widgets copy their master's .tk, so only the existing tree needs updating
+        stack = [root]
+        while stack:
+            widget = stack.pop()
+            widget.tk = target
+            stack.extend(widget.children.values())
+        return target
+
+    def _toggle_profiling(self):
+        if self._profiling_var.get():
+            profiling.enable(self._swap_tk_counter(True))
+        else:
+            profiling.disable()
+            self._swap_tk_counter(False)
+
+    def save_profile(self):
+        prof = profiling.profiler()
+        if prof is None or not prof.timings:
+            messagebox.showinfo("Save Timings", "Nothing recorded yet: turn on View → Record Timings first.")
+            return
+        path = filedialog.asksaveasfilename(
+            parent=self.master, title="Save Timings", defaultextension=".json",
+            initialfile="calendar_timings.json", filetypes=[("JSON", "*.json")])
+        if not path:
+            return
+        try:
+            prof.dump(path)
+        except OSError as exc:
+            messagebox.showerror("Save Timings", str(exc))
+            return
+        self._apply(self.status, text=f"Saved timings for {len(prof.timings)} functions to {os.path.basename(path)}")
+
+    def _toggle_week_numbers(self):
+        self.model.update(show_week_numbers=bool(self._weeknum_var.get()))
+
+    def _build_header(self):
+        hdr = ttk.Frame(self, padding=(8, 8, 8, 0))
+        hdr.pack(fill="x")
+
+        ttk.Button(hdr, text="◀", style="Nav.TButton", command=self.prev_month, width=3).pack(side="left")
+        self.lbl_month = ttk.Label(hdr, text="", style="Header.TLabel", anchor="center")
+        self.lbl_month.pack(side="left", expand=True)
+        ttk.Button(hdr, text="▶", style="Nav.TButton", command=self.next_month, width=3).pack(side="right")
+
+    def _build_calendar_area(self):
+        self.calendar_area = ttk.Frame(self, padding=(8,8,8,8))
+        self.calendar_area.pack(fill="both", expand=True)
+
+        # Column 0 holds week numbers; it is always built and only gridded while
+        # they are shown (see _set_week_number_column)
+        self.dow = ttk.Frame(self.calendar_area)
+        self.dow.pack(fill="x")
+        self.weeknum_header = ttk.Label(self.dow, text="Wk", style="WeekNumHeader.TLabel", anchor="center")
+        self.weeknum_header.grid(row=0, column=0, sticky="nsew", padx=(0,4))
+        self.dow_labels = []
+        for i, w in enumerate(WEEKDAYS):
+            style_name = "DowWeekend.TLabel" if i >= 5 else "Dow.TLabel"
+            lbl = ttk.Label(self.dow, text=w, style=style_name, anchor="center")
+            lbl.grid(row=0, column=i+1, sticky="nsew", padx=2, pady=(0,6))
+            self.dow.grid_columnconfigure(i+1, weight=1)
+            self.dow_labels.append(lbl)
+            self._applied[lbl] = {"style": style_name}
+
+        self.grid_frame = ttk.Frame(self.calendar_area)
+        self.grid_frame.pack(fill="both", expand=True)
+
+        self.day_labels = []
+        self.weeknum_labels = []
+        cell_tag = _cell_bindtag(self, {"<Button-1>": self._on_day_click, "<Enter>": self._on_day_enter,
+                                        "<Leave>": self._on_day_leave})
+        for r in range(6):
+            wk_label = ttk.Label(self.grid_frame, text="", style="WeekNum.TLabel", anchor="center")
+            wk_label.configure(background=PALETTE["weeknum_bg"])
+            wk_label.grid(row=r, column=0, sticky="nsew", padx=(0,4), pady=2, ipadx=3)
+            self.weeknum_labels.append(wk_label)
+
+            row_labels = []
+            for c in range(7):
+                lbl = ttk.Label(self.grid_frame, text="", style="Day.TLabel", anchor="center")
+                lbl.grid(row=r, column=c+1, sticky="nsew", padx=2, pady=2, ipadx=6, ipady=6)
+                _join_bindtag(lbl, cell_tag)
+                lbl.date_value = None
+                lbl.rest_style = "Day.TLabel"
+                row_labels.append(lbl)
+                self.grid_frame.grid_columnconfigure(c+1, weight=1)
+            self.day_labels.append(row_labels)
+            self.grid_frame.grid_rowconfigure(r, weight=1)
+
+        self.status = ttk.Label(self, text="", style="Status.TLabel", anchor="w")
+        self.status.pack(fill="x", padx=8, pady=(0,6))
+
+        # Expandable range breakdown under the status line (packed only while a range is selected)
+        self.stats_toggle = ttk.Label(self, text="", style="Status.TLabel", anchor="w", cursor="hand2")
+        self.stats_toggle.bind("<Button-1>", self._toggle_range_stats)
+        self.stats_panel = ttk.Label(self, text="", style="Stats.TLabel", anchor="w", justify="left", wraplength=420)
+        self._stats_packed = (False, False)
+
+    def reset_to_default(self):
+        # Clear selections and highlights and reset view options to defaults
+        self._weeknum_var.set(False)
+        self.model.update(range_start=None, range_end=None, selected_date=None, highlighted_result=None,
+                          today=date.today(), show_week_numbers=False)
+        # Reset to today's month
+        self.current_year = self.model.today.year
+        self.current_month = self.model.today.month
+        self._repaint.request()
+
+    def _set_week_number_column(self, show):
+        """grid()/grid_remove() the Wk column; the labels themselves are kept."""
+        for lbl in (self.weeknum_header, *self.weeknum_labels):
+            if show:
+                lbl.grid()
+            else:
+                lbl.grid_remove()
+        self._weeknums_shown = show
+
+    def _resolve_style(self, d: date, weekend: bool, lo, hi) -> str:
+        model = self.model
+        # Range highlighting takes precedence
+        if lo is not None and lo <= d <= hi:
+            return "RangeEdge.TLabel" if d == lo or d == hi else "Range.TLabel"
+        if d == model.today:
+            return "Today.TLabel"
+        if model.highlighted_result == d:
+            return "Result.TLabel"
+        if model.selected_date == d:
+            return "Selected.TLabel"
+        # Weekend colouring only applies inside the displayed month
+        return "Weekend.TLabel" if weekend else "Day.TLabel"
+
+    def _is_day_off(self, d: date) -> bool:
+        pattern = self.model.work_pattern
+        if pattern is None:
+            return d.weekday() >= 5
+        return not pattern.is_working_day(d)
+
+    def _style_grid(self, layout):
+        """Styles for all 6x7 cells of a layout, normalizing the selection once."""
+        lo, hi = self.model.selection_range()
+        return [
+            None if week is None else
+            [self._resolve_style(d, weekend, lo, hi) for d, weekend in zip(week, weekend_row)]
+            for week, weekend_row in zip(layout.weeks, layout.weekend)
+        ]
+
+    def _apply(self, widget, **options):
+        if _configure_changed(self._applied, widget, widget.config, **options):
+            self.tk_calls += 1
+
+    @profiled
+    def render_month(self):
+        self._repaint.rendered()
+        calls_before = self.tk_calls
+        model = self.model
+        show_week_numbers = model.show_week_numbers
+        if show_week_numbers != self._weeknums_shown:
+            self._set_week_number_column(show_week_numbers)
+        layout = month_layout(self.current_year, self.current_month, model.work_pattern)
+        styles = self._style_grid(layout)
+        first, last = grid_span(layout)
+        counts = self.event_store.counts_by_day(first, last)
+
+        month_name = date(self.current_year, self.current_month, 1).strftime("%B %Y")
+        self._apply(self.lbl_month, text=month_name)
+        for lbl, off in zip(self.dow_labels, days_off_columns(model.work_pattern)):
+            self._apply(lbl, style="DowWeekend.TLabel" if off else "Dow.TLabel")
+
+        for r, week in enumerate(layout.weeks):
+            if show_week_numbers:
+                self._apply(self.weeknum_labels[r], text=str(layout.week_numbers[r]) if week else "")
+            for c in range(7):
+                lbl = self.day_labels[r][c]
+                if week is None:
+                    self._apply(lbl, text="", style="Day.TLabel", foreground=PALETTE["day_fg"])
+                    lbl.date_value = None
+                    lbl.rest_style = "Day.TLabel"
+                    continue
+                day = week[c]
+                if layout.outside[r][c]:
+                    fg = PALETTE["outside_fg"]
+                else:
+                    fg = PALETTE["weekend_fg"] if layout.weekend[r][c] else PALETTE["day_fg"]
+                events = counts[r * 7 + c]
+                self._apply(lbl, text=_day_text(day, events), style=styles[r][c], foreground=fg)
+                lbl.date_value = day
+                lbl.rest_style = styles[r][c]
+
+        # Status text
+        a, b = model.selection_range()
+        if a is not None:
+            total_days = (b - a).days + 1
+            workdays = model.business_calendar.working_days_between(a, b)
+            status = f"Range: {a.strftime(DATE_FMT)} → {b.strftime(DATE_FMT)} | Days: {total_days} | Working days: {workdays}"
+        elif model.range_start:
+            status = f"Range start: {model.range_start.strftime(DATE_FMT)} (click another date to complete range)"
+        elif model.selected_date:
+            status = f"Selected: {model.selected_date.strftime(DATE_FMT)}"
+        else:
+            status = f"Today: {model.today.strftime(DATE_FMT)}"
+        self._apply(self.status, text=status)
+        self._render_range_stats()
+
+        self.last_render_tk_calls = self.tk_calls - calls_before
+
+        # Have the neighbouring months ready before the next arrow press
+        if self._prefetch_job is not None:
+            self.after_cancel(self._prefetch_job)
+        self._prefetch_job = self.after_idle(self._prefetch_adjacent)
+
+    def _toggle_range_stats(self, event=None):
+        self.show_range_stats = not self.show_range_stats
+        self._render_range_stats()
+
+    def _render_range_stats(self):
+        lo, hi = self.model.selection_range()
+        packed = (lo is not None, lo is not None and self.show_range_stats)
+        if packed != self._stats_packed:
+            # Re-pack in order so the panel always sits under the toggle
+            self.stats_toggle.pack_forget()
+            self.stats_panel.pack_forget()
+            if packed[0]:
+                self.stats_toggle.pack(fill="x", padx=8, pady=(0, 4))
+            if packed[1]:
+                self.stats_panel.pack(fill="x")
+            self._stats_packed = packed
+        if lo is None:
+            return
+        self._apply(self.stats_toggle, text=("▾" if self.show_range_stats else "▸") + " Range details")
+        if self.show_range_stats:
+            self._apply(self.stats_panel, text=self._range_stats_text(lo, hi))
+
+    def _range_stats_text(self, lo, hi):
+        cal = self.model.business_calendar
+        st = range_stats(lo, hi, cal)
+        lines = [
+            "  ".join(f"{name} {n}" for name, n in zip(WEEKDAYS, st.weekday_counts)),
+            f"Days off: {st.weekend_days} | Holidays: {st.holidays} | Months: {st.months}",
+            f"ISO weeks: {st.iso_weeks} ({st.full_weeks} full, {st.partial_weeks} partial)",
+        ]
+        # Breakdowns are generated lazily; only the first rows are ever computed
+        months = [f"{date(y, m, 1):%b %Y} {w}/{n}" for y, m, n, w in islice(iter_months(st, cal), STATS_ROWS)]
+        lines.append("Working/days per month: " + ", ".join(months) + _more(st.months, STATS_ROWS))
+        weeks = [f"{y}-W{wk:02d} {w}/{n}" for y, wk, n, w in islice(iter_iso_weeks(st, cal), STATS_ROWS)]
+        lines.append("Working/days per ISO week: " + ", ".join(weeks) + _more(st.iso_weeks, STATS_ROWS))
+        return "\n".join(lines)
+
+    def _prefetch_adjacent(self):
+        self._prefetch_job = None
+        prefetch_months(self.current_year, self.current_month, (-1, 1), self.model.work_pattern)
+
+    def prev_month(self):
+        if self.current_month == 1:
+            self.current_month = 12
+            self.current_year -= 1
+        else:
+            self.current_month -= 1
+        self._repaint.request()
+
+    def next_month(self):
+        if self.current_month == 12:
+            self.current_month = 1
+            self.current_year += 1
+        else:
+            self.current_month += 1
+        self._repaint.request()
+
+    def go_today(self):
+        self.show_month(self.model.today)
+        self.model.update(selected_date=self.model.today)
+
+    def show_month(self, d: date):
+        """Page the main grid to d's month (repainted with the next model change or idle)."""
+        if (d.year, d.month) != (self.current_year, self.current_month):
+            self.current_year, self.current_month = d.year, d.month
+            self._repaint.request()
+
+    def _clear_range_selection(self):
+        self.model.update(range_start=None, range_end=None)
+
+    def _on_day_click(self, event):
+        d = getattr(event.widget, "date_value", None)
+        if d is not None:
+            self.select_day(d)
+
+    def select_day(self, d: date):
+        """Click handling shared by all views: select d and extend/restart the range."""
+        model = self.model
+        # A full range (or none) starts a new one; a pending start is completed
+        if model.range_start is None or model.range_end is not None:
+            start, end = d, None
+        else:
+            start, end = model.range_start, d
+
+        # Keep selected_date for single-date highlight while picking
+        model.update(range_start=start, range_end=end, selected_date=d)
+
+        # If clicked date is in another month, navigate there (so user sees the range end)
+        self.show_month(d)
+
+    # Each cell carries its resting style from the last render, so hover is a
+    # single style swap with no style resolution or Tk queries
+    @profiled
+    def _on_day_enter(self, event):
+        lbl = event.widget
+        if lbl.date_value is not None:
+            self._apply(lbl, style="Hover.TLabel")
+
+    @profiled
+    def _on_day_leave(self, event):
+        lbl = event.widget
+        if lbl.date_value is not None:
+            self._apply(lbl, style=lbl.rest_style)
+
+    def open_working_days_dialog(self):
+        def on_done(start, days, result):
+            self.model.update(highlighted_result=result)
+            self.show_month(result)
+            messagebox.showinfo(
+                "Result",
+                f"Start: {start.strftime(DATE_FMT)}\n"
+                f"Working days: {days}\n"
+                f"Result: {result.strftime(DATE_FMT)}"
+            )
+        WorkingDaysDialog(self.master, on_done, self.model.business_calendar)
+
+    def open_add_event_dialog(self):
+        def on_done(title, start, end, rule):
+            if rule is None:
+                self.event_store.add(title, start, end)
+                self.model.events_changed(start, end)
+            else:
+                self.event_store.add_series(title, rule)
+                self.model.events_changed()
+            self.event_store.flush()
+        AddEventDialog(self.master, on_done, start=self.model.selected_date,
+                       business_calendar=self.model.business_calendar)
+
+    def _busy_union(self, paths, first, last):
+        """Everyone's busy time over first..last, merged once per set of calendars.
+
+        Reading and merging a thousand calendars takes a second or two, so the
+        BusyUnion is kept and reused while the same files, unchanged, are
+        searched again within the dates already loaded.
+        """
+        files = tuple((p, os.stat(p).st_mtime_ns) for p in paths)
+        cached = self._busy_cache
+        if cached is not None and cached[0] == files and cached[1] <= first and last <= cached[2]:
+            return cached[3]
+        union = BusyUnion([BusySchedule(ics.read_busy(p, first, last)) for p in paths])
+        self._busy_cache = (files, first, last, union)
+        return union
+
+    def open_free_slot_dialog(self):
+        def on_done(paths, start, duration, count, day_start, day_end):
+            t0 = time.perf_counter()
+            try:
+                busy = self._busy_union(paths, start, start + timedelta(days=HORIZON_DAYS))
+            except OSError as exc:
+                messagebox.showerror("Find Free Slot", str(exc))
+                return
+            slots = find_free_slots(busy, datetime.combine(start, day_start), duration, count,
+                                    day_start, day_end, business_calendar=self.model.business_calendar)
+            elapsed_ms = (time.perf_counter() - t0) * 1000
+            if not slots:
+                messagebox.showinfo("Find Free Slot", f"No common free slot in the next {HORIZON_DAYS} days.")
+                return
+            # Show the earliest slot's day, as the working-days result is shown
+            first = slots[0][0].date()
+            self.model.update(highlighted_result=first)
+            self.show_month(first)
+            lines = [f"{s:%a} {s.strftime(DATE_FMT)}  {s:%H:%M}–{e:%H:%M}" for s, e in slots]
+            messagebox.showinfo(
+                "Free Slots",
+                f"{len(paths)} calendars, {duration.seconds // 60} min or longer "
+                f"(found in {elapsed_ms:.1f} ms):\n\n" + "\n".join(lines))
+        FreeSlotDialog(self.master, on_done, start=self.model.selected_date)
+
+    def import_ics(self):
+        if self._import is not None:
+            messagebox.showinfo("Import", "An import is already running.")
+            return
+        path = filedialog.askopenfilename(
+            parent=self.master, title="Import .ics",
+            filetypes=[("iCalendar", "*.ics"), ("All files", "*.*")])
+        if not path:
+            return
+        # Parsing happens off the Tk thread; batches are drained by _poll_import
+        q = ics.new_import_queue()
+        self._import = (q, os.path.getsize(path) or 1, [0])
+        ics.start_import_thread(path, q)
+        self.after(IMPORT_POLL_MS, self._poll_import)
+
+    def _poll_import(self):
+        q, size, imported = self._import
+        deadline = time.perf_counter() + IMPORT_SLICE_MS / 1000
+        while time.perf_counter() < deadline:
+            try:
+                kind, payload, consumed = q.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "batch":
+                # Index once at the end rather than after every batch
+                self.event_store.add_many(
+                    [row[1:] for row in payload if row[0] == "event"], reindex=False)
+                for row in payload:
+                    if row[0] == "series":
+                        self.event_store.add_series(row[1], row[2])
+                imported[0] += len(payload)
+                self._apply(self.status, text=f"Importing… {imported[0]} events ({100 * consumed // size}%)")
+                continue
+            self._import = None
+            self.event_store.reindex()
+            self.event_store.flush()
+            self.model.events_changed()
+            # Paint now so the status message below isn't overwritten by the queued repaint
+            self.render_month()
+            if kind == "done":
+                self._apply(self.status, text=f"Imported {payload} events")
+            else:
+                messagebox.showerror("Import failed", payload)
+            return
+        self.after(IMPORT_POLL_MS, self._poll_import)
+
+    def export_ics(self):
+        a, b = self.model.selection_range()
+        if a is None:
+            messagebox.showinfo("Export", "Select a date range first (click a start and an end date).")
+            return
+        path = filedialog.asksaveasfilename(
+            parent=self.master, title="Export Range to .ics", defaultextension=".ics",
+            initialfile=f"calendar_{a:%Y%m%d}_{b:%Y%m%d}.ics",
+            filetypes=[("iCalendar", "*.ics")])
+        if not path:
+            return
+        try:
+            count = ics.export_ics(path, self.event_store, a, b)
+        except OSError as exc:
+            messagebox.showerror("Export failed", str(exc))
+            return
+        self._apply(self.status, text=f"Exported {count} events to {os.path.basename(path)}")
+
+    def export_planner(self):
+        """Write the shown year, with the current highlights, to PDF/SVG/PNG."""
+        model = self.model
+        path = filedialog.asksaveasfilename(
+            parent=self.master, title="Export Year Planner", defaultextension=".pdf",
+            initialfile=f"planner_{self.current_year}.pdf",
+            filetypes=[("PDF", "*.pdf"), ("SVG", "*.svg"), ("PNG", "*.png")])
+        if not path:
+            return
+        lo, hi = model.selection_range()
+        try:
+            calendar_render.export(
+                path, "year", [self.current_year], pattern_key=model.work_pattern_key,
+                week_numbers=model.show_week_numbers, selection=(lo, hi) if lo else None,
+                today=model.today, result=model.highlighted_result, selected=model.selected_date)
+        except (OSError, RuntimeError, ValueError) as exc:
+            messagebox.showerror("Export failed", str(exc))
+            return
+        self._apply(self.status, text=f"Exported {self.current_year} planner to {os.path.basename(path)}")
+
+    def open_three_month_view(self):
+        ThreeMonthWindow(self.master, style_helper=self)
+
+    def open_year_view(self):
+        YearViewWindow(self.master, self)
+
+    def open_week_scroll(self):
+        WeekScrollWindow(self.master, self)
+
+def main():
+    # The .ico icon is a Windows-only nicety; elsewhere skip the disk I/O
+    if os.name == "nt":
+        _create_blank_icon_if_needed(ICON_PATH)
+
+    root = tk.Tk()
+    root.title(APP_TITLE)
+    root.geometry("440x460")
+    root.minsize(360, 360)
+
+    try:
+        if os.name == "nt" and os.path.isfile(ICON_PATH):
+            root.iconbitmap(default=ICON_PATH)
+    except Exception:
+        pass
+
+    app = UKCalendarApp(root)
+    root.mainloop()
+    app.event_store.close()
+
+if __name__ == "__main__":
+    main()
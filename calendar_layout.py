@@ -0,0 +1,83 @@
+"""Precomputed month grid layouts shared by the calendar views (no GUI dependencies)."""
+import calendar
+from collections import namedtuple
+from datetime import date
+from functools import lru_cache
+
+# weeks: 6 rows of 7 dates (Monday first); rows past the month's last week are None
+# week_numbers: ISO week of each row's Monday (None for padding rows)
+# outside: per-cell True when the date belongs to the previous/next month
+# weekend: per-cell True for days off inside the month (Sat/Sun, or per the
+#   WorkPattern the layout was built for)
+MonthLayout = namedtuple("MonthLayout", "year month weeks week_numbers outside weekend")
+
+_MONDAY_FIRST = calendar.Calendar(firstweekday=0)
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]  # column headings, Monday first
+
+
+@lru_cache(maxsize=64)
+def month_layout(year: int, month: int, pattern=None) -> MonthLayout:
+    """Grid for a month; pattern (a workdays.WorkPattern) decides which days are off."""
+    weeks = [tuple(week) for week in _MONDAY_FIRST.monthdatescalendar(year, month)[:6]]
+    week_numbers = [week[0].isocalendar()[1] for week in weeks]
+    outside = [tuple(d.month != month for d in week) for week in weeks]
+    if pattern is None:
+        weekend = [tuple(c >= 5 and not out for c, out in enumerate(row)) for row in outside]
+    else:
+        weekend = [tuple(not out and not pattern.is_working_day(d) for d, out in zip(week, row))
+                   for week, row in zip(weeks, outside)]
+    while len(weeks) < 6:
+        weeks.append(None)
+        week_numbers.append(None)
+        outside.append(None)
+        weekend.append(None)
+    return MonthLayout(year, month, tuple(weeks), tuple(week_numbers), tuple(outside), tuple(weekend))
+
+
+def days_off_columns(pattern=None):
+    """Per weekday column (Mon..Sun), True when that weekday is always a day off.
+
+    Rotations that do not repeat weekly have no fixed weekend columns.
+    """
+    if pattern is None:
+        return (False,) * 5 + (True,) * 2
+    if 7 % len(pattern.mask):
+        return (False,) * 7
+    return tuple(not pattern.is_working_day(date.fromordinal(c + 1)) for c in range(7))  # ordinal 1 is a Monday
+
+
+def grid_span(layout: MonthLayout):
+    """First and last date shown in a layout's grid."""
+    last_week = [week for week in layout.weeks if week is not None][-1]
+    return layout.weeks[0][0], last_week[-1]
+
+
+def shift_month(year: int, month: int, n: int):
+    """(year, month) n months after (negative: before) the given month."""
+    y, m = divmod(year * 12 + month - 1 + n, 12)
+    return y, m + 1
+
+
+def prefetch_months(year: int, month: int, offsets, pattern=None):
+    """Warm the layout cache for months at the given offsets from (year, month)."""
+    for n in offsets:
+        month_layout(*shift_month(year, month, n), pattern)
+
+
+# Colour scheme shared by the Tk styles and the canvas-drawn views
+PALETTE = {
+    "background": "#FFFFFF",
+    "day_fg": "#333333",
+    "weekend_fg": "#9E9E9E",
+    "outside_fg": "#C8C8C8",
+    "dow_fg": "#555555",
+    "dow_weekend_fg": "#9A9A9A",
+    "weeknum_fg": "#003366",
+    "weeknum_bg": "#FFF9C4",
+    "today": "#9eccff",
+    "selected": "#DDEEFF",
+    "result": "#D9F7BE",
+    "range": "#FFECC7",
+    "range_edge": "#FFD89A",
+    "hover": "#FFF7DA",
+}
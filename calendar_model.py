@@ -0,0 +1,104 @@
+"""Observable state shared by every calendar window.
+
+One CalendarModel holds the selection, range, highlighted result, view
+options and working-day settings. Views subscribe a listener and are told
+what changed: a set of aspects, and the date spans whose appearance may
+differ (None when every date may be affected). Listeners only queue a
+repaint (see calendar_gui.RepaintScheduler), so any number of changes made
+in one event handler become one repaint per window.
+"""
+from datetime import date
+
+# Aspects reported to listeners
+SELECTION = "selection"  # selected date, range, highlighted result, today
+VIEW = "view"            # view options (week numbers)
+CALENDAR = "calendar"    # bank-holiday region and work pattern
+EVENTS = "events"        # event store contents
+
+_FIELDS = {
+    "today": SELECTION,
+    "selected_date": SELECTION,
+    "highlighted_result": SELECTION,
+    "range_start": SELECTION,
+    "range_end": SELECTION,
+    "show_week_numbers": VIEW,
+    "region": CALENDAR,
+    "work_pattern_key": CALENDAR,
+    "work_pattern": CALENDAR,
+    "business_calendar": CALENDAR,
+}
+
+
+def touches(spans, first: date, last: date) -> bool:
+    """True if any dirty span (or "everything", None) overlaps first..last."""
+    return spans is None or any(lo <= last and first <= hi for lo, hi in spans)
+
+
+class CalendarModel:
+    """Selection and settings state; views observe it instead of copying it."""
+
+    def __init__(self, business_calendar, region, work_pattern_key="mon-fri", work_pattern=None):
+        self.today = date.today()
+        self.selected_date = None
+        self.highlighted_result = None  # from working-days calc / free-slot search
+        self.range_start = None
+        self.range_end = None
+        self.show_week_numbers = False
+        # Working days exclude the region's bank holidays and follow the work
+        # pattern (None is Mon-Fri); business_calendar combines the two
+        self.region = region
+        self.work_pattern_key = work_pattern_key
+        self.work_pattern = work_pattern
+        self.business_calendar = business_calendar
+        self._listeners = []
+
+    def subscribe(self, listener):
+        """Call listener(aspects, spans) after every change."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def selection_range(self):
+        """The completed range as (first, last), or (None, None)."""
+        if self.range_start and self.range_end:
+            return min(self.range_start, self.range_end), max(self.range_start, self.range_end)
+        return None, None
+
+    def _range_footprint(self):
+        lo, hi = self.selection_range()
+        if lo is not None:
+            return [(lo, hi)]
+        return [(self.range_start, self.range_start)] if self.range_start else []
+
+    def update(self, **changes):
+        """Set fields and notify listeners once, if anything actually changed."""
+        unknown = changes.keys() - _FIELDS.keys()
+        if unknown:
+            raise TypeError(f"unknown model field(s): {', '.join(sorted(unknown))}")
+        old_range = self._range_footprint()
+        aspects = set()
+        spans = []
+        for name, value in changes.items():
+            old = getattr(self, name)
+            if old == value:
+                continue
+            setattr(self, name, value)
+            aspects.add(_FIELDS[name])
+            if name in ("today", "selected_date", "highlighted_result"):
+                spans.extend((d, d) for d in (old, value) if d is not None)
+        if not aspects:
+            return
+        if "range_start" in changes or "range_end" in changes:
+            spans += old_range + self._range_footprint()
+        # Only selection changes are local; anything else may restyle every date
+        self._notify(aspects, spans if aspects == {SELECTION} else None)
+
+    def events_changed(self, first=None, last=None):
+        """Tell views the event store changed (within first..last, if given)."""
+        self._notify({EVENTS}, None if first is None else [(first, last)])
+
+    def _notify(self, aspects, spans):
+        for listener in list(self._listeners):
+            listener(aspects, spans)
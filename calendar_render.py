@@ -0,0 +1,480 @@
+"""Headless export of month, 3-month and year calendars to SVG, PNG and PDF.
+
+Pages are laid out from the same month_layout() grids and PALETTE colours as
+the Tk views, as flat lists of filled rectangles and centred text in points
+(1/72 in, y down). Each backend then just writes those out:
+
+  SVG  plain text, standard library only
+  PDF  standard library only; pages are written to disk as they are made and
+       only their byte offsets are kept, so a 1,200-page planner needs no
+       more memory than one page
+  PNG  needs Pillow (imported on first use)
+
+Many years can be exported in parallel: export_batch() writes one file per
+year from a process pool, and export(..., workers=N) renders the pages of a
+long PDF in worker processes while the parent streams them out in order.
+
+    python calendar_render.py year 2026 -o planner-2026.pdf
+    python calendar_render.py month 2025-2034 -o out/ --format png --workers 0
+"""
+import argparse
+import os
+import sys
+import zlib
+from array import array
+from collections import namedtuple
+from datetime import date
+from functools import lru_cache
+from itertools import chain
+from xml.sax.saxutils import escape
+
+from calendar_layout import PALETTE, WEEKDAYS, days_off_columns, month_layout, shift_month
+from workdays import WORK_PATTERNS, parse_date
+
+FORMATS = ("svg", "png", "pdf")
+FONT_FAMILY = "Segoe UI, Helvetica, Arial, sans-serif"
+
+# Block geometry in points at scale 1 (as in YearViewWindow, which uses pixels)
+CELL_W, CELL_H = 24, 20
+WK_W = 22
+TITLE_H, DOW_H = 24, 16
+GAP_X, GAP_Y, MARGIN = 18, 14, 24
+PAGE_TITLE_H = 36
+
+# view -> (months per page, block columns, scale, grey days outside the month)
+VIEWS = {
+    "month": (1, 1, 3.0, True),
+    "3-month": (3, 3, 1.4, True),
+    "year": (12, 3, 1.0, False),
+}
+
+Rect = namedtuple("Rect", "x y w h fill")
+Text = namedtuple("Text", "x y text size fill bold")  # x, y: centre of the text
+# name: file-name suffix for the page, e.g. "2026-03" (month) or "2026" (year)
+Page = namedtuple("Page", "name width height items")
+
+
+def _cell_fill(d, lo, hi, today, result, selected):
+    # Same precedence as UKCalendarApp._resolve_style
+    if lo is not None and lo <= d <= hi:
+        return PALETTE["range_edge"] if d == lo or d == hi else PALETTE["range"]
+    if d == today:
+        return PALETTE["today"]
+    if d == result:
+        return PALETTE["result"]
+    if d == selected:
+        return PALETTE["selected"]
+    return None
+
+
+def _month_block(items, x0, y0, year, month, s, title, outside_days, pattern,
+                 week_numbers, selection, today, result, selected):
+    layout = month_layout(year, month, pattern)
+    cell_w, cell_h, wk_w = CELL_W * s, CELL_H * s, (WK_W * s if week_numbers else 0)
+    block_w = wk_w + 7 * cell_w
+    lo, hi = selection or (None, None)
+    items.append(Text(x0 + block_w / 2, y0 + TITLE_H * s / 2, title, 12 * s, PALETTE["day_fg"], True))
+    grid_y = y0 + (TITLE_H + DOW_H) * s
+    dow_y = y0 + (TITLE_H + DOW_H / 2) * s
+    if wk_w:
+        items.append(Rect(x0, y0 + TITLE_H * s, wk_w - 2 * s, (DOW_H + 6 * CELL_H) * s, PALETTE["weeknum_bg"]))
+        items.append(Text(x0 + wk_w / 2, dow_y, "Wk", 8 * s, PALETTE["weeknum_fg"], False))
+    for col, off in enumerate(days_off_columns(pattern)):
+        items.append(Text(x0 + wk_w + (col + 0.5) * cell_w, dow_y, WEEKDAYS[col][:2], 8 * s,
+                          PALETTE["dow_weekend_fg" if off else "dow_fg"], False))
+    for r, week in enumerate(layout.weeks):
+        if week is None:
+            continue
+        cy = grid_y + r * cell_h
+        if wk_w:
+            items.append(Text(x0 + wk_w / 2, cy + cell_h / 2, str(layout.week_numbers[r]), 8 * s,
+                              PALETTE["weeknum_fg"], False))
+        for c, d in enumerate(week):
+            outside = layout.outside[r][c]
+            if outside and not outside_days:
+                continue
+            cx = x0 + wk_w + c * cell_w
+            fill = None if outside else _cell_fill(d, lo, hi, today, result, selected)
+            if fill is not None:
+                items.append(Rect(cx + s, cy + s, cell_w - 2 * s, cell_h - 2 * s, fill))
+            if outside:
+                fg = PALETTE["outside_fg"]
+            else:
+                fg = PALETTE["weekend_fg" if layout.weekend[r][c] else "day_fg"]
+            items.append(Text(cx + cell_w / 2, cy + cell_h / 2, str(d.day), 9 * s, fg, False))
+
+
+def render_page(view, year, month=1, pattern=None, week_numbers=False, selection=None,
+                today=None, result=None, selected=None):
+    """One page of `view` starting at (year, month).
+
+    selection is a (first, last) date range; today, result and selected are
+    dates to highlight as in the GUI (none are highlighted by default).
+    """
+    per_page, columns, s, outside_days = VIEWS[view]
+    rows = -(-per_page // columns)
+    block_w = (WK_W * s if week_numbers else 0) + 7 * CELL_W * s
+    block_h = (TITLE_H + DOW_H + 6 * CELL_H) * s
+    header = PAGE_TITLE_H if view == "year" else 0
+    width = 2 * MARGIN + columns * block_w + (columns - 1) * GAP_X
+    height = 2 * MARGIN + header + rows * block_h + (rows - 1) * GAP_Y
+    items = [Rect(0, 0, width, height, PALETTE["background"])]
+    if header:
+        items.append(Text(width / 2, MARGIN + header / 2, str(year), 20, PALETTE["day_fg"], True))
+    for i in range(per_page):
+        y, m = shift_month(year, month, i)
+        row, col = divmod(i, columns)
+        title = date(y, m, 1).strftime("%B" if view == "year" else "%B %Y")
+        _month_block(items, MARGIN + col * (block_w + GAP_X), MARGIN + header + row * (block_h + GAP_Y),
+                     y, m, s, title, outside_days, pattern, week_numbers, selection, today, result, selected)
+    name = f"{year}" if view == "year" else f"{year}-{month:02d}"
+    return Page(name, width, height, items)
+
+
+def iter_pages(view, years, **options):
+    """Pages covering every month of the given years, in order (see render_page)."""
+    per_page = VIEWS[view][0]
+    for year in years:
+        for month in range(1, 13, per_page):
+            yield render_page(view, year, month, **options)
+
+
+# --- SVG ---
+
+def _svg_lines(page):
+    yield (f'<svg xmlns="http://www.w3.org/2000/svg" width="{page.width:g}pt" height="{page.height:g}pt" '
+           f'viewBox="0 0 {page.width:g} {page.height:g}" font-family="{FONT_FAMILY}" '
+           'text-anchor="middle" dominant-baseline="central">\n')
+    for item in page.items:
+        if isinstance(item, Rect):
+            yield f'<rect x="{item.x:g}" y="{item.y:g}" width="{item.w:g}" height="{item.h:g}" fill="{item.fill}"/>\n'
+        else:
+            weight = ' font-weight="bold"' if item.bold else ""
+            yield (f'<text x="{item.x:g}" y="{item.y:g}" font-size="{item.size:g}" fill="{item.fill}"{weight}>'
+                   f'{escape(item.text)}</text>\n')
+    yield "</svg>\n"
+
+
+def write_svg(page, path):
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(_svg_lines(page))
+
+
+# --- PNG (Pillow) ---
+
+def _pillow():
+    try:
+        from PIL import Image, ImageDraw, ImageFont
+    except ImportError:
+        raise RuntimeError("PNG export needs Pillow (pip install Pillow); SVG and PDF do not") from None
+    return Image, ImageDraw, ImageFont
+
+
+_png_fonts = {}
+
+
+def _png_font(image_font, px, bold):
+    key = (px, bold)
+    font = _png_fonts.get(key)
+    if font is None:
+        try:
+            font = image_font.truetype("DejaVuSans-Bold.ttf" if bold else "DejaVuSans.ttf", px)
+        except OSError:
+            try:
+                font = image_font.load_default(px)
+            except TypeError:  # Pillow < 10.1 has one fixed-size bitmap font
+                font = image_font.load_default()
+        font = _png_fonts[key] = font
+    return font
+
+
+def write_png(page, path, dpi=150):
+    Image, ImageDraw, ImageFont = _pillow()
+    k = dpi / 72
+    image = Image.new("RGB", (round(page.width * k), round(page.height * k)), PALETTE["background"])
+    draw = ImageDraw.Draw(image)
+    for item in page.items:
+        if isinstance(item, Rect):
+            draw.rectangle((item.x * k, item.y * k, (item.x + item.w) * k - 1, (item.y + item.h) * k - 1),
+                           fill=item.fill)
+        else:
+            draw.text((item.x * k, item.y * k), item.text, fill=item.fill, anchor="mm",
+                      font=_png_font(ImageFont, max(1, round(item.size * k)), item.bold))
+    image.save(path, dpi=(dpi, dpi))
+
+
+# --- PDF ---
+
+# Advance widths (1/1000 em) of the standard Helvetica fonts, for centring text
+_HELVETICA = dict(zip(
+    " 0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz",
+    (278,) + (556,) * 10
+    + (667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833,
+       722, 778, 667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611)
+    + (556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833,
+       556, 556, 556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500)))
+_HELVETICA_BOLD = dict(zip(
+    " 0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz",
+    (278,) + (556,) * 10
+    + (722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833,
+       722, 778, 667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611)
+    + (556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889,
+       611, 611, 611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500)))
+_BASELINE = 0.35  # baseline below the text's centre, in em
+
+
+@lru_cache(maxsize=None)
+def _pdf_rgb(colour):
+    return " ".join(f"{int(colour[i:i + 2], 16) / 255:.3g}" for i in (1, 3, 5))
+
+
+def _pdf_string(text):
+    data = text.encode("cp1252", "replace")
+    return b"(" + data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+def pdf_content(page):
+    """Compressed content stream drawing a page (PDF y runs up, so y is flipped)."""
+    h = page.height
+    ops = []
+    for item in page.items:
+        if isinstance(item, Rect):
+            ops.append(f"{_pdf_rgb(item.fill)} rg {item.x:.2f} {h - item.y - item.h:.2f} "
+                       f"{item.w:.2f} {item.h:.2f} re f".encode())
+        else:
+            widths = _HELVETICA_BOLD if item.bold else _HELVETICA
+            w = sum(widths.get(ch, 556) for ch in item.text) * item.size / 1000
+            ops.append(f"BT /F{2 if item.bold else 1} {item.size:g} Tf {_pdf_rgb(item.fill)} rg "
+                       f"{item.x - w / 2:.2f} {h - item.y - _BASELINE * item.size:.2f} Td ".encode()
+                       + _pdf_string(item.text) + b" Tj ET")
+    return zlib.compress(b"\n".join(ops))
+
+
+class PdfWriter:
+    """Writes a PDF to a binary file object one page at a time.
+
+    Objects 1-4 (catalog, page tree, two fonts) are written by close(), after
+    the pages, so only each object's byte offset is held in memory. Page n
+    is a content stream (object 2n + 3) then its page object (2n + 4).
+    """
+
+    _CATALOG, _PAGES, _FONT, _FONT_BOLD = 1, 2, 3, 4
+    _FIRST_PAGE = 6
+
+    def __init__(self, fileobj):
+        self._f = fileobj
+        self._pos = 0
+        self._offsets = array("Q", bytes(8 * 4))  # by object number - 1
+        self.pages = 0
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if exc[0] is None:
+            self.close()
+
+    def _write(self, data):
+        self._f.write(data)
+        self._pos += len(data)
+
+    def _object(self, num, body, end=b"\nendobj\n"):
+        if num > len(self._offsets):
+            self._offsets.append(self._pos)
+        else:
+            self._offsets[num - 1] = self._pos
+        self._write(b"%d 0 obj\n" % num + body + end)
+
+    def add_page(self, width, height, content):
+        """Append a page; content is a stream from pdf_content()."""
+        stream = len(self._offsets) + 1
+        page = stream + 1
+        self._object(stream, b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(content)
+                     + content + b"\nendstream")
+        self._object(page, (f"<< /Type /Page /Parent {self._PAGES} 0 R /MediaBox [0 0 {width:.2f} {height:.2f}] "
+                            f"/Resources << /Font << /F1 {self._FONT} 0 R /F2 {self._FONT_BOLD} 0 R >> >> "
+                            f"/Contents {stream} 0 R >>").encode())
+        self.pages += 1
+
+    def close(self):
+        for num, name in ((self._FONT, "Helvetica"), (self._FONT_BOLD, "Helvetica-Bold")):
+            self._object(num, f"<< /Type /Font /Subtype /Type1 /BaseFont /{name} "
+                              f"/Encoding /WinAnsiEncoding >>".encode())
+        # The page tree and xref table are as long as the document, so they go out in slices
+        self._object(self._PAGES, b"<< /Type /Pages /Count %d /Kids [" % self.pages, end=b"")
+        kids = range(self._FIRST_PAGE, self._FIRST_PAGE + 2 * self.pages, 2)
+        for i in range(0, len(kids), 1000):
+            self._write(b"".join(b"%d 0 R " % k for k in kids[i:i + 1000]))
+        self._write(b"] >>\nendobj\n")
+        self._object(self._CATALOG, f"<< /Type /Catalog /Pages {self._PAGES} 0 R >>".encode())
+        xref = self._pos
+        count = len(self._offsets) + 1
+        self._write(b"xref\n0 %d\n0000000000 65535 f \n" % count)
+        for i in range(0, count - 1, 1000):
+            self._write(b"".join(b"%010d 00000 n \n" % o for o in self._offsets[i:i + 1000]))
+        self._write(b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+                    % (count, self._CATALOG, xref))
+        self._f.flush()
+
+
+def write_pdf(pages, path):
+    """Stream pages into one PDF file; returns the page count."""
+    with open(path, "wb") as f, PdfWriter(f) as pdf:
+        for page in pages:
+            pdf.add_page(page.width, page.height, pdf_content(page))
+    return pdf.pages
+
+
+# --- Export ---
+
+def _format_for(path, fmt):
+    fmt = fmt or os.path.splitext(path)[1][1:].lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown export format {fmt!r} (expected one of {', '.join(FORMATS)})")
+    return fmt
+
+
+def _render_options(pattern_key="mon-fri", **options):
+    # Workers get the pattern by key: WORK_PATTERNS holds the instances
+    return dict(options, pattern=WORK_PATTERNS[pattern_key][1])
+
+
+def _year_streams(view, year, options):
+    return [(page.width, page.height, pdf_content(page))
+            for page in iter_pages(view, [year], **_render_options(**options))]
+
+
+def _write_pages(pages, path, fmt, dpi, split=False):
+    # split: name SVG/PNG files by page even when there is only one
+    if fmt == "pdf":
+        write_pdf(pages, path)
+        return [path]
+    stem, ext = os.path.splitext(path)
+    pages = iter(pages)
+    first = next(pages, None)
+    second = next(pages, None)
+    if second is None:
+        pages, single = [first] if first else [], not split
+    else:
+        pages, single = chain((first, second), pages), False
+    written = []
+    for page in pages:
+        out = path if single else f"{stem}-{page.name}{ext}"
+        if fmt == "svg":
+            write_svg(page, out)
+        else:
+            write_png(page, out, dpi)
+        written.append(out)
+    return written
+
+
+def export(path, view, years, fmt=None, workers=1, dpi=150, **options):
+    """Write every page of `view` for `years` to path; returns the files written.
+
+    A PDF holds all pages; SVG and PNG write one file per page (path with
+    "-<page name>" before the extension) unless there is only one. With
+    workers > 1 (None: one per CPU), PDF pages are rendered a year per task
+    in a process pool and streamed to the file in order. options are
+    render_page's keywords, with pattern_key (a WORK_PATTERNS key) in place
+    of pattern.
+    """
+    fmt = _format_for(path, fmt)
+    years = list(years)
+    if fmt != "pdf" or workers == 1 or len(years) < 2:
+        return _write_pages(iter_pages(view, years, **_render_options(**options)), path, fmt, dpi)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    from ordered_pool import bounded_map
+
+    workers = workers or os.cpu_count() or 1
+    with open(path, "wb") as f, PdfWriter(f) as pdf, ProcessPoolExecutor(workers) as pool:
+        # At most 2 * workers years of rendered pages wait in memory
+        jobs = ((view, year, options) for year in years)
+        for streams in bounded_map(pool, _year_streams, jobs, 2 * workers):
+            for width, height, content in streams:
+                pdf.add_page(width, height, content)
+    return [path]
+
+
+def _export_year(out_dir, view, year, fmt, dpi, options):
+    # <view>-<year>.pdf, or <view>-<page name>.svg/.png per page
+    name = f"{view}-{year}.pdf" if fmt == "pdf" else f"{view}.{fmt}"
+    return _write_pages(iter_pages(view, [year], **_render_options(**options)),
+                        os.path.join(out_dir, name), fmt, dpi, split=True)
+
+
+def export_batch(out_dir, view, years, fmt="pdf", workers=None, dpi=150, **options):
+    """One PDF (or, for SVG/PNG, one file per page) per year in out_dir, in parallel.
+
+    Years are rendered in a process pool of `workers` (None: one per CPU;
+    1: in this process). Returns the files written, in year order.
+    """
+    fmt = _format_for("", fmt)
+    os.makedirs(out_dir, exist_ok=True)
+    years = list(years)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(years) < 2:
+        return [p for year in years for p in _export_year(out_dir, view, year, fmt, dpi, options)]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(min(workers, len(years))) as pool:
+        futures = [pool.submit(_export_year, out_dir, view, year, fmt, dpi, options) for year in years]
+        return [p for future in futures for p in future.result()]
+
+
+def _parse_years(text):
+    first, _, last = text.partition("-")
+    first = int(first)
+    last = int(last) if last else first
+    if not 1 <= first <= last <= 9998:
+        raise argparse.ArgumentTypeError(f"bad year range {text!r} (expected YYYY or YYYY-YYYY)")
+    return range(first, last + 1)
+
+
+def _date_arg(text):
+    try:
+        return parse_date(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"bad date {text!r} (expected DD/MM/YYYY)") from None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export calendars to SVG, PNG or PDF without a display.")
+    parser.add_argument("view", choices=tuple(VIEWS), help="page layout")
+    parser.add_argument("years", type=_parse_years, help="YYYY or YYYY-YYYY")
+    parser.add_argument("-o", "--output", required=True,
+                        help="output file (.svg/.png/.pdf), or a directory for one file per year")
+    parser.add_argument("--format", choices=FORMATS, help="format (default: from the output file's extension)")
+    parser.add_argument("--workers", type=int, default=1, help="processes (0: one per CPU; default 1)")
+    parser.add_argument("--week-numbers", action="store_true", help="add the ISO week number column")
+    parser.add_argument("--pattern", choices=tuple(WORK_PATTERNS), default="mon-fri",
+                        help="work pattern for day-off shading (default mon-fri)")
+    parser.add_argument("--range", nargs=2, type=_date_arg, metavar=("FIRST", "LAST"),
+                        help="highlight a date range (DD/MM/YYYY)")
+    parser.add_argument("--dpi", type=int, default=150, help="PNG resolution (default 150)")
+    args = parser.parse_args(argv)
+    if args.workers < 0:
+        parser.error("--workers must be >= 0")
+
+    options = dict(pattern_key=args.pattern, week_numbers=args.week_numbers,
+                   selection=tuple(sorted(args.range)) if args.range else None)
+    workers = args.workers or None
+    to_dir = os.path.isdir(args.output) or args.output.endswith(("/", os.sep))
+    try:
+        if to_dir:
+            written = export_batch(args.output, args.view, args.years, args.format or "pdf",
+                                   workers, args.dpi, **options)
+        else:
+            written = export(args.output, args.view, args.years, args.format, workers, args.dpi, **options)
+    except (RuntimeError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    print(f"wrote {len(written)} file(s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
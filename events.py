@@ -0,0 +1,325 @@
+"""Event storage for Smart Calendar.
+
+Events are all-day items spanning start..end (inclusive dates). They are kept
+in memory in an interval index, so "which events overlap this window" costs
+O(log n + k), and persisted to a local SQLite file in WAL mode with writes
+batched into single transactions. Repeating events are stored as a series
+with a RecurrenceRule and expanded lazily per queried window.
+"""
+import os
+import sqlite3
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, namedtuple
+from datetime import date
+
+from recurrence import RecurrenceRule
+
+Event = namedtuple("Event", "id title start end")
+Series = namedtuple("Series", "id title rule")  # a repeating event; see recurrence
+
+DEFAULT_DB_PATH = os.path.join(os.path.expanduser("~"), ".smart_calendar", "events.db")
+BATCH_SIZE = 500  # buffered writes are committed in one transaction at this size
+EXPANSION_CACHE_SIZE = 256  # (series, window) expansions kept by EventStore
+
+
+class IntervalIndex:
+    """Static centered interval tree over (start, end, key) integer intervals.
+
+    Intervals added after the last build sit in a small pending list that
+    queries scan directly; the tree is rebuilt once that list (or the set of
+    removed keys) grows past roughly sqrt(n), keeping both updates and queries
+    cheap.
+    """
+
+    def __init__(self, intervals=()):
+        self._intervals = {}  # key -> (start, end)
+        self._pending = []
+        self._removed = set()
+        self._root = None
+        for start, end, key in intervals:
+            self._intervals[key] = (start, end)
+        self.rebuild()
+
+    def __len__(self):
+        return len(self._intervals)
+
+    def add(self, start, end, key):
+        self.extend([(start, end, key)])
+
+    def extend(self, intervals, rebuild=True):
+        """Add many intervals, rebuilding the tree at most once.
+
+        With rebuild=False they stay pending until rebuild() (for bulk imports).
+        """
+        for start, end, key in intervals:
+            if key in self._intervals:
+                self._drop(key)  # re-adding a key replaces its interval
+            self._intervals[key] = (start, end)
+            self._pending.append((start, end, key))
+        if rebuild:
+            self._maybe_rebuild()
+
+    def remove(self, key):
+        if key in self._intervals:
+            self._drop(key)
+            self._maybe_rebuild()
+
+    def _drop(self, key):
+        del self._intervals[key]
+        # _removed hides the key's copy in the tree; a pending copy is deleted outright
+        self._removed.add(key)
+        if any(k == key for _, _, k in self._pending):
+            self._pending = [item for item in self._pending if item[2] != key]
+
+    def _maybe_rebuild(self):
+        limit = max(64, int(len(self._intervals) ** 0.5))
+        if len(self._pending) > limit or len(self._removed) > limit:
+            self.rebuild()
+
+    def rebuild(self):
+        items = [(s, e, k) for k, (s, e) in self._intervals.items()]
+        self._pending = []
+        self._removed = set()
+        self._root = self._build(items)
+
+    @classmethod
+    def _build(cls, items):
+        if not items:
+            return None
+        # Median endpoint as the center keeps the tree balanced
+        points = sorted(p for s, e, _ in items for p in (s, e))
+        center = points[len(points) // 2]
+        left, right, here = [], [], []
+        for item in items:
+            if item[1] < center:
+                left.append(item)
+            elif item[0] > center:
+                right.append(item)
+            else:
+                here.append(item)
+        by_start = sorted(here)
+        by_end = sorted(here, key=lambda item: item[1])
+        return (center,
+                [s for s, _, _ in by_start], [k for _, _, k in by_start],
+                [e for _, e, _ in by_end], [k for _, _, k in by_end],
+                cls._build(left), cls._build(right))
+
+    def query(self, lo, hi):
+        """Keys of intervals overlapping [lo, hi]."""
+        out = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            center, starts, start_keys, ends, end_keys, left, right = node
+            if hi < center:
+                # Everything here ends at/after center > hi: keep those starting by hi
+                out.extend(start_keys[:bisect_right(starts, hi)])
+                stack.append(left)
+            elif lo > center:
+                out.extend(end_keys[bisect_left(ends, lo):])
+                stack.append(right)
+            else:
+                out.extend(start_keys)
+                stack.append(left)
+                stack.append(right)
+        # Only tree matches are filtered: pending entries are always live
+        if self._removed:
+            out = [k for k in out if k not in self._removed]
+        out.extend(k for s, e, k in self._pending if s <= hi and e >= lo)
+        return out
+
+
+class EventStore:
+    """Events indexed in memory and persisted to SQLite (path=None keeps them in memory only).
+
+    WORKDAYS series step with `calendar` (a BusinessCalendar; plain Mon-Fri
+    if None), which is not stored: set_calendar() rebinds them.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH, calendar=None):
+        self.path = path
+        self.calendar = calendar
+        self._events = {}
+        self._series = {}
+        # (series id, first ordinal, last ordinal) -> occurrence ordinals, LRU ordered
+        self._expansions = OrderedDict()
+        self._write_buffer = []
+        self._db = None
+        if path is not None:
+            parent = os.path.dirname(path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            self._db = sqlite3.connect(path)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS events ("
+                             "id INTEGER PRIMARY KEY, title TEXT NOT NULL, "
+                             "start INTEGER NOT NULL, end INTEGER NOT NULL)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS series ("
+                             "id INTEGER PRIMARY KEY, title TEXT NOT NULL, start INTEGER NOT NULL, "
+                             "rule TEXT NOT NULL, exdates TEXT NOT NULL DEFAULT '')")
+            for eid, title, start, end in self._db.execute("SELECT id, title, start, end FROM events"):
+                self._events[eid] = Event(eid, title, date.fromordinal(start), date.fromordinal(end))
+            for sid, title, start, rule, exdates in self._db.execute(
+                    "SELECT id, title, start, rule, exdates FROM series"):
+                excluded = [date.fromordinal(int(o)) for o in exdates.split(",") if o]
+                rule = RecurrenceRule.from_rrule(rule, date.fromordinal(start), excluded, calendar)
+                self._series[sid] = Series(sid, title, rule)
+        self._next_id = max(self._events, default=0) + 1
+        self._next_series_id = max(self._series, default=0) + 1
+        self._index = IntervalIndex(
+            (e.start.toordinal(), e.end.toordinal(), e.id) for e in self._events.values())
+
+    def __len__(self):
+        return len(self._events)
+
+    def get(self, event_id):
+        return self._events.get(event_id)
+
+    def add(self, title, start, end=None):
+        """Add one event (end defaults to start); returns it."""
+        return self.add_many([(title, start, end)])[0]
+
+    def add_many(self, rows, reindex=True):
+        """Add (title, start, end) rows; writes go out in BATCH_SIZE transactions.
+
+        Bulk loaders can pass reindex=False per batch and call reindex() once at the end.
+        """
+        added = []
+        for title, start, end in rows:
+            end = end or start
+            if end < start:
+                start, end = end, start
+            event = Event(self._next_id, title, start, end)
+            self._next_id += 1
+            self._events[event.id] = event
+            self._write_buffer.append(("add", event))
+            if len(self._write_buffer) >= BATCH_SIZE:
+                self.flush()
+            added.append(event)
+        self._index.extend(((e.start.toordinal(), e.end.toordinal(), e.id) for e in added), reindex)
+        return added
+
+    def reindex(self):
+        self._index.rebuild()
+
+    def remove(self, event_id):
+        if self._events.pop(event_id, None) is not None:
+            self._index.remove(event_id)
+            self._write_buffer.append(("remove", event_id))
+
+    def _bind(self, rule):
+        return rule.with_calendar(self.calendar) if rule.freq == "WORKDAYS" else rule
+
+    def set_calendar(self, calendar):
+        """Step WORKDAYS series with `calendar` from now on (e.g. another region or work pattern)."""
+        self.calendar = calendar
+        for series in list(self._series.values()):
+            rule = self._bind(series.rule)
+            if rule is not series.rule:
+                self._series[series.id] = series._replace(rule=rule)
+                self._invalidate(series.id)
+
+    def add_series(self, title, rule):
+        """Add a repeating event; occurrences are expanded only when queried."""
+        series = Series(self._next_series_id, title, self._bind(rule))
+        self._next_series_id += 1
+        self._series[series.id] = series
+        self._write_buffer.append(("series", series))
+        return series
+
+    def update_series(self, series_id, title=None, rule=None):
+        """Replace a series' title and/or rule, dropping its cached expansions."""
+        old = self._series[series_id]
+        series = Series(series_id, old.title if title is None else title,
+                        old.rule if rule is None else self._bind(rule))
+        self._series[series_id] = series
+        self._invalidate(series_id)
+        self._write_buffer.append(("series", series))
+        return series
+
+    def remove_series(self, series_id):
+        if self._series.pop(series_id, None) is not None:
+            self._invalidate(series_id)
+            self._write_buffer.append(("remove_series", series_id))
+
+    def series(self):
+        return list(self._series.values())
+
+    def _invalidate(self, series_id):
+        for key in [k for k in self._expansions if k[0] == series_id]:
+            del self._expansions[key]
+
+    def _expand(self, series, lo, hi):
+        key = (series.id, lo, hi)
+        hit = self._expansions.get(key)
+        if hit is not None:
+            self._expansions.move_to_end(key)
+            return hit
+        dates = series.rule.occurrences(date.fromordinal(lo), date.fromordinal(hi))
+        hit = self._expansions[key] = tuple(d.toordinal() for d in dates)
+        if len(self._expansions) > EXPANSION_CACHE_SIZE:
+            self._expansions.popitem(last=False)
+        return hit
+
+    def occurrences(self, first, last):
+        """(date, series) for every series occurrence in first..last, ordered by date."""
+        lo, hi = first.toordinal(), last.toordinal()
+        out = [(date.fromordinal(o), s) for s in self._series.values() for o in self._expand(s, lo, hi)]
+        out.sort(key=lambda item: (item[0], item[1].id))
+        return out
+
+    def flush(self):
+        """Commit buffered writes in one transaction."""
+        buffer, self._write_buffer = self._write_buffer, []
+        if self._db is None or not buffer:
+            return
+        # Ids are never reused, so applying all inserts before all deletes is safe
+        adds = [(e.id, e.title, e.start.toordinal(), e.end.toordinal()) for op, e in buffer if op == "add"]
+        removes = [(eid,) for op, eid in buffer if op == "remove"]
+        series = [(s.id, s.title, s.rule.start.toordinal(), s.rule.to_rrule(),
+                   ",".join(str(d.toordinal()) for d in sorted(s.rule.exdates)))
+                  for op, s in buffer if op == "series"]
+        series_removes = [(sid,) for op, sid in buffer if op == "remove_series"]
+        with self._db:
+            self._db.executemany("INSERT OR REPLACE INTO events (id, title, start, end) VALUES (?, ?, ?, ?)", adds)
+            self._db.executemany("DELETE FROM events WHERE id = ?", removes)
+            self._db.executemany("INSERT OR REPLACE INTO series (id, title, start, rule, exdates) "
+                                 "VALUES (?, ?, ?, ?, ?)", series)
+            self._db.executemany("DELETE FROM series WHERE id = ?", series_removes)
+
+    def close(self):
+        self.flush()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def overlapping(self, first, last):
+        """Events overlapping first..last (inclusive), ordered by start."""
+        ids = self._index.query(first.toordinal(), last.toordinal())
+        return sorted((self._events[i] for i in ids), key=lambda e: (e.start, e.id))
+
+    def counts_by_day(self, first, last):
+        """Number of events on each day of first..last, from one range query.
+
+        Repeating series are expanded for this window only (and cached).
+        Returns a list indexed by day offset from first.
+        """
+        lo, hi = first.toordinal(), last.toordinal()
+        diff = [0] * (hi - lo + 2)
+        for i in self._index.query(lo, hi):
+            e = self._events[i]
+            diff[max(e.start.toordinal(), lo) - lo] += 1
+            diff[min(e.end.toordinal(), hi) - lo + 1] -= 1
+        for s in self._series.values():
+            for o in self._expand(s, lo, hi):
+                diff[o - lo] += 1
+                diff[o - lo + 1] -= 1
+        counts = []
+        running = 0
+        for step in diff[:-1]:
+            running += step
+            counts.append(running)
+        return counts
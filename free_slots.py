@@ -0,0 +1,194 @@
+"""Earliest common free time across many calendars.
+
+Each person's busy time is a BusySchedule: their intervals merged once into
+sorted, non-overlapping minute ranges. A query bisects every schedule to the
+search start and sweeps them together with a heap (one entry per calendar),
+producing the union of everyone's busy time lazily. That union is walked
+against working hours on working days only, so a query touches just the
+meetings before the N-th free window rather than the whole year. When the same
+people are queried repeatedly, a BusyUnion keeps the merged result so each
+query is a bisect plus a walk to the N-th window.
+"""
+import heapq
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
+from itertools import chain, compress
+from operator import lt
+
+from workdays import add_working_days
+
+DAY_START = time(9, 0)
+DAY_END = time(17, 0)
+HORIZON_DAYS = 366  # how far ahead a search looks before giving up
+
+
+def _minute(dt: datetime) -> int:
+    return dt.toordinal() * 1440 + dt.hour * 60 + dt.minute
+
+
+def _minutes(values) -> list:
+    """_minute() of every value in a list; date-only values count as midnight."""
+    try:
+        return [v.toordinal() * 1440 + v.hour * 60 + v.minute for v in values]
+    except AttributeError:
+        return [_minute(_as_datetime(v)) for v in values]
+
+
+def _union(starts, ends):
+    """Merge intervals given as separately sorted starts and ends into blocks.
+
+    With both sorted, busy time has a gap exactly where the i-th end comes
+    before the (i+1)-th start, so the blocks fall out of one C-level compare
+    of the two lists. Touching intervals merge. Returns (starts, ends).
+    """
+    if not starts:
+        return [], []
+    gaps = list(compress(range(1, len(starts)), map(lt, ends, starts[1:])))
+    return [starts[0]] + [starts[i] for i in gaps], [ends[i - 1] for i in gaps] + [ends[-1]]
+
+
+def _from_minute(m: int) -> datetime:
+    day, minute = divmod(m, 1440)
+    return datetime.combine(date.fromordinal(day), time(minute // 60, minute % 60))
+
+
+class BusySchedule:
+    """One calendar's busy time as sorted, non-overlapping minute intervals.
+
+    intervals are (start, end) datetimes in any order, possibly overlapping;
+    date-only values count as midnight, so an all-day event is (d, d + 1 day).
+    """
+
+    def __init__(self, intervals=()):
+        pairs = list(intervals)
+        starts = _minutes([s for s, _ in pairs])
+        ends = _minutes([e for _, e in pairs])
+        keep = list(map(lt, starts, ends))
+        if not all(keep):
+            starts, ends = list(compress(starts, keep)), list(compress(ends, keep))
+        starts.sort()
+        ends.sort()
+        self._starts, self._ends = _union(starts, ends)
+        # Merged intervals end in ascending order too, so "first interval still
+        # busy at t" is a bisect over the ends
+        self.intervals = list(zip(self._starts, self._ends))
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def first_after(self, minute: int) -> int:
+        """Index of the first interval ending after `minute`."""
+        return bisect_right(self._ends, minute)
+
+
+def _as_datetime(value):
+    if isinstance(value, datetime):
+        return value
+    return datetime.combine(value, time())
+
+
+def merge_busy(schedules, since: int = None):
+    """Yield the union of all schedules' busy intervals (minutes), ascending.
+
+    Heap sweep-line: the heap holds each calendar's next interval, so emitting
+    a merged block costs O(log c) per underlying interval.
+    """
+    heap = []
+    for ci, sched in enumerate(schedules):
+        i = 0 if since is None else sched.first_after(since)
+        if i < len(sched.intervals):
+            s, e = sched.intervals[i]
+            heap.append((s, e, ci, i))
+    heapq.heapify(heap)
+    cur_s = cur_e = None
+    while heap:
+        s, e, ci, i = heap[0]
+        intervals = schedules[ci].intervals
+        if i + 1 < len(intervals):
+            ns, ne = intervals[i + 1]
+            heapq.heapreplace(heap, (ns, ne, ci, i + 1))
+        else:
+            heapq.heappop(heap)
+        if cur_e is None:
+            cur_s, cur_e = s, e
+        elif s <= cur_e:
+            if e > cur_e:
+                cur_e = e
+        else:
+            yield cur_s, cur_e
+            cur_s, cur_e = s, e
+    if cur_e is not None:
+        yield cur_s, cur_e
+
+
+class BusyUnion:
+    """Everyone's busy time merged once, for repeated queries over the same people.
+
+    Building sorts everyone's starts and ends once (see _union), which runs in
+    C and beats a heap sweep over every interval; each query then starts with
+    a bisect instead of re-sweeping from scratch.
+    """
+
+    def __init__(self, schedules):
+        starts, self._ends = _union(sorted(chain.from_iterable(s._starts for s in schedules)),
+                                    sorted(chain.from_iterable(s._ends for s in schedules)))
+        self.intervals = list(zip(starts, self._ends))
+
+    def blocks_from(self, minute: int):
+        """Merged blocks ending after `minute`, ascending (lazy, no copy)."""
+        intervals = self.intervals
+        return map(intervals.__getitem__, range(bisect_right(self._ends, minute), len(intervals)))
+
+
+def find_free_slots(schedules, start: datetime, duration: timedelta, count: int = 1,
+                    day_start: time = DAY_START, day_end: time = DAY_END,
+                    business_calendar=None, horizon_days: int = HORIZON_DAYS):
+    """The first `count` windows of at least `duration` when every schedule is free.
+
+    schedules is a sequence of BusySchedule, swept lazily from start, or a
+    BusyUnion built from them.
+
+    Only working hours (day_start..day_end) on working days are searched:
+    Mon-Fri as in working_days_between, or business_calendar's working days.
+    Returns (start, end) datetime pairs; each is the whole free gap, which may
+    be longer than duration. Fewer are returned if the horizon runs out.
+    """
+    start = _as_datetime(start)
+    need = int(duration.total_seconds() // 60)
+    open_m = day_start.hour * 60 + day_start.minute
+    close_m = day_end.hour * 60 + day_end.minute
+    if need <= 0 or need > close_m - open_m:
+        raise ValueError("duration must be positive and fit within the working day")
+    if business_calendar is None:
+        is_working, next_day = (lambda d: d.weekday() < 5), (lambda d: add_working_days(d, 1))
+    else:
+        is_working, next_day = business_calendar.is_working_day, (lambda d: business_calendar.add_working_days(d, 1))
+
+    if isinstance(schedules, BusyUnion):
+        busy = schedules.blocks_from(_minute(start))
+    else:
+        busy = merge_busy(schedules, since=_minute(start))
+    block = next(busy, None)
+    found = []
+    day = start.date()
+    if not is_working(day):
+        day = next_day(day)
+    last_day = start.date() + timedelta(days=horizon_days)
+    t_min = _minute(start)
+    while day <= last_day:
+        base = day.toordinal() * 1440
+        t, hi = max(base + open_m, t_min), base + close_m
+        while t < hi:
+            while block is not None and block[1] <= t:
+                block = next(busy, None)
+            if block is not None and block[0] <= t:
+                t = block[1]  # busy now: jump to the end of the merged block
+                continue
+            free_end = hi if block is None else min(hi, block[0])
+            if free_end - t >= need:
+                found.append((_from_minute(t), _from_minute(free_end)))
+                if len(found) == count:
+                    return found
+            t = free_end
+        day = next_day(day)
+    return found
@@ -0,0 +1,259 @@
+"""Regional UK bank-holiday tables, compiled once and cached on disk.
+
+Each region's holidays for a year span are compiled into two sorted int32
+arrays (weekday holiday ordinals and their working-day ranks, the tables
+BusinessCalendar bisects) and written to a small versioned binary file. Later
+launches memory-map that file instead of re-deriving Easter, substitute days
+and one-off holidays; it is rebuilt only when the rules fingerprint (the rule
+code and date tables), year span or byte order no longer match.
+"""
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from datetime import date, timedelta
+
+from workdays import BusinessCalendar, _weekday_rank
+
+FIRST_YEAR = 1978
+LAST_YEAR = 2100
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".smart_calendar")
+
+# The cache fingerprint covers the rule functions' compiled code and the date
+# tables, so editing either rebuilds the cache. Bump RULES_VERSION only for a
+# behaviour change that lives elsewhere (e.g. in BusinessCalendar).
+RULES_VERSION = 2
+FORMAT_VERSION = 1
+_MAGIC = b"SCHOLTAB"
+# magic, format version, byte order, rules fingerprint, first year, last year, count
+_HEADER = struct.Struct("<8sHcxIiiI")
+
+
+def _roll_pair(first: date, second: date):
+    """Two consecutive holidays, each moved past the weekend in turn
+    (Christmas/Boxing Day, and 1-2 January in Scotland)."""
+    while first.weekday() >= 5:
+        first += timedelta(days=1)
+    second = max(second, first + timedelta(days=1))
+    while second.weekday() >= 5:
+        second += timedelta(days=1)
+    return [first, second]
+
+
+def _next_monday_if_weekend(d: date) -> date:
+    return d + timedelta(days=7 - d.weekday()) if d.weekday() >= 5 else d
+
+
+def _easter_sunday(year: int) -> date:
+    # Anonymous Gregorian algorithm
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _first_monday(year: int, month: int) -> date:
+    d = date(year, month, 1)
+    return d + timedelta(days=(7 - d.weekday()) % 7)
+
+
+def _last_monday(year: int, month: int) -> date:
+    # Last day of the month without importing the calendar module
+    d = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return d - timedelta(days=d.weekday())
+
+
+# Royal/one-off bank holidays and moved fixed dates (England & Wales)
+_EW_ONE_OFF = {
+    date(1999, 12, 31), date(2002, 6, 3), date(2011, 4, 29),
+    date(2012, 6, 5), date(2022, 6, 3), date(2022, 9, 19), date(2023, 5, 8),
+}
+_EW_MOVED = {
+    # (year, holiday) -> actual date when moved by proclamation
+    (1995, "early_may"): date(1995, 5, 8),
+    (2020, "early_may"): date(2020, 5, 8),
+    (2002, "spring"): date(2002, 6, 4),
+    (2012, "spring"): date(2012, 6, 4),
+    (2022, "spring"): date(2022, 6, 2),
+}
+
+
+def england_wales_bank_holidays(first_year: int, last_year: int):
+    """Bank holidays in England & Wales for first_year..last_year inclusive.
+
+    Follows the post-1978 rules, including weekend substitute days.
+    """
+    out = []
+    for year in range(first_year, last_year + 1):
+        easter = _easter_sunday(year)
+        out += [
+            _next_monday_if_weekend(date(year, 1, 1)),
+            easter - timedelta(days=2),
+            easter + timedelta(days=1),
+            _EW_MOVED.get((year, "early_may"), _first_monday(year, 5)),
+            _EW_MOVED.get((year, "spring"), _last_monday(year, 5)),
+            _last_monday(year, 8),
+        ]
+        out += _roll_pair(date(year, 12, 25), date(year, 12, 26))
+    out += [d for d in _EW_ONE_OFF if first_year <= d.year <= last_year]
+    return sorted(set(out))
+
+
+def scotland_bank_holidays(first_year: int, last_year: int):
+    """Bank holidays in Scotland for first_year..last_year inclusive.
+
+    2 January instead of Easter Monday, the summer holiday on the first Monday
+    of August, and St Andrew's Day from 2007.
+    """
+    out = []
+    for year in range(first_year, last_year + 1):
+        out += _roll_pair(date(year, 1, 1), date(year, 1, 2))
+        out += [
+            _easter_sunday(year) - timedelta(days=2),
+            _EW_MOVED.get((year, "early_may"), _first_monday(year, 5)),
+            _EW_MOVED.get((year, "spring"), _last_monday(year, 5)),
+            _first_monday(year, 8),
+        ]
+        if year >= 2007:
+            out.append(_next_monday_if_weekend(date(year, 11, 30)))
+        out += _roll_pair(date(year, 12, 25), date(year, 12, 26))
+    out += [d for d in _EW_ONE_OFF if first_year <= d.year <= last_year]
+    return sorted(set(out))
+
+
+def northern_ireland_bank_holidays(first_year: int, last_year: int):
+    """Bank holidays in Northern Ireland: England & Wales plus St Patrick's
+    Day and the Battle of the Boyne, each moved to Monday at a weekend."""
+    out = england_wales_bank_holidays(first_year, last_year)
+    for year in range(first_year, last_year + 1):
+        out += [_next_monday_if_weekend(date(year, 3, 17)),
+                _next_monday_if_weekend(date(year, 7, 12))]
+    return sorted(set(out))
+
+
+# region key -> (menu label, rule function)
+REGIONS = {
+    "england-wales": ("England & Wales", england_wales_bank_holidays),
+    "scotland": ("Scotland", scotland_bank_holidays),
+    "northern-ireland": ("Northern Ireland", northern_ireland_bank_holidays),
+}
+
+
+# Every function a region's holidays are derived from, for the fingerprint
+_RULE_FUNCTIONS = (
+    _roll_pair, _next_monday_if_weekend, _easter_sunday, _first_monday, _last_monday,
+    england_wales_bank_holidays, scotland_bank_holidays, northern_ireland_bank_holidays,
+)
+
+
+def _code_crc(code, crc):
+    # Bytecode, names and constants, recursing into nested code (comprehensions);
+    # a new Python version changes the bytecode too, which just rebuilds the cache once
+    crc = zlib.crc32(code.co_code, crc)
+    crc = zlib.crc32(repr(code.co_names).encode(), crc)
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            crc = _code_crc(const, crc)
+        elif isinstance(const, frozenset):  # iteration order varies with hash seeding
+            crc = zlib.crc32(repr(sorted(const, key=repr)).encode(), crc)
+        else:
+            crc = zlib.crc32(repr(const).encode(), crc)
+    return crc
+
+
+def _fingerprint(region: str) -> int:
+    tables = (RULES_VERSION, region, sorted(_EW_ONE_OFF), sorted(_EW_MOVED.items()))
+    crc = zlib.crc32(repr(tables).encode())
+    for fn in _RULE_FUNCTIONS:
+        crc = _code_crc(fn.__code__, crc)
+    return crc
+
+
+def compile_region(region: str, first_year: int = FIRST_YEAR, last_year: int = LAST_YEAR):
+    """(holiday ordinals, holiday ranks) int32 arrays for one region."""
+    rules = REGIONS[region][1]
+    ordinals = array("i", sorted({d.toordinal() for d in rules(first_year, last_year) if d.weekday() < 5}))
+    ranks = array("i", (_weekday_rank(o) - i - 1 for i, o in enumerate(ordinals)))
+    return ordinals, ranks
+
+
+def cache_path(region: str, cache_dir: str = CACHE_DIR) -> str:
+    return os.path.join(cache_dir, f"holidays-{region}.bin")
+
+
+def _header(region, first_year, last_year, count):
+    return _HEADER.pack(_MAGIC, FORMAT_VERSION, sys.byteorder[0].encode(),
+                        _fingerprint(region), first_year, last_year, count)
+
+
+def write_cache(path, region, first_year=FIRST_YEAR, last_year=LAST_YEAR):
+    """Compile a region and atomically (re)write its cache file."""
+    ordinals, ranks = compile_region(region, first_year, last_year)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_header(region, first_year, last_year, len(ordinals)))
+        ordinals.tofile(f)
+        ranks.tofile(f)
+    os.replace(tmp, path)
+    return ordinals, ranks
+
+
+def _map_cache(path, region, first_year, last_year):
+    """Memory-mapped (ordinals, ranks) views, or None if the file is missing or stale."""
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):  # missing, unreadable or empty
+        return None
+    if len(mapped) < _HEADER.size:
+        mapped.close()
+        return None
+    count = _HEADER.unpack_from(mapped)[-1]
+    expected = _header(region, first_year, last_year, count)
+    if mapped[:_HEADER.size] != expected or len(mapped) != _HEADER.size + 8 * count:
+        mapped.close()
+        return None
+    # The views keep the mapping alive for as long as the calendar uses them
+    view = memoryview(mapped)
+    ordinals = view[_HEADER.size:_HEADER.size + 4 * count].cast("i")
+    ranks = view[_HEADER.size + 4 * count:].cast("i")
+    return ordinals, ranks
+
+
+def load_tables(region, first_year=FIRST_YEAR, last_year=LAST_YEAR, cache_dir=CACHE_DIR):
+    """(ordinals, ranks) for a region: mapped from the cache, rebuilt if stale.
+
+    Falls back to in-memory arrays if the cache directory is not writable.
+    """
+    if region not in REGIONS:
+        raise ValueError(f"unknown region {region!r}")
+    path = cache_path(region, cache_dir)
+    tables = _map_cache(path, region, first_year, last_year)
+    if tables is not None:
+        return tables
+    try:
+        write_cache(path, region, first_year, last_year)
+    except OSError:
+        return compile_region(region, first_year, last_year)
+    return _map_cache(path, region, first_year, last_year) or compile_region(region, first_year, last_year)
+
+
+_calendars = {}
+
+
+def region_calendar(region: str) -> BusinessCalendar:
+    """The BusinessCalendar for a region over FIRST_YEAR..LAST_YEAR, loaded once per process."""
+    cal = _calendars.get(region)
+    if cal is None:
+        cal = _calendars[region] = BusinessCalendar.from_tables(*load_tables(region))
+    return cal
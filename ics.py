@@ -0,0 +1,357 @@
+"""Streaming iCalendar (.ics) import and export.
+
+Import reads the file in fixed-size chunks, unfolds continuation lines and
+yields one row per VEVENT as soon as its END:VEVENT is seen, so memory stays
+flat however many events the file holds. start_import_thread() runs that on
+a background thread and hands batches over a bounded queue; the GUI drains
+it from Tk with after(). Export writes a date window line by line.
+"""
+import codecs
+import queue
+import threading
+from datetime import date, datetime, time, timedelta, timezone
+
+from recurrence import RecurrenceRule
+
+CHUNK_SIZE = 64 * 1024
+IMPORT_BATCH = 1000   # rows per queue message
+QUEUE_DEPTH = 8       # batches in flight; bounds memory when the GUI falls behind
+
+
+def unfolded_lines(fileobj, chunk_size=CHUNK_SIZE, progress=None):
+    """Logical content lines from a binary file object (RFC 5545 section 3.1 unfolding).
+
+    progress, if given, is called with the number of bytes consumed by each read.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+    tail = ""
+    current = None
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if progress is not None and chunk:
+            progress(len(chunk))
+        text = tail + decoder.decode(chunk, final=not chunk)
+        lines = text.split("\n")
+        tail = lines.pop() if chunk else ""
+        for line in lines:
+            line = line.rstrip("\r")
+            if line[:1] in (" ", "\t"):
+                if current is not None:
+                    current += line[1:]
+                continue
+            if current is not None:
+                yield current
+            current = line
+        if not chunk:
+            break
+    if current:
+        yield current
+
+
+def _split_property(line):
+    """(NAME, {PARAM: value}, value) for one content line."""
+    in_quotes = False
+    for i, ch in enumerate(line):
+        if ch == '"':
+            in_quotes = not in_quotes
+        elif ch == ":" and not in_quotes:
+            head, value = line[:i], line[i + 1:]
+            break
+    else:
+        return line.upper(), {}, ""
+    name, *params = head.split(";")
+    return name.upper(), dict(p.split("=", 1) for p in params if "=" in p), value
+
+
+def _unescape(text):
+    out = []
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch == "\\" and i + 1 < len(text):
+            nxt = text[i + 1]
+            out.append("\n" if nxt in "nN" else nxt)
+            i += 2
+        else:
+            out.append(ch)
+            i += 1
+    return "".join(out)
+
+
+def _escape(text):
+    return (text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def _parse_date(value):
+    # DATE or DATE-TIME, date part only (as written, in its own zone)
+    return date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+
+
+_VEVENT_PROPERTIES = ("SUMMARY", "DTSTART", "DTEND", "RRULE", "TRANSP")
+
+
+def _vevents(lines):
+    """Yield each VEVENT's properties as {NAME: (params, value)}.
+
+    Only the first of each of _VEVENT_PROPERTIES is kept; EXDATE is a list of
+    (params, value), one per date, gathered from all its lines.
+    """
+    props = None
+    for line in lines:
+        if props is None:
+            if line.upper() == "BEGIN:VEVENT":
+                props = {}
+            continue
+        if line.upper() == "END:VEVENT":
+            yield props
+            props = None
+            continue
+        name, params, value = _split_property(line)
+        if name == "EXDATE":
+            props.setdefault("EXDATE", []).extend((params, v) for v in value.split(",") if v)
+        elif name in _VEVENT_PROPERTIES and name not in props:
+            props[name] = (params, value)
+
+
+def iter_events(lines, local=None):
+    """Yield ("event", title, start, end) or ("series", title, rule) per VEVENT.
+
+    end is inclusive. UTC and TZID times are converted to the local zone
+    (local, a tzinfo; default: the system's) before their date is taken, so
+    an evening event abroad lands on the day it happens here. Rules this app
+    cannot expand are imported as their first occurrence only.
+    """
+    for props in _vevents(lines):
+        row = _vevent_row(props, local)
+        if row is not None:
+            yield row
+
+
+def _vevent_row(props, local=None):
+    if "DTSTART" not in props:
+        return None
+    try:
+        start_params, start_value = props["DTSTART"]
+        start = _local_datetime(start_params, start_value, local).date()
+        end = start
+        if "DTEND" in props:
+            end_params, end_value = props["DTEND"]
+            end_dt = _local_datetime(end_params, end_value, local)
+            end = end_dt.date()
+            # All-day DTEND (and a midnight DATE-TIME end) is exclusive
+            all_day = len(end_value) == 8 or end_params.get("VALUE", "").upper() == "DATE"
+            if (all_day or end_dt.time() == time()) and end > start:
+                end -= timedelta(days=1)
+            end = max(end, start)
+    except (ValueError, IndexError, OverflowError):
+        return None
+    title = _unescape(props.get("SUMMARY", ({}, ""))[1]) or "(no title)"
+    if "RRULE" in props:
+        try:
+            exdates = [_local_datetime(p, v, local).date() for p, v in props.get("EXDATE", [])]
+            rule = RecurrenceRule.from_rrule(props["RRULE"][1], start, exdates)
+            # Moving to local time can move the first date a day either way;
+            # BYDAY weekdays move with it
+            shift = (start - _parse_date(start_value)).days
+            if shift and rule.byday:
+                rule = RecurrenceRule(rule.freq, start, rule.interval,
+                                      [(n, (wd + shift) % 7) for n, wd in rule.byday],
+                                      rule.count, rule.until, exdates)
+            return ("series", title, rule)
+        except (ValueError, IndexError, KeyError):
+            pass
+    return ("event", title, start, end)
+
+
+def read_ics(path, progress=None, local=None):
+    """Yield import rows (see iter_events) from an .ics file, streaming."""
+    with open(path, "rb") as f:
+        yield from iter_events(unfolded_lines(f, progress=progress), local)
+
+
+def _parse_datetime(value):
+    # Wall-clock time as written (see _source_zone for its zone); a DATE is midnight
+    if len(value) == 8:
+        return datetime(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+    return datetime(int(value[0:4]), int(value[4:6]), int(value[6:8]),
+                    int(value[9:11]), int(value[11:13]))
+
+
+# Windows zone names that Outlook writes as TZID, for the commonest zones
+_WINDOWS_ZONES = {
+    "GMT Standard Time": "Europe/London",
+    "Greenwich Standard Time": "Atlantic/Reykjavik",
+    "W. Europe Standard Time": "Europe/Berlin",
+    "Romance Standard Time": "Europe/Paris",
+    "Central Europe Standard Time": "Europe/Budapest",
+    "E. Europe Standard Time": "Europe/Bucharest",
+    "Eastern Standard Time": "America/New_York",
+    "Central Standard Time": "America/Chicago",
+    "Mountain Standard Time": "America/Denver",
+    "Pacific Standard Time": "America/Los_Angeles",
+    "India Standard Time": "Asia/Kolkata",
+    "Tokyo Standard Time": "Asia/Tokyo",
+    "AUS Eastern Standard Time": "Australia/Sydney",
+}
+
+
+def _source_zone(params, value):
+    """tzinfo a DATE-TIME is written in, or None for floating (and DATE) values."""
+    if len(value) > 8 and value.endswith(("Z", "z")):
+        return timezone.utc
+    tzid = params.get("TZID", "").strip('"')
+    if not tzid or len(value) == 8:
+        return None
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+    try:
+        return ZoneInfo(_WINDOWS_ZONES.get(tzid, tzid))
+    except (ZoneInfoNotFoundError, ValueError):
+        return None  # unknown zone (or no tz database): taken as local time
+
+
+def _localize(dt, zone, local):
+    if zone is None:
+        return dt
+    return dt.replace(tzinfo=zone).astimezone(local).replace(tzinfo=None)
+
+
+def _local_datetime(params, value, local):
+    """A DTSTART/DTEND/EXDATE value as a naive local datetime."""
+    return _localize(_parse_datetime(value), _source_zone(params, value), local)
+
+
+def iter_busy(lines, first=None, last=None, local=None):
+    """Yield (start, end) busy datetimes per VEVENT, end exclusive.
+
+    UTC ("Z") and TZID times are converted to the local zone (local, a
+    tzinfo; default: the system's) so they line up with working hours;
+    floating times are already local. All-day events block whole days;
+    TRANSP:TRANSPARENT events are skipped. Recurring events are expanded
+    in their own zone between the first..last dates (only their first
+    occurrence is used when last is None).
+    """
+    for props in _vevents(lines):
+        try:
+            if "DTSTART" not in props or props.get("TRANSP", ({}, ""))[1].upper() == "TRANSPARENT":
+                continue
+            start_params, start_value = props["DTSTART"]
+            zone = _source_zone(start_params, start_value)
+            start = _parse_datetime(start_value)
+            if "DTEND" in props:
+                end = _local_datetime(*props["DTEND"], local)
+            else:
+                end = _localize(start + timedelta(days=1) if len(start_value) == 8 else start, zone, local)
+            length = end - _localize(start, zone, local)
+            if length <= timedelta(0):
+                continue
+            if "RRULE" not in props or last is None:
+                yield _localize(start, zone, local), end
+                continue
+            exdates = [_parse_date(v) for _, v in props.get("EXDATE", [])]
+            rule = RecurrenceRule.from_rrule(props["RRULE"][1], start.date(), exdates)
+            # Occurrences keep their wall-clock time in the event's own zone across DST changes
+            for d in rule.occurrences(first, last):
+                s = _localize(datetime.combine(d, start.time()), zone, local)
+                yield s, s + length
+        except (ValueError, IndexError, KeyError):
+            continue
+
+
+def read_busy(path, first=None, last=None, local=None):
+    """Busy (start, end) datetimes from an .ics file (see iter_busy)."""
+    with open(path, "rb") as f:
+        return list(iter_busy(unfolded_lines(f), first, last, local))
+
+
+def start_import_thread(path, out_queue, batch_size=IMPORT_BATCH):
+    """Parse `path` on a daemon thread, posting messages to out_queue:
+
+    ("batch", rows, bytes_read), then ("done", total_rows, bytes_read)
+    or ("error", message, bytes_read).
+    """
+    def run():
+        consumed = [0]
+
+        def progress(n):
+            consumed[0] += n
+
+        total = 0
+        batch = []
+        try:
+            for row in read_ics(path, progress):
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    out_queue.put(("batch", batch, consumed[0]))
+                    total += len(batch)
+                    batch = []
+            if batch:
+                out_queue.put(("batch", batch, consumed[0]))
+                total += len(batch)
+            out_queue.put(("done", total, consumed[0]))
+        except Exception as exc:
+            out_queue.put(("error", str(exc), consumed[0]))
+
+    thread = threading.Thread(target=run, name="ics-import", daemon=True)
+    thread.start()
+    return thread
+
+
+def new_import_queue():
+    return queue.Queue(maxsize=QUEUE_DEPTH)
+
+
+def _fold(line):
+    """Fold a content line at 75 octets (continuations start with a space)."""
+    data = line.encode("utf-8")
+    if len(data) <= 75:
+        return line + "\r\n"
+    parts = []
+    limit = 75
+    while data:
+        cut = min(limit, len(data))
+        while cut < len(data) and (data[cut] & 0xC0) == 0x80:
+            cut -= 1  # don't split a UTF-8 sequence
+        parts.append(data[:cut].decode("utf-8"))
+        data = data[cut:]
+        limit = 74
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _vevent_lines(uid, title, start, end, stamp):
+    yield "BEGIN:VEVENT"
+    yield f"UID:{uid}"
+    yield f"DTSTAMP:{stamp}"
+    yield f"DTSTART;VALUE=DATE:{start:%Y%m%d}"
+    yield f"DTEND;VALUE=DATE:{end + timedelta(days=1):%Y%m%d}"
+    yield f"SUMMARY:{_escape(title)}"
+    yield "END:VEVENT"
+
+
+def iter_ics(store, first, last):
+    """Folded .ics lines for everything in store overlapping first..last.
+
+    Repeating series are written as their individual occurrences in the window.
+    """
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    yield _fold("BEGIN:VCALENDAR")
+    yield _fold("VERSION:2.0")
+    yield _fold("PRODID:-//Smart Calendar//EN")
+    for event in store.overlapping(first, last):
+        for line in _vevent_lines(f"{event.id}@smart-calendar", event.title, event.start, event.end, stamp):
+            yield _fold(line)
+    for d, series in store.occurrences(first, last):
+        for line in _vevent_lines(f"s{series.id}-{d:%Y%m%d}@smart-calendar", series.title, d, d, stamp):
+            yield _fold(line)
+    yield _fold("END:VCALENDAR")
+
+
+def export_ics(path, store, first, last):
+    """Write the first..last window to `path`, streaming; returns the VEVENT count."""
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        for line in iter_ics(store, first, last):
+            if line.startswith("BEGIN:VEVENT"):
+                count += 1
+            f.write(line)
+    return count
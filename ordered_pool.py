@@ -0,0 +1,29 @@
+"""Ordered, bounded fan-out over a concurrent.futures executor.
+
+Used where workers produce large results (shard outputs, rendered pages)
+that must be consumed in input order without queueing all of them.
+"""
+from collections import deque
+
+
+def bounded_map(pool, fn, arg_tuples, window):
+    """Yield fn(*args) for each args in input order, computed on pool.
+
+    At most `window` calls are pending, plus the result being consumed, so
+    results waiting behind a slow one stay bounded. The next call is
+    submitted before a result is yielded, keeping workers busy meanwhile.
+    """
+    pending = deque()
+    todo = iter(arg_tuples)
+
+    def submit_next():
+        for args in todo:
+            pending.append(pool.submit(fn, *args))
+            return
+
+    for _ in range(window):
+        submit_next()
+    while pending:
+        result = pending.popleft().result()
+        submit_next()
+        yield result
@@ -0,0 +1,182 @@
+"""Opt-in timing of GUI hot paths.
+
+Methods decorated with @profiled cost one global lookup while profiling is
+off. Once enable() is called, each call's wall time and the number of Tk
+round trips it made are added to per-name histograms, which snapshot() /
+dump() turn into JSON.
+
+Set SMART_CALENDAR_PROFILE=1 to profile from startup, or to a file name to
+also write the histograms there when the app exits; View → Record Timings
+toggles it at run time.
+"""
+import atexit
+import functools
+import json
+import os
+import time
+from bisect import bisect_left
+
+ENV_VAR = "SMART_CALENDAR_PROFILE"
+# Histogram bucket upper bounds: microseconds for timings, counts for Tk calls
+TIME_BUCKETS_US = (10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 16000, 33000, 100000, 1000000)
+TK_CALL_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+_profiler = None  # created on first enable(); kept so re-enabling resumes it
+_active = None    # _profiler while recording, else None
+
+
+class Histogram:
+    """Fixed-bucket histogram with exact count, total, min and max."""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last bucket: above the top bound
+        self.n = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.n += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-th quantile (max if beyond the top)."""
+        if not self.n:
+            return None
+        rank = q * self.n
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self):
+        labels = [f"<={b}" for b in self.bounds] + [f">{self.bounds[-1]}"]
+        return {
+            "count": self.n,
+            "total": self.total,
+            "mean": self.total / self.n if self.n else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "buckets": {label: c for label, c in zip(labels, self.counts) if c},
+        }
+
+
+class TkCallCounter:
+    """Stand-in for a Tk interpreter object that counts call() round trips.
+
+    Tk widgets copy their master's .tk, so installing one on the root before
+    (or swapping it into) the widget tree counts every widget's Tcl calls.
+    """
+
+    def __init__(self, tkapp):
+        self._tkapp = tkapp
+        self.calls = 0
+
+    def call(self, *args):
+        self.calls += 1
+        return self._tkapp.call(*args)
+
+    def __getattr__(self, name):
+        return getattr(self._tkapp, name)
+
+
+class Profiler:
+    def __init__(self, tk_counter=None):
+        self.tk_counter = tk_counter
+        self.timings = {}   # name -> Histogram of microseconds
+        self.tk_calls = {}  # name -> Histogram of Tk calls per call
+
+    def measure(self, name, fn, args, kwargs):
+        counter = self.tk_counter
+        calls0 = counter.calls if counter is not None else 0
+        t0 = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            us = (time.perf_counter() - t0) * 1e6
+            hist = self.timings.get(name)
+            if hist is None:
+                hist = self.timings[name] = Histogram(TIME_BUCKETS_US)
+                self.tk_calls[name] = Histogram(TK_CALL_BUCKETS)
+            hist.add(us)
+            if counter is not None:
+                self.tk_calls[name].add(counter.calls - calls0)
+
+    def reset(self):
+        self.timings.clear()
+        self.tk_calls.clear()
+
+    def snapshot(self):
+        """{name: {"time_us": {...}, "tk_calls": {...}}}, slowest total first."""
+        names = sorted(self.timings, key=lambda n: self.timings[n].total, reverse=True)
+        return {
+            name: {"time_us": self.timings[name].to_dict(),
+                   "tk_calls": self.tk_calls[name].to_dict() if self.tk_counter is not None else None}
+            for name in names
+        }
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+
+def profiled(fn):
+    """Decorator: time calls to fn (under its qualified name) while profiling is enabled."""
+    name = fn.__qualname__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        prof = _active
+        if prof is None:
+            return fn(*args, **kwargs)
+        return prof.measure(name, fn, args, kwargs)
+    return wrapper
+
+
+def enable(tk_counter=None):
+    """Start recording (keeping histograms from an earlier session); returns the Profiler."""
+    global _profiler, _active
+    if _profiler is None:
+        _profiler = Profiler(tk_counter)
+    elif tk_counter is not None:
+        _profiler.tk_counter = tk_counter
+    _active = _profiler
+    return _profiler
+
+
+def disable():
+    """Stop recording; returns the Profiler (or None if never enabled) for inspection."""
+    global _active
+    _active = None
+    return _profiler
+
+
+def is_enabled():
+    return _active is not None
+
+
+def profiler():
+    """The Profiler, recording or not (None if profiling was never enabled)."""
+    return _profiler
+
+
+def enable_from_env():
+    """Enable if ENV_VAR is set; a value other than 1/true names the JSON file written at exit."""
+    value = os.environ.get(ENV_VAR, "").strip()
+    if not value or value.lower() in ("0", "false", "no"):
+        return None
+    prof = enable()
+    if value.lower() not in ("1", "true", "yes"):
+        atexit.register(prof.dump, value)
+    return prof
@@ -0,0 +1,94 @@
+"""Closed-form statistics for a date range.
+
+Every count is derived from ordinal arithmetic (and a bisect over the
+holiday table), so a range spanning centuries costs the same as a week.
+Per-month and per-ISO-week breakdowns are generated lazily, one O(log h)
+step per row, for callers that want to list them.
+"""
+from collections import namedtuple
+from datetime import date, timedelta
+
+from workdays import working_days_between
+
+RangeStats = namedtuple("RangeStats", [
+    "first", "last",
+    "days",            # calendar days, inclusive
+    "working_days",
+    "weekday_counts",  # 7 counts, Monday first
+    "weekend_days",    # days off (Saturdays + Sundays, or per the calendar's work pattern)
+    "holidays",        # holidays falling on working days
+    "months",          # calendar months touched
+    "iso_weeks",       # Monday-Sunday weeks touched
+    "full_weeks",      # weeks entirely inside the range
+    "partial_weeks",   # weeks cut by either end
+])
+
+
+def weekday_counts(a: date, b: date):
+    """Occurrences of each weekday (Monday first) in a..b inclusive."""
+    lo, hi = a.toordinal(), b.toordinal()
+    # Ordinal o falls on weekday (o - 1) % 7; count o in [lo, hi] per residue
+    return tuple((hi - r) // 7 - (lo - 1 - r) // 7 for r in (1, 2, 3, 4, 5, 6, 0))
+
+
+def _monday(d: date) -> date:
+    return d - timedelta(days=d.weekday())
+
+
+def range_stats(a: date, b: date, business_calendar=None) -> RangeStats:
+    """Statistics for the inclusive range between a and b (in either order).
+
+    Working days and holidays follow business_calendar (plain Mon-Fri if None).
+    """
+    if a > b:
+        a, b = b, a
+    days = (b - a).days + 1
+    per_weekday = weekday_counts(a, b)
+    if business_calendar is None:
+        working, holidays = working_days_between(a, b), 0
+    else:
+        working = business_calendar.working_days_between(a, b)
+        holidays = business_calendar.holidays_between(a, b)
+    iso_weeks = (_monday(b) - _monday(a)).days // 7 + 1
+    # Full weeks run from the first Monday on/after a to the last Sunday on/before b
+    first_monday = a + timedelta(days=-a.weekday() % 7)
+    last_sunday = b - timedelta(days=(b.weekday() + 1) % 7)
+    full_weeks = max(0, ((last_sunday - first_monday).days + 1) // 7)
+    return RangeStats(
+        a, b, days, working, per_weekday, days - working - holidays, holidays,
+        (b.year - a.year) * 12 + b.month - a.month + 1,
+        iso_weeks, full_weeks, iso_weeks - full_weeks,
+    )
+
+
+def _count_working(a, b, business_calendar):
+    if business_calendar is None:
+        return working_days_between(a, b)
+    return business_calendar.working_days_between(a, b)
+
+
+def iter_months(stats: RangeStats, business_calendar=None):
+    """Yield (year, month, days, working days) for each month the range touches."""
+    a, b = stats.first, stats.last
+    year, month = a.year, a.month
+    while (year, month) <= (b.year, b.month):
+        nxt = date(year + month // 12, month % 12 + 1, 1) if (year, month) < (b.year, b.month) else None
+        lo = max(a, date(year, month, 1))
+        hi = nxt - timedelta(days=1) if nxt else b
+        yield year, month, (hi - lo).days + 1, _count_working(lo, hi, business_calendar)
+        if nxt is None:
+            return
+        year, month = nxt.year, nxt.month
+
+
+def iter_iso_weeks(stats: RangeStats, business_calendar=None):
+    """Yield (ISO year, ISO week, days, working days) for each week the range touches."""
+    a, b = stats.first, stats.last
+    monday = _monday(a)
+    while monday <= b:
+        lo, hi = max(a, monday), min(b, monday + timedelta(days=6))
+        iso_year, iso_week, _ = monday.isocalendar()
+        yield iso_year, iso_week, (hi - lo).days + 1, _count_working(lo, hi, business_calendar)
+        if hi == b:
+            return
+        monday += timedelta(days=7)
@@ -0,0 +1,213 @@
+"""Recurrence rules expanded lazily.
+
+A RecurrenceRule describes a repeating all-day event in the spirit of RFC 5545
+RRULE: DAILY/WEEKLY/MONTHLY/YEARLY with INTERVAL, BYDAY, COUNT, UNTIL and
+excluded dates, plus WORKDAYS, which steps with add_working_days. Occurrences
+come from a generator that jumps straight to the requested window, so nothing
+outside the painted range is ever materialized.
+"""
+from datetime import date, timedelta
+
+from calendar_layout import shift_month
+from workdays import add_working_days, working_days_between
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY", "WORKDAYS")
+WEEKDAY_CODES = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+_RRULE_PARTS = {"FREQ", "INTERVAL", "BYDAY", "COUNT", "UNTIL", "WKST"}
+
+
+def _month_length(year, month):
+    y, m = shift_month(year, month, 1)
+    return (date(y, m, 1) - date(year, month, 1)).days
+
+
+def _nth_weekday(year, month, n, weekday):
+    """Dates of `weekday` in the month: all of them (n=0), the nth, or nth from the end (n<0)."""
+    first = date(year, month, 1)
+    first_hit = first + timedelta(days=(weekday - first.weekday()) % 7)
+    hits = []
+    d = first_hit
+    while d.month == month:
+        hits.append(d)
+        d += timedelta(days=7)
+    if n == 0:
+        return hits
+    if -len(hits) <= n <= len(hits):
+        return [hits[n - 1 if n > 0 else n]]
+    return []
+
+
+class RecurrenceRule:
+    """One repeating series starting at `start`.
+
+    byday is a sequence of (n, weekday) pairs with weekday 0=Mon..6=Sun and n
+    the position within the month (0 = every such weekday, -1 = last, ...).
+    n only matters for MONTHLY; WEEKLY and DAILY use byday as a weekday filter.
+    exdates are skipped but still count towards `count`, as in RFC 5545.
+    WORKDAYS series start on the first working day on or after `start`.
+    Treat rules as immutable (they hash by value); edit a series by replacing its rule.
+    """
+
+    def __init__(self, freq, start, interval=1, byday=(), count=None, until=None,
+                 exdates=(), calendar=None):
+        freq = freq.upper()
+        if freq not in FREQUENCIES:
+            raise ValueError(f"unsupported frequency {freq!r}")
+        if interval < 1:
+            raise ValueError("interval must be >= 1")
+        if byday and freq in ("YEARLY", "WORKDAYS"):
+            raise ValueError(f"BYDAY is not supported with {freq}")
+        self.freq = freq
+        self.start = start
+        self.interval = interval
+        self.byday = tuple(sorted(set(byday)))
+        self.count = count
+        self.until = until
+        self.exdates = frozenset(exdates)
+        # WORKDAYS steps with this calendar's add_working_days (plain Mon-Fri if None)
+        self.calendar = calendar
+
+    def _key(self):
+        return (self.freq, self.start, self.interval, self.byday, self.count, self.until,
+                self.exdates, id(self.calendar) if self.calendar is not None else None)
+
+    def __eq__(self, other):
+        return isinstance(other, RecurrenceRule) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return f"RecurrenceRule({self.to_rrule()!r}, start={self.start!r})"
+
+    def with_calendar(self, calendar):
+        """The same rule, stepping WORKDAYS with another BusinessCalendar."""
+        if calendar is self.calendar:
+            return self
+        return RecurrenceRule(self.freq, self.start, self.interval, self.byday, self.count, self.until,
+                              self.exdates, calendar)
+
+    # --- RRULE text (used for storage and .ics) ---
+
+    def to_rrule(self) -> str:
+        parts = [f"FREQ={self.freq}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.byday:
+            parts.append("BYDAY=" + ",".join(
+                f"{n if n else ''}{WEEKDAY_CODES[wd]}" for n, wd in self.byday))
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.until is not None:
+            parts.append(f"UNTIL={self.until:%Y%m%d}")
+        return ";".join(parts)
+
+    @classmethod
+    def from_rrule(cls, text, start, exdates=(), calendar=None):
+        fields = {k.upper(): v for k, v in (part.split("=", 1) for part in text.strip().split(";") if "=" in part)}
+        unsupported = set(fields) - _RRULE_PARTS
+        if unsupported:
+            raise ValueError(f"unsupported RRULE parts: {', '.join(sorted(unsupported))}")
+        if "FREQ" not in fields:
+            raise ValueError("RRULE has no FREQ")
+        byday = []
+        for code in filter(None, fields.get("BYDAY", "").split(",")):
+            n = int(code[:-2]) if code[:-2] else 0
+            byday.append((n, WEEKDAY_CODES.index(code[-2:].upper())))
+        until = fields.get("UNTIL")
+        if until:
+            until = date(int(until[0:4]), int(until[4:6]), int(until[6:8]))
+        count = fields.get("COUNT")
+        return cls(fields["FREQ"], start, int(fields.get("INTERVAL", 1)), byday,
+                   int(count) if count else None, until or None, exdates, calendar)
+
+    # --- expansion ---
+
+    def _add_working_days(self, start, days):
+        if self.calendar is not None:
+            return self.calendar.add_working_days(start, days)
+        return add_working_days(start, days)
+
+    def _first_workday(self):
+        return self._add_working_days(self.start - timedelta(days=1), 1)
+
+    def _first_period(self, first):
+        """A period index at or before the one containing `first` (only valid without COUNT)."""
+        s, step = self.start, self.interval
+        if first <= s:
+            return 0
+        if self.freq == "DAILY":
+            return (first - s).days // step
+        if self.freq == "WEEKLY":
+            return ((first - s).days // 7) // step
+        if self.freq == "MONTHLY":
+            return ((first.year - s.year) * 12 + first.month - s.month) // step
+        if self.freq == "YEARLY":
+            return (first.year - s.year) // step
+        # WORKDAYS: working days strictly between the first occurrence and first
+        s = self._first_workday()
+        if first <= s:
+            return 0
+        if self.calendar is not None:
+            between = self.calendar.working_days_between
+        else:
+            between = working_days_between
+        gap = between(s + timedelta(days=1), first - timedelta(days=1)) if (first - s).days > 1 else 0
+        return max(0, gap // step)
+
+    def _period(self, p):
+        """(earliest possible date, candidate dates) of period p, in order."""
+        s, k = self.start, self.interval * p
+        if self.freq == "DAILY":
+            d = s + timedelta(days=k)
+            if self.byday and d.weekday() not in {wd for _, wd in self.byday}:
+                return d, []
+            return d, [d]
+        if self.freq == "WEEKLY":
+            monday = s - timedelta(days=s.weekday()) + timedelta(weeks=k)
+            if not self.byday:
+                return monday, [s + timedelta(weeks=k)]
+            return monday, sorted({monday + timedelta(days=wd) for _, wd in self.byday})
+        if self.freq == "MONTHLY":
+            y, m = shift_month(s.year, s.month, k)
+            anchor = date(y, m, 1)
+            if not self.byday:
+                return anchor, [date(y, m, s.day)] if s.day <= _month_length(y, m) else []
+            hits = set()
+            for n, wd in self.byday:
+                hits.update(_nth_weekday(y, m, n, wd))
+            return anchor, sorted(hits)
+        if self.freq == "YEARLY":
+            y = s.year + k
+            anchor = date(y, 1, 1)
+            if s.month == 2 and s.day == 29 and _month_length(y, 2) == 28:
+                return anchor, []
+            return anchor, [date(y, s.month, s.day)]
+        d = self._add_working_days(self._first_workday(), k)
+        return d, [d]
+
+    def occurrences(self, first=None, last=None):
+        """Yield occurrence dates in first..last (either bound may be None), ascending."""
+        # COUNT is defined from the series start, so only uncounted rules can jump ahead
+        p = self._first_period(first) if first is not None and self.count is None else 0
+        stop = min((b for b in (last, self.until) if b is not None), default=None)
+        seen = 0
+        while True:
+            try:
+                anchor, dates = self._period(p)
+            except (OverflowError, ValueError):
+                return  # ran off the end of the supported date range
+            if stop is not None and anchor > stop:
+                return
+            for d in dates:
+                if d < self.start:
+                    continue
+                if stop is not None and d > stop:
+                    return
+                seen += 1
+                if self.count is not None and seen > self.count:
+                    return
+                if d in self.exdates or (first is not None and d < first):
+                    continue
+                yield d
+            p += 1
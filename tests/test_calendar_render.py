@@ -0,0 +1,92 @@
+import re
+import xml.etree.ElementTree as ET
+import zlib
+from datetime import date
+
+import pytest
+
+from calendar_layout import PALETTE, WEEKDAYS, month_layout
+from calendar_render import export, export_batch
+from workdays import WORK_PATTERNS
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def _expected_days(year, month, pattern=None):
+    layout = month_layout(year, month, pattern)
+    out = []
+    for r, week in enumerate(layout.weeks):
+        for c, d in enumerate(week or ()):
+            if layout.outside[r][c]:
+                fg = PALETTE["outside_fg"]
+            else:
+                fg = PALETTE["weekend_fg" if layout.weekend[r][c] else "day_fg"]
+            out.append((str(d.day), fg))
+    return out
+
+
+def _check_pdf(data, pages):
+    assert data.startswith(b"%PDF-1.4\n") and data.endswith(b"%%EOF\n")
+    startxref = int(re.search(rb"startxref\n(\d+)\n%%EOF\n$", data).group(1))
+    assert data[startxref:].startswith(b"xref\n")
+    table = re.match(rb"xref\n0 (\d+)\n0000000000 65535 f \n((?:\d{10} 00000 n \n)*)trailer\n",
+                     data[startxref:])
+    count, entries = int(table.group(1)), table.group(2).split(b"\n")[:-1]
+    assert len(entries) == count - 1
+    for num, entry in enumerate(entries, 1):
+        offset = int(entry[:10])
+        assert data[offset:].startswith(b"%d 0 obj\n" % num)
+    assert re.search(rb"trailer\n<< /Size %d /Root 1 0 R >>" % count, data)
+    assert re.search(rb"/Type /Pages /Count %d /Kids \[" % pages, data)
+    assert data.count(b"/Type /Page ") == pages
+
+
+@pytest.mark.parametrize("pattern_key", ["mon-fri", "sun-thu"])
+def test_svg_pages_parse_and_show_the_month_layout(tmp_path, pattern_key):
+    written = export(str(tmp_path / "cal.svg"), "month", [2026], pattern_key=pattern_key)
+    assert len(written) == 12
+    pattern = WORK_PATTERNS[pattern_key][1]
+    for month, path in enumerate(written, 1):
+        assert path.endswith(f"cal-2026-{month:02d}.svg")
+        root = ET.parse(path).getroot()
+        assert root.tag == f"{SVG}svg"
+        texts = [(t.text, t.get("fill")) for t in root.iter(f"{SVG}text")]
+        title, dow, days = texts[0], texts[1:8], texts[8:]
+        assert title[0] == date(2026, month, 1).strftime("%B %Y")
+        assert [t for t, _ in dow] == [name[:2] for name in WEEKDAYS]
+        assert days == _expected_days(2026, month, pattern)
+
+
+def test_pdf_has_a_valid_xref_and_trailer(tmp_path):
+    path = tmp_path / "planner.pdf"
+    assert export(str(path), "year", [2026, 2027], week_numbers=True) == [str(path)]
+    _check_pdf(path.read_bytes(), 2)
+
+
+def test_pdf_pages_draw_the_month_layout(tmp_path):
+    path = tmp_path / "months.pdf"
+    export(str(path), "month", [2025])
+    data = path.read_bytes()
+    _check_pdf(data, 12)
+    streams = list(re.finditer(rb"/Length (\d+) /Filter /FlateDecode >>\nstream\n", data))
+    assert len(streams) == 12
+    for month, match in enumerate(streams, 1):
+        content = zlib.decompress(data[match.end():match.end() + int(match.group(1))])
+        shown = re.findall(rb"\((.*?)\) Tj", content)
+        assert [s.decode() for s in shown[8:]] == [day for day, _ in _expected_days(2025, month)]
+
+
+def test_parallel_export_matches_serial(tmp_path):
+    serial, parallel = tmp_path / "serial.pdf", tmp_path / "parallel.pdf"
+    export(str(serial), "3-month", [2024, 2025, 2026])
+    export(str(parallel), "3-month", [2024, 2025, 2026], workers=2)
+    assert parallel.read_bytes() == serial.read_bytes()
+    _check_pdf(serial.read_bytes(), 12)
+
+
+def test_export_batch_writes_one_pdf_per_year(tmp_path):
+    written = export_batch(str(tmp_path / "out"), "year", [2030, 2031], workers=1)
+    assert [p.rsplit("/", 1)[1] for p in written] == ["year-2030.pdf", "year-2031.pdf"]
+    for path in written:
+        with open(path, "rb") as f:
+            _check_pdf(f.read(), 1)
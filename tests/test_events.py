@@ -0,0 +1,67 @@
+import random
+from datetime import date
+
+from events import EventStore, IntervalIndex
+from holiday_rules import region_calendar
+from recurrence import RecurrenceRule
+
+
+def test_removed_pending_interval_is_not_returned():
+    index = IntervalIndex()
+    index.add(10, 20, "a")
+    index.remove("a")
+    assert index.query(0, 100) == []
+
+
+def test_readded_key_replaces_its_interval():
+    index = IntervalIndex([(10, 20, "a")])
+    index.add(50, 60, "a")
+    assert index.query(10, 20) == []
+    assert index.query(55, 55) == ["a"]
+
+
+def test_query_matches_brute_force_under_random_updates():
+    rng = random.Random(11)
+    index = IntervalIndex()
+    live = {}
+    for step in range(3000):
+        op = rng.random()
+        if op < 0.45 or not live:
+            s = rng.randrange(1000)
+            key = rng.randrange(400)
+            live[key] = (s, s + rng.randrange(30))
+            index.add(*live[key], key)
+        elif op < 0.8:
+            key = rng.choice(list(live))
+            del live[key]
+            index.remove(key)
+        lo = rng.randrange(1000)
+        hi = lo + rng.randrange(50)
+        expected = sorted(k for k, (s, e) in live.items() if s <= hi and e >= lo)
+        assert sorted(index.query(lo, hi)) == expected, step
+
+
+def test_store_counts_after_removing_new_event():
+    store = EventStore(path=None)
+    event = store.add("Dentist", date(2025, 3, 4))
+    store.remove(event.id)
+    assert sum(store.counts_by_day(date(2025, 3, 1), date(2025, 3, 31))) == 0
+    assert list(store.overlapping(date(2025, 3, 1), date(2025, 3, 31))) == []
+
+
+def test_workdays_series_follow_the_store_calendar(tmp_path):
+    uk = region_calendar("england-wales")
+    path = str(tmp_path / "events.db")
+    store = EventStore(path, calendar=uk)
+    store.add_series("Stand-up", RecurrenceRule("WORKDAYS", date(2025, 12, 24)))
+    store.close()
+
+    week = (date(2025, 12, 22), date(2025, 12, 31))
+    reloaded = EventStore(path, calendar=uk)
+    assert [d for d, _ in reloaded.occurrences(*week)] == [
+        date(2025, 12, 24), date(2025, 12, 29), date(2025, 12, 30), date(2025, 12, 31)]
+    reloaded.set_calendar(None)  # plain Mon-Fri
+    assert [d for d, _ in reloaded.occurrences(*week)] == [
+        date(2025, 12, 24), date(2025, 12, 25), date(2025, 12, 26), date(2025, 12, 29),
+        date(2025, 12, 30), date(2025, 12, 31)]
+    reloaded.close()
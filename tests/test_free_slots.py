@@ -0,0 +1,55 @@
+import random
+from datetime import date, datetime, timedelta
+
+from free_slots import BusySchedule, BusyUnion, find_free_slots, merge_busy
+from workdays import UK_CALENDAR
+
+
+def _random_intervals(rng, n):
+    out = []
+    for _ in range(n):
+        s = datetime(2025, 3, 3, 8) + timedelta(minutes=15 * rng.randrange(2000))
+        e = s + timedelta(minutes=15 * rng.randrange(-1, 12))
+        if rng.random() < 0.05:
+            s, e = s.date(), s.date() + timedelta(days=1)  # all day
+        out.append((s, e))
+    return out
+
+
+def _brute_merge(intervals):
+    minutes = sorted((datetime.combine(s, datetime.min.time()) if type(s) is date else s,
+                      datetime.combine(e, datetime.min.time()) if type(e) is date else e)
+                     for s, e in intervals)
+    merged = []
+    for s, e in minutes:
+        if e <= s:
+            continue
+        if merged and s <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], e)
+        else:
+            merged.append([s, e])
+    return [(s, e) for s, e in merged]
+
+
+def test_schedule_and_union_match_a_brute_force_merge():
+    rng = random.Random(20)
+    people = [_random_intervals(rng, rng.randrange(40)) for _ in range(30)]
+    schedules = [BusySchedule(p) for p in people]
+    union = BusyUnion(schedules)
+    assert union.intervals == list(merge_busy(schedules))
+    expected = _brute_merge([iv for p in people for iv in p])
+    got = [(datetime(1, 1, 1) + timedelta(minutes=s - 1440), datetime(1, 1, 1) + timedelta(minutes=e - 1440))
+           for s, e in union.intervals]
+    assert got == expected
+
+
+def test_union_query_matches_the_lazy_sweep():
+    rng = random.Random(21)
+    schedules = [BusySchedule(_random_intervals(rng, 60)) for _ in range(25)]
+    union = BusyUnion(schedules)
+    for _ in range(40):
+        start = datetime(2025, 3, 1) + timedelta(minutes=30 * rng.randrange(1500))
+        duration = timedelta(minutes=rng.choice((15, 30, 60, 240)))
+        lazy = find_free_slots(schedules, start, duration, 4, business_calendar=UK_CALENDAR, horizon_days=40)
+        assert find_free_slots(union, start, duration, 4, business_calendar=UK_CALENDAR,
+                               horizon_days=40) == lazy
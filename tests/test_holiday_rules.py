@@ -0,0 +1,87 @@
+import os
+from datetime import date
+
+import pytest
+
+import holiday_rules
+from holiday_rules import (_HEADER, REGIONS, _map_cache, cache_path, compile_region, load_tables,
+                           northern_ireland_bank_holidays, scotland_bank_holidays)
+
+D = date
+SPAN = (2000, 2030)
+
+
+def _load(region, tmp_path):
+    ordinals, ranks = load_tables(region, *SPAN, cache_dir=str(tmp_path))
+    return list(ordinals), list(ranks)
+
+
+def _fresh(region):
+    ordinals, ranks = compile_region(region, *SPAN)
+    return list(ordinals), list(ranks)
+
+
+@pytest.mark.parametrize("region", REGIONS)
+def test_cached_load_matches_a_fresh_compile(region, tmp_path):
+    assert _load(region, tmp_path) == _fresh(region)  # writes the cache
+    mapped = _map_cache(cache_path(region, str(tmp_path)), region, *SPAN)
+    assert mapped is not None
+    assert (list(mapped[0]), list(mapped[1])) == _fresh(region)
+
+
+@pytest.mark.parametrize("damage", ["header", "truncate", "empty"])
+def test_damaged_cache_is_rebuilt(damage, tmp_path):
+    region = "scotland"
+    path = cache_path(region, str(tmp_path))
+    _load(region, tmp_path)
+    with open(path, "r+b") as f:
+        if damage == "header":
+            f.seek(_HEADER.size - 8)
+            f.write(b"\xff\xff\xff\xff")
+        else:
+            f.truncate(0 if damage == "empty" else os.path.getsize(path) - 4)
+    assert _map_cache(path, region, *SPAN) is None
+    assert _load(region, tmp_path) == _fresh(region)
+    assert _map_cache(path, region, *SPAN) is not None
+
+
+def test_rule_code_change_rebuilds_the_cache(tmp_path, monkeypatch):
+    region = "northern-ireland"
+    path = cache_path(region, str(tmp_path))
+    before = _load(region, tmp_path)
+
+    def no_substitutes(d):
+        return d
+
+    # Same name and signature, different code: holidays stay on the weekend
+    monkeypatch.setattr(holiday_rules._next_monday_if_weekend, "__code__", no_substitutes.__code__)
+    assert _map_cache(path, region, *SPAN) is None
+    after = _load(region, tmp_path)
+    assert after != before and after == _fresh(region)
+    assert _map_cache(path, region, *SPAN) is not None
+
+
+def test_scotland_2022_2023():
+    assert scotland_bank_holidays(2022, 2023) == [
+        D(2022, 1, 3), D(2022, 1, 4),  # 1 and 2 January fell on the weekend
+        D(2022, 4, 15), D(2022, 5, 2), D(2022, 6, 2), D(2022, 6, 3), D(2022, 8, 1),
+        D(2022, 9, 19), D(2022, 11, 30), D(2022, 12, 26), D(2022, 12, 27),
+        D(2023, 1, 2), D(2023, 1, 3),
+        D(2023, 4, 7), D(2023, 5, 1), D(2023, 5, 8), D(2023, 5, 29), D(2023, 8, 7),
+        D(2023, 11, 30), D(2023, 12, 25), D(2023, 12, 26),
+    ]
+    # St Andrew's Day on a Saturday moves to the Monday
+    assert D(2024, 12, 2) in scotland_bank_holidays(2024, 2024)
+    assert D(2024, 11, 30) not in scotland_bank_holidays(2024, 2024)
+
+
+def test_northern_ireland_2022_2023():
+    assert northern_ireland_bank_holidays(2022, 2023) == [
+        D(2022, 1, 3), D(2022, 3, 17), D(2022, 4, 15), D(2022, 4, 18), D(2022, 5, 2), D(2022, 6, 2),
+        D(2022, 6, 3), D(2022, 7, 12), D(2022, 8, 29), D(2022, 9, 19), D(2022, 12, 26), D(2022, 12, 27),
+        D(2023, 1, 2), D(2023, 3, 17), D(2023, 4, 7), D(2023, 4, 10), D(2023, 5, 1), D(2023, 5, 8),
+        D(2023, 5, 29), D(2023, 7, 12), D(2023, 8, 28), D(2023, 12, 25), D(2023, 12, 26),
+    ]
+    # 12 July at the weekend moves to the Monday
+    assert D(2020, 7, 13) in northern_ireland_bank_holidays(2020, 2020)
+    assert D(2025, 7, 14) in northern_ireland_bank_holidays(2025, 2025)
@@ -0,0 +1,79 @@
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from ics import iter_busy, iter_events
+
+LONDON = ZoneInfo("Europe/London")
+
+
+def _busy(body, first=None, last=None):
+    lines = ["BEGIN:VCALENDAR", "BEGIN:VEVENT", *body, "END:VEVENT", "END:VCALENDAR"]
+    return list(iter_busy(lines, first, last, local=LONDON))
+
+
+def _rows(body):
+    lines = ["BEGIN:VCALENDAR", "BEGIN:VEVENT", "SUMMARY:Call", *body, "END:VEVENT", "END:VCALENDAR"]
+    return list(iter_events(lines, local=LONDON))
+
+
+def test_utc_times_are_converted_to_local_time():
+    # 09:00Z is 10:00 in London during BST
+    assert _busy(["DTSTART:20250701T090000Z", "DTEND:20250701T100000Z"]) == [
+        (datetime(2025, 7, 1, 10, 0), datetime(2025, 7, 1, 11, 0))]
+
+
+def test_tzid_times_are_converted_to_local_time():
+    assert _busy(["DTSTART;TZID=America/New_York:20250115T090000",
+                  "DTEND;TZID=America/New_York:20250115T093000"]) == [
+        (datetime(2025, 1, 15, 14, 0), datetime(2025, 1, 15, 14, 30))]
+    # Outlook's Windows zone names
+    assert _busy(['DTSTART;TZID="GMT Standard Time":20250701T090000',
+                  'DTEND;TZID="GMT Standard Time":20250701T100000'])[0][0] == datetime(2025, 7, 1, 9, 0)
+
+
+def test_floating_and_all_day_times_are_unchanged():
+    assert _busy(["DTSTART:20250701T090000", "DTEND:20250701T100000"]) == [
+        (datetime(2025, 7, 1, 9, 0), datetime(2025, 7, 1, 10, 0))]
+    assert _busy(["DTSTART;VALUE=DATE:20250701"]) == [(datetime(2025, 7, 1), datetime(2025, 7, 2))]
+
+
+def test_recurring_utc_event_follows_local_clock_changes():
+    busy = _busy(["DTSTART:20250317T090000Z", "DTEND:20250317T100000Z", "RRULE:FREQ=WEEKLY;COUNT=3"],
+                 date(2025, 3, 1), date(2025, 4, 30))
+    # British Summer Time starts on 30 March 2025
+    assert [s.hour for s, _ in busy] == [9, 9, 10]
+    assert all((e - s).seconds == 3600 for s, e in busy)
+
+
+def test_imported_utc_event_lands_on_its_local_day():
+    # 23:30Z on 1 July is 00:30 on 2 July in London
+    assert _rows(["DTSTART:20250701T233000Z", "DTEND:20250702T003000Z"]) == [
+        ("event", "Call", date(2025, 7, 2), date(2025, 7, 2))]
+    assert _rows(["DTSTART:20250115T233000Z", "DTEND:20250116T000000Z"]) == [
+        ("event", "Call", date(2025, 1, 15), date(2025, 1, 15))]
+
+
+def test_imported_tzid_event_lands_on_its_local_day():
+    # 19:00 in Los Angeles is 03:00 the next morning in London
+    assert _rows(["DTSTART;TZID=America/Los_Angeles:20250701T190000",
+                  "DTEND;TZID=America/Los_Angeles:20250701T200000"]) == [
+        ("event", "Call", date(2025, 7, 2), date(2025, 7, 2))]
+
+
+def test_imported_all_day_end_is_exclusive():
+    assert _rows(["DTSTART;VALUE=DATE:20250701", "DTEND;VALUE=DATE:20250704"]) == [
+        ("event", "Call", date(2025, 7, 1), date(2025, 7, 3))]
+    assert _rows(["DTSTART;VALUE=DATE:20250701"]) == [("event", "Call", date(2025, 7, 1), date(2025, 7, 1))]
+
+
+def test_imported_series_starts_on_its_local_day():
+    (kind, title, rule), = _rows(["DTSTART:20250707T090000", "RRULE:FREQ=WEEKLY;COUNT=3",
+                                  "EXDATE:20250714T090000"])
+    assert kind == "series" and rule.start == date(2025, 7, 7)
+    assert list(rule.occurrences()) == [date(2025, 7, 7), date(2025, 7, 21)]
+    # Monday evenings in Los Angeles are Tuesdays in London
+    (_, _, rule), = _rows(["DTSTART;TZID=America/Los_Angeles:20250707T190000",
+                           "RRULE:FREQ=WEEKLY;BYDAY=MO;COUNT=2",
+                           "EXDATE;TZID=America/Los_Angeles:20250714T190000"])
+    assert rule.start == date(2025, 7, 8)
+    assert list(rule.occurrences()) == [date(2025, 7, 8)]
@@ -0,0 +1,15 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from bench_import import BUDGET_MS, FORBIDDEN, MODULES, measure
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_engine_import_stays_within_budget(module):
+    best_us, heavy = measure(module)
+    assert not heavy, f"{module} imports {', '.join(heavy)} (forbidden: {', '.join(FORBIDDEN)})"
+    assert best_us <= BUDGET_MS * 1000, f"{module} took {best_us / 1000:.1f} ms (budget {BUDGET_MS} ms)"
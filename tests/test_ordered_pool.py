@@ -0,0 +1,31 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ordered_pool import bounded_map
+
+
+def test_results_come_back_in_input_order_with_bounded_in_flight():
+    lock = threading.Lock()
+    submitted = [0]
+    consumed = [0]
+    peak = [0]
+
+    def work(i):
+        time.sleep(0.001 * (i % 3))  # finish out of order
+        return i * i
+
+    class CountingPool(ThreadPoolExecutor):
+        def submit(self, fn, *args):
+            with lock:
+                submitted[0] += 1
+                peak[0] = max(peak[0], submitted[0] - consumed[0])
+            return super().submit(fn, *args)
+
+    with CountingPool(4) as pool:
+        out = []
+        for result in bounded_map(pool, work, ((i,) for i in range(50)), window=3):
+            consumed[0] += 1
+            out.append(result)
+    assert out == [i * i for i in range(50)]
+    assert peak[0] <= 3 + 1  # the window, plus the result being consumed
@@ -0,0 +1,64 @@
+import random
+from collections import Counter
+from datetime import date, timedelta
+
+import pytest
+
+from holiday_rules import region_calendar
+from range_stats import iter_iso_weeks, iter_months, range_stats
+from workdays import WORK_PATTERNS
+
+
+def _days(a, b):
+    return [a + timedelta(days=n) for n in range((b - a).days + 1)]
+
+
+def _brute(a, b, cal):
+    lo, hi = min(a, b), max(a, b)
+    days = _days(lo, hi)
+    if cal is None:
+        working = [d.weekday() < 5 for d in days]
+        holidays = 0
+    else:
+        working = [cal.is_working_day(d) for d in days]
+        pattern_day = (lambda d: d.weekday() < 5) if cal.pattern is None else cal.pattern.is_working_day
+        holidays = sum(1 for d, w in zip(days, working) if pattern_day(d) and not w)
+    per_weekday = Counter(d.weekday() for d in days)
+    weeks = {d.isocalendar()[:2] for d in days}
+    week_days = Counter(d.isocalendar()[:2] for d in days)
+    return dict(
+        days=len(days),
+        working_days=sum(working),
+        weekday_counts=tuple(per_weekday[i] for i in range(7)),
+        weekend_days=len(days) - sum(working) - holidays,
+        holidays=holidays,
+        months=len({(d.year, d.month) for d in days}),
+        iso_weeks=len(weeks),
+        full_weeks=sum(1 for n in week_days.values() if n == 7),
+    )
+
+
+def _brute_rows(a, b, cal, key):
+    rows = {}
+    for d in _days(min(a, b), max(a, b)):
+        k = key(d)
+        n, w = rows.get(k, (0, 0))
+        working = d.weekday() < 5 if cal is None else cal.is_working_day(d)
+        rows[k] = (n + 1, w + working)
+    return [(*k, n, w) for k, (n, w) in rows.items()]
+
+
+@pytest.mark.parametrize("calendar", ["none", "england-wales", "scotland-mon-sat"])
+def test_range_stats_match_a_day_by_day_count(calendar):
+    cal = {"none": None, "england-wales": region_calendar("england-wales"),
+           "scotland-mon-sat": region_calendar("scotland").with_pattern(WORK_PATTERNS["mon-sat"][1])}[calendar]
+    rng = random.Random(calendar)
+    for _ in range(300):
+        a = date(1990, 1, 1) + timedelta(days=rng.randrange(15000))
+        b = a + timedelta(days=rng.choice((rng.randint(-20, 20), rng.randint(-800, 800))))
+        st = range_stats(a, b, cal)
+        expected = _brute(a, b, cal)
+        assert {k: getattr(st, k) for k in expected} == expected, (a, b)
+        assert st.partial_weeks == st.iso_weeks - st.full_weeks
+        assert list(iter_months(st, cal)) == _brute_rows(a, b, cal, lambda d: (d.year, d.month))
+        assert list(iter_iso_weeks(st, cal)) == _brute_rows(a, b, cal, lambda d: d.isocalendar()[:2])
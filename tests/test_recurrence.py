@@ -0,0 +1,63 @@
+import random
+from datetime import date, timedelta
+
+from holiday_rules import region_calendar
+from recurrence import RecurrenceRule
+
+D = date
+
+
+def _dates(rule, first=None, last=None):
+    return list(rule.occurrences(first, last))
+
+
+def test_count_until_and_exdates():
+    weekly = RecurrenceRule.from_rrule("FREQ=WEEKLY;COUNT=4", D(2025, 1, 6), [D(2025, 1, 13)])
+    # The excluded date still counts towards COUNT
+    assert _dates(weekly) == [D(2025, 1, 6), D(2025, 1, 20), D(2025, 1, 27)]
+    daily = RecurrenceRule.from_rrule("FREQ=DAILY;INTERVAL=2;UNTIL=20250107", D(2025, 1, 1))
+    assert _dates(daily) == [D(2025, 1, 1), D(2025, 1, 3), D(2025, 1, 5), D(2025, 1, 7)]
+
+
+def test_monthly_byday_from_the_start_and_end_of_the_month():
+    rule = RecurrenceRule.from_rrule("FREQ=MONTHLY;BYDAY=2TU,-1FR", D(2025, 1, 1))
+    assert _dates(rule, last=D(2025, 3, 31)) == [
+        D(2025, 1, 14), D(2025, 1, 31), D(2025, 2, 11), D(2025, 2, 28), D(2025, 3, 11), D(2025, 3, 28)]
+
+
+def test_yearly_on_29_february_skips_common_years():
+    rule = RecurrenceRule.from_rrule("FREQ=YEARLY;COUNT=3", D(2024, 2, 29))
+    assert _dates(rule) == [D(2024, 2, 29), D(2028, 2, 29), D(2032, 2, 29)]
+
+
+def test_workdays_step_over_the_calendar_and_start_on_a_working_day():
+    uk = region_calendar("england-wales")
+    # 25 and 26 December 2025 are bank holidays (Thursday and Friday)
+    rule = RecurrenceRule("WORKDAYS", D(2025, 12, 24), count=3)
+    assert _dates(rule) == [D(2025, 12, 24), D(2025, 12, 25), D(2025, 12, 26)]
+    assert _dates(rule.with_calendar(uk)) == [D(2025, 12, 24), D(2025, 12, 29), D(2025, 12, 30)]
+    weekend_start = RecurrenceRule("WORKDAYS", D(2025, 12, 27), count=2, calendar=uk)
+    assert _dates(weekend_start) == [D(2025, 12, 29), D(2025, 12, 30)]
+    assert _dates(weekend_start, D(2025, 12, 30)) == [D(2025, 12, 30)]
+
+
+def test_windowed_occurrences_match_a_full_expansion():
+    rng = random.Random(12)
+    uk = region_calendar("england-wales")
+    codes = ["MO", "TU", "WE", "TH", "FR", "SA", "SU"]
+    for _ in range(300):
+        freq = rng.choice(["DAILY", "WEEKLY", "MONTHLY", "YEARLY", "WORKDAYS"])
+        parts = [f"FREQ={freq}", f"INTERVAL={rng.randint(1, 4)}"]
+        if freq in ("DAILY", "WEEKLY") and rng.random() < 0.5:
+            parts.append("BYDAY=" + ",".join(rng.sample(codes, rng.randint(1, 3))))
+        elif freq == "MONTHLY" and rng.random() < 0.5:
+            parts.append(f"BYDAY={rng.choice([-2, -1, 1, 2, 3, 4, 5])}{rng.choice(codes)}")
+        if rng.random() < 0.3:
+            parts.append(f"UNTIL={D(2030, 1, 1) + timedelta(days=rng.randrange(3000)):%Y%m%d}")
+        start = D(2020, 1, 1) + timedelta(days=rng.randrange(1500))
+        exdates = [start + timedelta(days=rng.randrange(400)) for _ in range(3)]
+        rule = RecurrenceRule.from_rrule(";".join(parts), start, exdates, uk)
+        first = start + timedelta(days=rng.randrange(-30, 3000))
+        last = first + timedelta(days=rng.randrange(400))
+        full = [d for d in rule.occurrences(None, last) if d >= first]
+        assert _dates(rule, first, last) == full, (rule, first, last)
@@ -0,0 +1,137 @@
+import random
+import sys
+from datetime import date, timedelta
+
+import pytest
+
+from holiday_rules import REGIONS, england_wales_bank_holidays, region_calendar
+from workdays import (WORK_PATTERNS, BusinessCalendar, add_working_days, add_working_days_batch,
+                      working_days_between, working_days_between_batch)
+
+
+def _mon_fri(d):
+    return d.weekday() < 5
+
+
+def loop_add_working_days(start, days, holidays=frozenset(), working=_mon_fri):
+    """The original day-by-day implementation, extended to skip holidays."""
+    step = 1 if days >= 0 else -1
+    remaining = abs(days)
+    current = start
+    while remaining > 0:
+        current += timedelta(days=step)
+        if working(current) and current not in holidays:
+            remaining -= 1
+    return current
+
+
+def loop_working_days_between(a, b, holidays=frozenset(), working=_mon_fri):
+    if a > b:
+        a, b = b, a
+    return sum(1 for n in range((b - a).days + 1)
+               if working(a + timedelta(days=n)) and a + timedelta(days=n) not in holidays)
+
+
+OFFSETS = [0, 1, -1, 2, -2, 4, -4, 5, -5, 6, -6, 7, -7, 11, -11, 250, -250]
+
+
+@pytest.mark.parametrize("weekday", range(7))
+def test_add_working_days_matches_loop_for_every_start_weekday(weekday):
+    start = date(2024, 1, 1) + timedelta(days=weekday)  # 2024-01-01 is a Monday
+    assert start.weekday() == weekday
+    for days in OFFSETS:
+        assert add_working_days(start, days) == loop_add_working_days(start, days), days
+
+
+def test_add_working_days_matches_loop_randomized():
+    rng = random.Random(1)
+    for _ in range(2000):
+        start = date(2000, 1, 1) + timedelta(days=rng.randrange(20000))
+        days = rng.randint(-400, 400)
+        assert add_working_days(start, days) == loop_add_working_days(start, days), (start, days)
+
+
+def test_holiday_calendar_matches_loop_randomized():
+    rng = random.Random(2)
+    bank = set(england_wales_bank_holidays(1995, 2035))
+    random_days = {date(2000, 1, 1) + timedelta(days=rng.randrange(8000)) for _ in range(400)}
+    for holidays in (bank, random_days):
+        cal = BusinessCalendar(holidays)
+        for _ in range(1500):
+            start = date(2000, 1, 1) + timedelta(days=rng.randrange(7000))
+            days = rng.choice((0, rng.randint(-300, 300)))
+            assert cal.add_working_days(start, days) == loop_add_working_days(start, days, holidays), \
+                (start, days)
+            end = start + timedelta(days=rng.randint(-200, 200))
+            assert cal.working_days_between(start, end) == loop_working_days_between(start, end, holidays)
+
+
+def test_working_days_between_matches_loop():
+    rng = random.Random(3)
+    for _ in range(1000):
+        a = date(2010, 1, 1) + timedelta(days=rng.randrange(5000))
+        b = a + timedelta(days=rng.randint(-60, 60))
+        assert working_days_between(a, b) == loop_working_days_between(a, b)
+
+
+@pytest.mark.parametrize("hide_numpy", [False, True])
+def test_batch_functions_match_scalar_functions(monkeypatch, hide_numpy):
+    if hide_numpy:
+        monkeypatch.setitem(sys.modules, "numpy", None)  # import numpy now raises ImportError
+    else:
+        np = pytest.importorskip("numpy")
+    rng = random.Random(4)
+    bank = set(england_wales_bank_holidays(1995, 2035))
+    random_days = {date(2000, 1, 1) + timedelta(days=rng.randrange(8000)) for _ in range(400)}
+    for cal in (None, BusinessCalendar(bank), BusinessCalendar(random_days)):
+        starts = [date(2000, 1, 1) + timedelta(days=rng.randrange(7000)) for _ in range(1500)]
+        days = [rng.choice((0, rng.randint(-300, 300), rng.randint(-7, 7))) for _ in starts]
+        # Ends both before and after the start: pair order must not matter
+        ends = [s + timedelta(days=rng.randint(-200, 200)) for s in starts]
+        add = cal.add_working_days if cal else add_working_days
+        between = cal.working_days_between if cal else working_days_between
+        if hide_numpy:
+            added = add_working_days_batch(starts, days, cal)
+            counts = working_days_between_batch(starts, ends, cal)
+            assert isinstance(added, list) and isinstance(counts, list)
+        else:
+            starts64 = np.array(starts, dtype="datetime64[D]")
+            added = add_working_days_batch(starts64, np.array(days), cal).astype(object).tolist()
+            counts = working_days_between_batch(starts64, np.array(ends, dtype="datetime64[D]"), cal).tolist()
+        assert added == [add(s, n) for s, n in zip(starts, days)]
+        assert counts == [between(s, e) for s, e in zip(starts, ends)]
+
+
+def test_regional_rules_only_produce_weekdays():
+    # So the cached Mon-Fri tables hold every holiday, and with_pattern() loses none
+    for region, (_, rules) in REGIONS.items():
+        assert all(d.weekday() < 5 for d in rules(1978, 2100)), region
+
+
+@pytest.mark.parametrize("key", WORK_PATTERNS)
+def test_work_patterns_match_loop(key):
+    np = pytest.importorskip("numpy")
+    pattern = WORK_PATTERNS[key][1]
+    working = _mon_fri if pattern is None else pattern.is_working_day
+    rng = random.Random(key)
+    bank = set(england_wales_bank_holidays(1995, 2035))
+    # Weekend holidays count for patterns that work weekends
+    weekends = {date(2000, 1, 1) + timedelta(days=rng.randrange(8000)) for _ in range(400)}
+    holidays = bank | {d for d in weekends if d.weekday() >= 5}
+    calendars = [
+        (BusinessCalendar(holidays, pattern), holidays),
+        (BusinessCalendar(holidays).with_pattern(pattern), holidays),
+        (BusinessCalendar(holidays, WORK_PATTERNS["mon-sat"][1]).with_pattern(pattern), holidays),
+        (region_calendar("england-wales").with_pattern(pattern), set(england_wales_bank_holidays(1978, 2100))),
+    ]
+    for cal, days_off in calendars:
+        starts = [date(2000, 1, 1) + timedelta(days=rng.randrange(7000)) for _ in range(300)]
+        offsets = [rng.choice((0, rng.randint(-60, 60), rng.randint(-8, 8))) for _ in starts]
+        ends = [s + timedelta(days=rng.randint(-90, 90)) for s in starts]
+        added = [loop_add_working_days(s, n, days_off, working) for s, n in zip(starts, offsets)]
+        counts = [loop_working_days_between(s, e, days_off, working) for s, e in zip(starts, ends)]
+        assert [cal.add_working_days(s, n) for s, n in zip(starts, offsets)] == added
+        assert [cal.working_days_between(s, e) for s, e in zip(starts, ends)] == counts
+        starts64 = np.array(starts, dtype="datetime64[D]")
+        assert add_working_days_batch(starts64, np.array(offsets), cal).astype(object).tolist() == added
+        assert working_days_between_batch(starts64, np.array(ends, dtype="datetime64[D]"), cal).tolist() == counts
@@ -0,0 +1,58 @@
+import io
+import json
+import random
+
+import pytest
+
+import workdays_cli
+
+
+def test_bad_jsonl_rows_are_reported_not_fatal():
+    lines = [
+        '{"start": "01/01/2025", "days": 5}\n',
+        "not json\n",
+        "42\n",
+        '{"start": "01/01/2025", "days": 99999999}\n',
+        '["02/01/2025", "10/01/2025"]\n',
+    ]
+    out, err = io.StringIO(), io.StringIO()
+    bad = workdays_cli.run(lines, out, "jsonl", bank_holidays=True, errfile=err)
+    assert bad == 3
+    assert out.getvalue().count("\n") == 2
+    assert [line.split(":")[0] for line in err.getvalue().splitlines()] == ["record 2", "record 3", "record 4"]
+
+
+def _random_rows(rng, fmt, n):
+    lines = ["start,days\n"] if fmt == "csv" else []
+    for _ in range(n):
+        d = f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(1990, 2040)}"
+        kind = rng.random()
+        if kind < 0.1:
+            lines.append("not a row\n" if fmt == "csv" else "{broken\n")
+        elif kind < 0.15:
+            lines.append("\n")
+        elif kind < 0.6:
+            days = rng.randint(-500, 500)
+            lines.append(f"{d},{days}\n" if fmt == "csv" else json.dumps({"start": d, "days": days}) + "\n")
+        else:
+            lines.append(f"{d},01/01/2020\n" if fmt == "csv" else json.dumps([d, "01/01/2020"]) + "\n")
+    lines[-1] = lines[-1].rstrip("\n")  # no newline at the end of the file
+    return lines
+
+
+@pytest.mark.parametrize("fmt", ["csv", "jsonl"])
+def test_sharded_output_matches_streaming_run(fmt, tmp_path):
+    lines = _random_rows(random.Random(fmt), fmt, 3000)
+    path = tmp_path / f"rows.{fmt}"
+    path.write_text("".join(lines), encoding="utf-8")
+
+    out, err = io.StringIO(), io.StringIO()
+    bad = workdays_cli.run(lines, out, fmt, bank_holidays=True, errfile=err)
+    assert bad > 0
+
+    # Small shards, so many boundaries fall between (and inside runs of) bad rows
+    sharded, sharded_err = io.BytesIO(), io.StringIO()
+    assert workdays_cli.run_sharded(str(path), sharded, fmt, bank_holidays=True, workers=2,
+                                    shard_size=1000, errfile=sharded_err) == bad
+    assert sharded.getvalue() == out.getvalue().encode("utf-8")
+    assert sharded_err.getvalue() == err.getvalue()
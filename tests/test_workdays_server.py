@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from workdays_server import RequestError, WorkdayService, _read_request
+
+
+def _read(raw):
+    async def go():
+        reader = asyncio.StreamReader()
+        reader.feed_data(raw)
+        reader.feed_eof()
+        return await _read_request(reader)
+    return asyncio.run(go())
+
+
+def test_body_is_read_by_content_length():
+    method, target, headers, body = _read(b"POST /batch HTTP/1.1\r\nContent-Length: 2\r\n\r\n[]")
+    assert (method, target, body) == ("POST", "/batch", b"[]")
+
+
+@pytest.mark.parametrize("length", [b"-5", b"abc"])
+def test_bad_content_length_is_a_400(length):
+    with pytest.raises(RequestError) as exc:
+        _read(b"POST /batch HTTP/1.1\r\nContent-Length: " + length + b"\r\n\r\n[]")
+    assert exc.value.status == 400
+
+
+@pytest.mark.parametrize("days", [True, 1.0, [1], None])
+def test_days_must_be_an_integer_even_when_1_is_cached(days):
+    service = WorkdayService()
+    assert service.compute({"start": "2025-01-03", "days": 1}) == "2025-01-06"
+    with pytest.raises(ValueError):
+        service.compute({"start": "2025-01-03", "days": days})
+
+
+def test_between_cache_is_keyed_on_dates_not_spelling():
+    service = WorkdayService()
+    assert service.compute({"a": "01/01/2025", "b": "31/01/2025"}) == 23
+    assert service.compute({"a": "2025-01-01", "b": "2025-01-31"}) == 23
+    assert (service.hits, service.misses) == (1, 1)
@@ -0,0 +1,349 @@
+"""Working-day arithmetic for Smart Calendar."""
+from datetime import date, datetime, timedelta
+from bisect import bisect_left, bisect_right
+
+DATE_FMT = "%d/%m/%Y"  # UK format
+
+def parse_date(s: str) -> date:
+    """A DATE_FMT string as a date (ValueError if it is not one)."""
+    # Fast path for the fixed-width DD/MM/YYYY layout; strptime for the rest
+    if len(s) == 10 and s[2] == "/" and s[5] == "/":
+        try:
+            return date(int(s[6:10]), int(s[3:5]), int(s[0:2]))
+        except ValueError:
+            pass
+    return datetime.strptime(s, DATE_FMT).date()
+
+def format_date(d: date) -> str:
+    return f"{d.day:02d}/{d.month:02d}/{d.year:04d}"  # DATE_FMT, without strftime
+
+def _working_day_offsets(step: int):
+    # For each start weekday, calendar-day offsets of the 1st..5th Mon-Fri
+    # strictly after (step=1) or before (step=-1) it.
+    table = []
+    for wd in range(7):
+        offsets = []
+        n = 0
+        while len(offsets) < 5:
+            n += 1
+            if (wd + step * n) % 7 < 5:
+                offsets.append(n)
+        table.append(offsets)
+    return table
+
+_FWD_OFFSETS = _working_day_offsets(1)
+_BWD_OFFSETS = _working_day_offsets(-1)
+
+def add_working_days(start: date, days: int, pattern=None) -> date:
+    """Move `days` Mon-Fri days from start (negative goes backwards).
+
+    Every block of 5 working days spans exactly one calendar week, so only
+    the last partial block needs the per-weekday offset table. Pass a
+    WorkPattern to count its working days instead of Mon-Fri.
+    """
+    if pattern is not None:
+        return pattern.add_working_days(start, days)
+    if days == 0:
+        return start
+    table = _FWD_OFFSETS if days > 0 else _BWD_OFFSETS
+    full_weeks, rem = divmod(abs(days) - 1, 5)
+    offset = full_weeks * 7 + table[start.weekday()][rem]
+    return start + timedelta(days=offset if days > 0 else -offset)
+
+def working_days_between(a: date, b: date, pattern=None) -> int:
+    """Inclusive count of Mon-Fri (or a WorkPattern's working days) between a and b."""
+    if pattern is not None:
+        return pattern.working_days_between(a, b)
+    if a > b:
+        a, b = b, a
+    days = (b - a).days + 1  # inclusive
+    full_weeks, extra_days = divmod(days, 7)
+    # Each full week contributes 5 working days
+    workdays = full_weeks * 5
+    # Handle the remainder days
+    for i in range(extra_days):
+        d = a + timedelta(days=full_weeks * 7 + i)
+        if d.weekday() < 5:
+            workdays += 1
+    return workdays
+
+def _weekday_rank(ordinal: int) -> int:
+    """Number of Mon-Fri days with date ordinal in [1, ordinal].
+
+    Ordinal 1 (0001-01-01) is a Monday, so each block of 7 ordinals holds 5.
+    """
+    full_weeks, rem = divmod(ordinal, 7)
+    return full_weeks * 5 + min(rem, 5)
+
+def _weekday_select(rank: int) -> int:
+    """Ordinal of the rank-th Mon-Fri day (inverse of _weekday_rank)."""
+    full_weeks, rem = divmod(rank - 1, 5)
+    return full_weeks * 7 + rem + 1
+
+class WorkPattern:
+    """Working days that repeat over a fixed cycle, e.g. Sun-Thu or 4-on/4-off.
+
+    mask has one entry per day of the cycle ("1"/"0" characters or truthy
+    values) and position 0 falls on `anchor`. Working days up to a date are
+    whole cycles times the cycle's working days plus a prefix-table lookup
+    for the partial cycle, so counts cost the same over any span.
+    """
+
+    def __init__(self, mask, anchor: date = date(1, 1, 1)):
+        self.mask = tuple(bool(int(b)) if isinstance(b, str) else bool(b) for b in mask)
+        if not any(self.mask):
+            raise ValueError("a work pattern needs at least one working day")
+        self.anchor = anchor
+        self._anchor = anchor.toordinal()
+        self._cycle = len(self.mask)
+        self._per_cycle = sum(self.mask)
+        # _prefix[i]: working days in cycle positions [0, i)
+        self._prefix = [0]
+        for working in self.mask:
+            self._prefix.append(self._prefix[-1] + working)
+        self._positions = [i for i, working in enumerate(self.mask) if working]
+
+    @classmethod
+    def weekly(cls, weekdays):
+        """Pattern working on the given weekdays (0=Mon..6=Sun) every week."""
+        days = set(weekdays)
+        return cls([wd in days for wd in range(7)])  # date(1, 1, 1) is a Monday
+
+    def __eq__(self, other):
+        return isinstance(other, WorkPattern) and (self.mask, self.anchor) == (other.mask, other.anchor)
+
+    def __hash__(self):
+        return hash((self.mask, self.anchor))
+
+    def __repr__(self):
+        bits = "".join("1" if working else "0" for working in self.mask)
+        return f"WorkPattern({bits!r}, anchor={self.anchor!r})"
+
+    def _rank(self, ordinal: int) -> int:
+        """Working days with ordinal in [anchor, ordinal] (negative before the anchor)."""
+        cycles, pos = divmod(ordinal - self._anchor, self._cycle)
+        return cycles * self._per_cycle + self._prefix[pos + 1]
+
+    def _select(self, rank: int) -> int:
+        """Ordinal of the rank-th working day (inverse of _rank)."""
+        cycles, i = divmod(rank - 1, self._per_cycle)
+        return self._anchor + cycles * self._cycle + self._positions[i]
+
+    def is_working_day(self, d: date) -> bool:
+        return self.mask[(d.toordinal() - self._anchor) % self._cycle]
+
+    def working_days_between(self, a: date, b: date) -> int:
+        """Inclusive count of working days between a and b."""
+        if a > b:
+            a, b = b, a
+        return self._rank(b.toordinal()) - self._rank(a.toordinal() - 1)
+
+    def add_working_days(self, start: date, days: int) -> date:
+        """Move `days` working days from start (negative goes backwards)."""
+        if days == 0:
+            return start
+        o = start.toordinal()
+        if days > 0:
+            return date.fromordinal(self._select(self._rank(o) + days))
+        return date.fromordinal(self._select(self._rank(o - 1) + days + 1))
+
+# Named patterns offered by the GUI: key -> (label, pattern; None is plain Mon-Fri)
+WORK_PATTERNS = {
+    "mon-fri": ("Mon–Fri", None),
+    "sun-thu": ("Sun–Thu", WorkPattern.weekly((6, 0, 1, 2, 3))),
+    "mon-sat": ("Mon–Sat", WorkPattern.weekly(range(6))),
+    "4-on-4-off": ("4 on / 4 off", WorkPattern("11110000", anchor=date(2024, 1, 1))),
+    "2-2-3": ("2-2-3 rotation", WorkPattern("11001110011000", anchor=date(2024, 1, 1))),
+}
+
+class BusinessCalendar:
+    """Mon-Fri (or WorkPattern) working days minus a fixed set of holidays.
+
+    Working days up to any date ordinal are counted as weekdays (whole-week
+    arithmetic) less the holidays before it (bisect over the sorted holiday
+    ordinals), so neither lookup walks the calendar day by day.
+    """
+
+    def __init__(self, holidays=(), pattern=None):
+        self._set_pattern(pattern)
+        # Every holiday is kept for with_pattern(), but holidays on days off never
+        # change a count, so only those on working days are bisected
+        self._all_holidays = tuple(sorted(set(holidays)))
+        working = pattern.is_working_day if pattern is not None else (lambda d: d.weekday() < 5)
+        self._holidays = [d.toordinal() for d in self._all_holidays if working(d)]
+        # Working days up to and including each holiday's date
+        self._holiday_ranks = [self._base_rank(o) - i - 1 for i, o in enumerate(self._holidays)]
+
+    def _set_pattern(self, pattern):
+        self.pattern = pattern
+        if pattern is None:
+            self._base_rank, self._base_select = _weekday_rank, _weekday_select
+        else:
+            self._base_rank, self._base_select = pattern._rank, pattern._select
+
+    @classmethod
+    def from_tables(cls, holidays, holiday_ranks, all_holidays=None):
+        """Wrap precomputed Mon-Fri tables (sorted weekday-holiday ordinals and
+        the working-day rank of each), e.g. arrays memory-mapped by holiday_rules.
+
+        all_holidays lists every holiday date, weekends included, for
+        with_pattern(); by default the tables' own weekday holidays.
+        """
+        cal = cls.__new__(cls)
+        cal._set_pattern(None)
+        cal._holidays = holidays
+        cal._holiday_ranks = holiday_ranks
+        cal._all_holidays = all_holidays
+        return cal
+
+    def with_pattern(self, pattern):
+        """The same holidays counted against another working pattern."""
+        if pattern == self.pattern:
+            return self
+        return BusinessCalendar(self.holidays if self._all_holidays is None else self._all_holidays, pattern)
+
+    @property
+    def holidays(self):
+        return tuple(date.fromordinal(o) for o in self._holidays)
+
+    def _rank(self, ordinal: int) -> int:
+        return self._base_rank(ordinal) - bisect_right(self._holidays, ordinal)
+
+    def _select(self, rank: int) -> int:
+        # Holidays falling before the rank-th working day push it along
+        skipped = bisect_right(self._holiday_ranks, rank - 1)
+        return self._base_select(rank + skipped)
+
+    def is_working_day(self, d: date) -> bool:
+        o = d.toordinal()
+        if self.pattern is not None:
+            if not self.pattern.is_working_day(d):
+                return False
+        elif d.weekday() >= 5:
+            return False
+        i = bisect_left(self._holidays, o)
+        return i == len(self._holidays) or self._holidays[i] != o
+
+    def working_days_between(self, a: date, b: date) -> int:
+        """Inclusive count of working days between a and b."""
+        if a > b:
+            a, b = b, a
+        return self._rank(b.toordinal()) - self._rank(a.toordinal() - 1)
+
+    def holidays_between(self, a: date, b: date) -> int:
+        """Inclusive count of holidays between a and b that fall on working days."""
+        if a > b:
+            a, b = b, a
+        return bisect_right(self._holidays, b.toordinal()) - bisect_left(self._holidays, a.toordinal())
+
+    def add_working_days(self, start: date, days: int) -> date:
+        """Move `days` working days from start (negative goes backwards)."""
+        if days == 0:
+            return start
+        o = start.toordinal()
+        if days > 0:
+            return date.fromordinal(self._select(self._rank(o) + days))
+        return date.fromordinal(self._select(self._rank(o - 1) + days + 1))
+
+_uk_calendar = None
+
+def __getattr__(name):
+    # UK_CALENDAR is loaded on first use so plain Mon-Fri callers skip the holiday tables
+    global _uk_calendar
+    if name == "UK_CALENDAR":
+        if _uk_calendar is None:
+            from holiday_rules import region_calendar
+            _uk_calendar = region_calendar("england-wales")
+        return _uk_calendar
+    if name == "england_wales_bank_holidays":
+        from holiday_rules import england_wales_bank_holidays
+        return england_wales_bank_holidays
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# --- Batch (vectorized) working-day math; NumPy is optional ---
+# NumPy is imported on first batch call, keeping `import workdays` cheap.
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()  # datetime64[D] day 0
+
+def _np_weekday_rank(ordinals):
+    import numpy as np
+    return (ordinals // 7) * 5 + np.minimum(ordinals % 7, 5)
+
+def _np_weekday_select(ranks):
+    import numpy as np
+    full_weeks, rem = np.divmod(ranks - 1, 5)
+    return full_weeks * 7 + rem + 1
+
+def _np_pattern_rank(ordinals, pattern):
+    import numpy as np
+    cycles, pos = np.divmod(ordinals - pattern._anchor, pattern._cycle)
+    return cycles * pattern._per_cycle + np.asarray(pattern._prefix, dtype=np.int64)[pos + 1]
+
+def _np_pattern_select(ranks, pattern):
+    import numpy as np
+    cycles, i = np.divmod(ranks - 1, pattern._per_cycle)
+    return pattern._anchor + cycles * pattern._cycle + np.asarray(pattern._positions, dtype=np.int64)[i]
+
+def _np_calendar_tables(business_calendar):
+    """(holiday ordinals, holiday ranks, pattern) for the vectorized helpers."""
+    import numpy as np
+    if business_calendar is None:
+        return np.empty(0, np.int64), np.empty(0, np.int64), None
+    return (np.asarray(business_calendar._holidays, dtype=np.int64),
+            np.asarray(business_calendar._holiday_ranks, dtype=np.int64),
+            business_calendar.pattern)
+
+def _np_rank(ordinals, holidays, pattern=None):
+    import numpy as np
+    base = _np_weekday_rank(ordinals) if pattern is None else _np_pattern_rank(ordinals, pattern)
+    return base - np.searchsorted(holidays, ordinals, side="right")
+
+def _np_select(ranks, holiday_ranks, pattern=None):
+    import numpy as np
+    ranks = ranks + np.searchsorted(holiday_ranks, ranks - 1, side="right")
+    return _np_weekday_select(ranks) if pattern is None else _np_pattern_select(ranks, pattern)
+
+def add_working_days_batch(starts, days, business_calendar=None):
+    """Vectorized add_working_days over arrays of starts and offsets.
+
+    starts is a datetime64[D] array and days an integer array (broadcastable);
+    returns a datetime64[D] array. Pass a BusinessCalendar to skip its holidays
+    as well. Without NumPy, takes iterables of dates/ints and returns a list.
+    """
+    np = _numpy()
+    if np is None:
+        add = business_calendar.add_working_days if business_calendar else add_working_days
+        return [add(s, n) for s, n in zip(starts, days)]
+
+    holidays, holiday_ranks, pattern = _np_calendar_tables(business_calendar)
+    ordinals = np.asarray(starts, dtype="datetime64[D]").astype(np.int64) + _EPOCH_ORDINAL
+    days = np.asarray(days, dtype=np.int64)
+    # Forward moves count from the start itself, backward ones from the day before
+    base = np.where(days > 0, _np_rank(ordinals, holidays, pattern),
+                    _np_rank(ordinals - 1, holidays, pattern) + 1)
+    result = np.where(days == 0, ordinals, _np_select(base + days, holiday_ranks, pattern))
+    return (result - _EPOCH_ORDINAL).astype("datetime64[D]")
+
+def working_days_between_batch(a, b, business_calendar=None):
+    """Vectorized working_days_between: inclusive counts as an int64 array.
+
+    a and b are datetime64[D] arrays (order within each pair does not matter).
+    Without NumPy, takes iterables of dates and returns a list.
+    """
+    np = _numpy()
+    if np is None:
+        between = business_calendar.working_days_between if business_calendar else working_days_between
+        return [between(x, y) for x, y in zip(a, b)]
+
+    holidays, _, pattern = _np_calendar_tables(business_calendar)
+    a = np.asarray(a, dtype="datetime64[D]").astype(np.int64) + _EPOCH_ORDINAL
+    b = np.asarray(b, dtype="datetime64[D]").astype(np.int64) + _EPOCH_ORDINAL
+    lo, hi = np.minimum(a, b), np.maximum(a, b)
+    return _np_rank(hi, holidays, pattern) - _np_rank(lo - 1, holidays, pattern)
@@ -0,0 +1,285 @@
+"""Headless bulk working-day calculations (no tkinter).
+
+Reads CSV or JSONL rows from a file or stdin and streams one result per row:
+
+    start,days  ->  start,days,add_working_days(start, days)
+    a,b         ->  a,b,working_days_between(a, b)
+
+Dates use DATE_FMT (DD/MM/YYYY). Rows are processed in fixed-size chunks, so
+memory stays constant however long the input is.
+
+    python workdays_cli.py tickets.csv > out.csv
+    cat rows.jsonl | python workdays_cli.py --format jsonl --bank-holidays
+
+With --workers N (N > 1, file input only) the file is memory-mapped, split into
+newline-aligned shards of --chunk-size MiB, and the shards are processed in a
+process pool; their outputs are concatenated in input order. Rows must not
+contain quoted newlines, which holds for date/number rows.
+
+    python workdays_cli.py --workers 8 nightly.csv > out.csv
+"""
+import csv
+import json
+import os
+import sys
+from datetime import date
+from itertools import islice
+
+import workdays
+from workdays import add_working_days, format_date, parse_date, working_days_between
+
+CHUNK_SIZE = 10_000  # rows per in-process chunk
+SHARD_SIZE = 64 << 20  # bytes per shard in --workers mode
+
+
+def read_csv_rows(lines, skip_header=True):
+    for i, row in enumerate(csv.reader(lines)):
+        if not row or not any(field.strip() for field in row):
+            continue
+        # A leading header row (e.g. "start,days") is skipped
+        if skip_header and i == 0 and not row[0].strip()[:1].isdigit():
+            continue
+        yield [field.strip() for field in row[:2]]
+
+
+def read_jsonl_rows(lines):
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            obj = json.loads(line)
+        except ValueError:
+            obj = None
+        if isinstance(obj, dict):
+            if "days" in obj:
+                yield [str(obj.get("start", "")), str(obj["days"])]
+            else:
+                yield [str(obj.get("a", "")), str(obj.get("b", ""))]
+        elif isinstance(obj, list):
+            yield [str(v) for v in obj[:2]]
+        else:
+            yield [line]  # malformed or scalar: reported as an unparseable row
+
+
+def chunked(rows, size=CHUNK_SIZE):
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _as_int(s: str):
+    try:
+        return int(s)
+    except ValueError:
+        return None
+
+
+def compute_chunks(chunks, add=add_working_days, between=working_days_between, errors=None):
+    """Yield (fields, result) per row; result is a date or an int.
+
+    Date strings are parsed once per distinct value within a chunk. Rows that
+    cannot be parsed, or whose result is out of range, are appended to
+    `errors` as (row number, fields).
+    """
+    row_no = 0
+    for chunk in chunks:
+        parsed = {}
+        for fields in chunk:
+            for s in fields:
+                if s not in parsed:
+                    try:
+                        parsed[s] = parse_date(s) if "/" in s else None
+                    except ValueError:
+                        parsed[s] = None
+        for fields in chunk:
+            row_no += 1
+            start = parsed.get(fields[0]) if len(fields) == 2 else None
+            if start is not None:
+                days = _as_int(fields[1])
+                end = parsed[fields[1]] if days is None else None
+                try:
+                    # A huge offset can land outside date's range
+                    if days is not None:
+                        yield fields, add(start, days)
+                        continue
+                    if end is not None:
+                        yield fields, between(start, end)
+                        continue
+                except (OverflowError, ValueError):
+                    pass
+            if errors is not None:
+                errors.append((row_no, fields))
+
+
+def format_csv(results):
+    for (first, second), value in results:
+        if isinstance(value, date):
+            value = format_date(value)
+        yield f"{first},{second},{value}\n"
+
+
+def format_jsonl(results):
+    for (first, second), value in results:
+        if isinstance(value, date):
+            obj = {"start": first, "days": int(second), "result": format_date(value)}
+        else:
+            obj = {"a": first, "b": second, "result": value}
+        yield json.dumps(obj) + "\n"
+
+
+def _calendar_functions(bank_holidays):
+    if bank_holidays:
+        # Holiday tables are only mapped in when asked for
+        cal = workdays.UK_CALENDAR
+        return cal.add_working_days, cal.working_days_between
+    return add_working_days, working_days_between
+
+
+def run(infile, outfile, fmt="csv", bank_holidays=False, errfile=sys.stderr):
+    """Stream a result for every row of infile to outfile.
+
+    Returns the number of rows that could not be parsed (reported to errfile).
+    """
+    add, between = _calendar_functions(bank_holidays)
+    reader = read_jsonl_rows if fmt == "jsonl" else read_csv_rows
+    formatter = format_jsonl if fmt == "jsonl" else format_csv
+    errors = []
+    bad = 0
+    results = compute_chunks(chunked(reader(infile)), add, between, errors)
+    for lines in chunked(formatter(results)):
+        outfile.writelines(lines)
+        bad += _report(errors, errfile)
+    return bad + _report(errors, errfile)
+
+
+def shard_ranges(buf, shard_size=SHARD_SIZE):
+    """Yield (start, end) byte ranges of buf, each ending just after a newline."""
+    size = len(buf)
+    start = 0
+    while start < size:
+        newline = buf.find(b"\n", start + shard_size - 1)
+        end = size if newline == -1 else newline + 1
+        yield start, end
+        start = end
+
+
+def _mapped_lines(mm, start, end):
+    # Lines of mm[start:end], decoded one at a time so the shard is never copied whole
+    mm.seek(start)
+    readline = mm.readline
+    while mm.tell() < end:
+        yield readline().decode("utf-8")
+
+
+def _run_shard(path, start, end, fmt, bank_holidays, first, out_path):
+    """Worker: process bytes [start, end) of path into out_path.
+
+    Returns (rows read, [(row number within the shard, fields)] that failed).
+    """
+    import mmap
+    add, between = _calendar_functions(bank_holidays)
+    seen = [0]
+
+    def counted(rows):
+        for row in rows:
+            seen[0] += 1
+            yield row
+
+    errors = []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+            open(out_path, "w", encoding="utf-8", newline="") as out:
+        lines = _mapped_lines(mm, start, end)
+        if fmt == "jsonl":
+            rows = read_jsonl_rows(lines)
+            formatter = format_jsonl
+        else:
+            rows = read_csv_rows(lines, skip_header=first)  # only the file's first line can be a header
+            formatter = format_csv
+        results = compute_chunks(chunked(counted(rows)), add, between, errors)
+        for chunk in chunked(formatter(results)):
+            out.writelines(chunk)
+    return seen[0], errors
+
+
+def run_sharded(path, outfile, fmt="csv", bank_holidays=False, workers=None,
+                shard_size=SHARD_SIZE, errfile=sys.stderr):
+    """Process a file across a process pool; outfile is a binary stream.
+
+    Shards are processed in parallel but written (and their bad rows
+    reported) in input order. At most 2 * workers shards are in flight, which
+    bounds the temporary output kept on disk.
+    """
+    import mmap
+    import shutil
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+
+    from ordered_pool import bounded_map
+
+    if os.path.getsize(path) == 0:
+        return 0
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        ranges = list(shard_ranges(mm, shard_size))
+
+    workers = workers or os.cpu_count() or 1
+    bad = 0
+    row_offset = 0
+    with tempfile.TemporaryDirectory(prefix="workdays-") as tmp, ProcessPoolExecutor(workers) as pool:
+        out_paths = [os.path.join(tmp, f"{i:06d}.out") for i in range(len(ranges))]
+        jobs = ((path, start, end, fmt, bank_holidays, i == 0, out_paths[i])
+                for i, (start, end) in enumerate(ranges))
+        for out_path, (rows, errors) in zip(out_paths, bounded_map(pool, _run_shard, jobs, 2 * workers)):
+            with open(out_path, "rb") as part:
+                shutil.copyfileobj(part, outfile, 1 << 20)
+            os.remove(out_path)
+            bad += _report([(row_offset + n, fields) for n, fields in errors], errfile)
+            row_offset += rows
+    return bad
+
+
+def _report(errors, errfile):
+    for row_no, fields in errors:
+        print(f"record {row_no}: cannot parse {fields!r}", file=errfile)
+    n = len(errors)
+    errors.clear()
+    return n
+
+
+def main(argv=None):
+    import argparse  # only the command line needs it; shard workers import this module too
+
+    parser = argparse.ArgumentParser(description="Bulk working-day calculations (DD/MM/YYYY).")
+    parser.add_argument("input", nargs="?", default="-", help="CSV/JSONL file, or - for stdin (default)")
+    parser.add_argument("--format", choices=("csv", "jsonl"),
+                        help="input/output format (default: from file extension, else csv)")
+    parser.add_argument("--bank-holidays", action="store_true",
+                        help="also skip UK (England & Wales) bank holidays")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes for sharded file mode (0: one per CPU; default 1, streaming)")
+    parser.add_argument("--chunk-size", type=int, default=SHARD_SIZE >> 20, metavar="MIB",
+                        help=f"shard size in MiB for --workers mode (default {SHARD_SIZE >> 20})")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("jsonl" if args.input.endswith((".jsonl", ".ndjson")) else "csv")
+    if args.workers != 1:
+        if args.input == "-":
+            parser.error("--workers needs a file argument (stdin cannot be memory-mapped)")
+        if args.workers < 0 or args.chunk_size < 1:
+            parser.error("--workers must be >= 0 and --chunk-size >= 1")
+        sys.stdout.flush()
+        bad = run_sharded(args.input, sys.stdout.buffer, fmt, args.bank_holidays,
+                          args.workers or None, args.chunk_size << 20)
+    elif args.input == "-":
+        bad = run(sys.stdin, sys.stdout, fmt, args.bank_holidays)
+    else:
+        with open(args.input, newline="", encoding="utf-8") as f:
+            bad = run(f, sys.stdout, fmt, args.bank_holidays)
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+"""Local HTTP/JSON API for working-day calculations (asyncio, no tkinter).
+
+Lets other services call add_working_days / working_days_between without the
+GUI. Listens on loopback by default; connections are kept alive and requests
+on one connection may be pipelined (answered in order).
+
+    POST /add      {"start": "20/12/2024", "days": 3}          -> {"result": "25/12/2024"}
+    POST /between  {"a": "01/01/2025", "b": "31/01/2025"}      -> {"result": 23}
+    POST /batch    {"requests": [{"start": ..., "days": ...}, {"a": ..., "b": ...}]}
+                                                                -> {"results": [{"result": ...}, ...]}
+    GET  /add?start=24/12/2024&days=3, GET /between?a=...&b=...
+    GET  /health                                                -> cache statistics
+
+Dates are DD/MM/YYYY or ISO YYYY-MM-DD; results use the format of the input.
+Optional "region" (england-wales, scotland, northern-ireland) also skips
+that region's bank holidays, and "pattern" selects a workdays.WORK_PATTERNS
+entry. In /batch, top-level region/pattern apply to every item.
+
+    python workdays_server.py --port 8765
+"""
+import argparse
+import asyncio
+import json
+import sys
+from collections import OrderedDict
+from datetime import date
+from urllib.parse import parse_qsl, urlsplit
+
+from workdays import WORK_PATTERNS, BusinessCalendar, format_date, parse_date
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+CACHE_SIZE = 65_536     # memoized (operation, inputs) results
+MAX_BODY = 1 << 20      # bytes; larger requests get 413
+MAX_BATCH = 10_000      # items per /batch request
+KEEPALIVE_TIMEOUT = 15  # seconds an idle connection is kept open
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            411: "Length Required", 413: "Payload Too Large", 431: "Request Header Fields Too Large"}
+
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _date_arg(value):
+    """(date, iso) for a DD/MM/YYYY or YYYY-MM-DD string."""
+    if not isinstance(value, str):
+        raise ValueError(f"expected a date string, got {value!r}")
+    if len(value) == 10 and value[4] == "-":
+        return date.fromisoformat(value), True
+    return parse_date(value), False
+
+
+class WorkdayService:
+    """Request handling and the bounded LRU result cache, independent of the transport."""
+
+    def __init__(self, cache_size=CACHE_SIZE):
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._calendars = {}
+
+    def _calendar(self, region, pattern):
+        key = (region, pattern)
+        cal = self._calendars.get(key)
+        if cal is None:
+            if pattern is not None and pattern not in WORK_PATTERNS:
+                raise ValueError(f"unknown pattern {pattern!r}")
+            work_pattern = WORK_PATTERNS[pattern][1] if pattern is not None else None
+            if region is None:
+                cal = BusinessCalendar(pattern=work_pattern)
+            else:
+                from holiday_rules import REGIONS, region_calendar
+                if region not in REGIONS:
+                    raise ValueError(f"unknown region {region!r}")
+                cal = region_calendar(region).with_pattern(work_pattern)
+            self._calendars[key] = cal
+        return cal
+
+    def compute(self, item, region=None, pattern=None):
+        """Result value for one add/between item (a dict of request fields)."""
+        region = item.get("region", region)
+        pattern = item.get("pattern", pattern)
+        # Key on validated, normalized inputs: JSON true and 1.0 both equal 1
+        if "days" in item:
+            start, iso = _date_arg(item.get("start"))
+            days = item["days"]
+            if isinstance(days, str):
+                days = int(days)
+            if not isinstance(days, int) or isinstance(days, bool):
+                raise ValueError(f"days must be an integer, got {days!r}")
+            key = ("add", start, iso, days, region, pattern)
+        else:
+            key = ("between", _date_arg(item.get("a"))[0], _date_arg(item.get("b"))[0], region, pattern)
+        try:
+            value = self._cache[key]
+        except (KeyError, TypeError):  # TypeError: unhashable region/pattern, reported below
+            pass
+        else:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        cal = self._calendar(region, pattern)
+        if key[0] == "add":
+            result = cal.add_working_days(start, days)
+            value = result.isoformat() if iso else format_date(result)
+        else:
+            value = cal.working_days_between(key[1], key[2])
+        self._cache[key] = value
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return value
+
+    def dispatch(self, method, target, body):
+        """(status, JSON-able object) for one HTTP request."""
+        url = urlsplit(target)
+        path = url.path.rstrip("/") or "/"
+        if path == "/health":
+            return 200, {"status": "ok", "cache_entries": len(self._cache),
+                         "cache_hits": self.hits, "cache_misses": self.misses}
+        if path not in ("/add", "/between", "/batch"):
+            raise RequestError(404, f"no such endpoint {path!r}")
+        if method == "GET" and path != "/batch":
+            payload = dict(parse_qsl(url.query))
+        elif method == "POST":
+            try:
+                payload = json.loads(body)
+            except ValueError as exc:
+                raise RequestError(400, f"invalid JSON: {exc}") from None
+            if not isinstance(payload, dict):
+                raise RequestError(400, "request body must be a JSON object")
+        else:
+            raise RequestError(405, f"{method} not allowed on {path}")
+
+        if path == "/batch":
+            items = payload.get("requests")
+            if not isinstance(items, list):
+                raise RequestError(400, '"requests" must be a list')
+            if len(items) > MAX_BATCH:
+                raise RequestError(413, f"at most {MAX_BATCH} requests per batch")
+            region, pattern = payload.get("region"), payload.get("pattern")
+            results = []
+            for item in items:
+                try:
+                    if not isinstance(item, dict):
+                        raise ValueError("each request must be a JSON object")
+                    results.append({"result": self.compute(item, region, pattern)})
+                except (ValueError, TypeError, OverflowError) as exc:
+                    results.append({"error": str(exc)})
+            return 200, {"results": results}
+
+        if (path == "/add") != ("days" in payload):
+            raise RequestError(400, "/add takes start and days; /between takes a and b")
+        try:
+            return 200, {"result": self.compute(payload)}
+        except (ValueError, TypeError, OverflowError) as exc:
+            raise RequestError(400, str(exc)) from None
+
+
+def _response(status, obj, keep_alive):
+    body = json.dumps(obj).encode()
+    head = (f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n")
+    if not keep_alive:
+        head += "Connection: close\r\n"
+    return (head + "\r\n").encode("latin-1") + body
+
+
+async def _read_request(reader):
+    """(method, target, headers, body) or None at a clean end of stream."""
+    try:
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEPALIVE_TIMEOUT)
+    except asyncio.IncompleteReadError as exc:
+        if exc.partial.strip():
+            raise RequestError(400, "truncated request") from None
+        return None
+    except asyncio.LimitOverrunError:
+        raise RequestError(431, "request head too large") from None
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ")
+    except ValueError:
+        raise RequestError(400, "malformed request line") from None
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    headers[":version"] = version
+    if "transfer-encoding" in headers:
+        raise RequestError(411, "chunked request bodies are not supported; send Content-Length")
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise RequestError(400, "bad Content-Length") from None
+    if length < 0:
+        raise RequestError(400, "bad Content-Length")
+    if length > MAX_BODY:
+        raise RequestError(413, f"body larger than {MAX_BODY} bytes")
+    body = await reader.readexactly(length) if length else b""
+    return method, target, headers, body
+
+
+def _wants_keep_alive(headers):
+    connection = headers.get("connection", "").lower()
+    if headers[":version"] == "HTTP/1.0":
+        return connection == "keep-alive"
+    return connection != "close"
+
+
+class WorkdayServer:
+    """asyncio transport for a WorkdayService."""
+
+    def __init__(self, service=None):
+        self.service = service or WorkdayService()
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except RequestError as exc:
+                    writer.write(_response(exc.status, {"error": str(exc)}, False))
+                    break
+                if request is None:
+                    break
+                method, target, headers, body = request
+                keep_alive = _wants_keep_alive(headers)
+                try:
+                    status, obj = self.service.dispatch(method, target, body)
+                except RequestError as exc:
+                    status, obj = exc.status, {"error": str(exc)}
+                writer.write(_response(status, obj, keep_alive))
+                if not keep_alive:
+                    break
+                # Pipelined requests already buffered are answered before waiting on the socket
+                await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        return await asyncio.start_server(self.handle, host, port)
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, cache_size=CACHE_SIZE):
+    server = await WorkdayServer(WorkdayService(cache_size)).start(host, port)
+    addresses = ", ".join(f"{s.getsockname()[0]}:{s.getsockname()[1]}" for s in server.sockets)
+    print(f"serving working-day API on {addresses}", file=sys.stderr, flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON API for working-day calculations.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"bind address (default {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port (default {DEFAULT_PORT})")
+    parser.add_argument("--cache-size", type=int, default=CACHE_SIZE,
+                        help=f"results kept in the LRU cache (default {CACHE_SIZE})")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.cache_size))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())